@@ -0,0 +1,791 @@
+#!/usr/bin/env python3
+"""
+Benchmark script for the Math Calculation Engine.
+Measures dispatch overhead and formula performance.
+
+Usage:
+    python benchmark.py                # Run all benchmarks
+    python benchmark.py dispatch       # Run only the named benchmarks
+"""
+
+import array
+import bisect
+import functools
+import math
+import os
+import random
+import sys
+import tempfile
+import time
+import timeit
+import tracemalloc
+from collections import Counter
+sys.path.append('.')
+
+from core import (
+    calculate, calculate_many, bind, bind_positional, Operation, OPERATION_MAP,
+    enable_cache, disable_cache, enable_parallel, disable_parallel, RunningStats, RunningCovariance,
+    TDigest, MisraGries, CountMinSketch, Float64Source, Histogram
+)
+from core.cache import UNCACHED_OPERATIONS
+from core.formulas import vectorized, factorization, rolling, scaling
+from core.formulas.factorization import factorize, factorize_many
+from core.formulas import statistics
+from core.formulas.statistics import variance_population
+from core.formulas.arithmetic import (
+    power, modulo, power_mod, isqrt, integer_nth_root, factorial, combination, combination_mod,
+    pascal_row, greatest_common_divisor, gcd_many, batch_gcd, is_prime, is_prime_many
+)
+
+# Names of the regression checks that failed, reported by main()
+FAILED_CHECKS = []
+
+
+def time_per_call(func, number):
+    """Return the best per-call time in nanoseconds over a few repeats."""
+    return min(timeit.repeat(func, number=number, repeat=5)) / number * 1e9
+
+
+def print_row(label, nanoseconds, baseline=None):
+    """Print one aligned benchmark row, optionally relative to a baseline."""
+    if baseline:
+        print(f"   {label:<28} {nanoseconds:>10.1f} ns   ({nanoseconds / baseline:.2f}x)")
+    else:
+        print(f"   {label:<28} {nanoseconds:>10.1f} ns")
+
+
+def bench_dispatch():
+    """Compare per-call overhead of calculate(), bind() and bind_positional()."""
+    print("\n⚡ DISPATCH OVERHEAD (per call)")
+    print("-" * 60)
+
+    cases = [
+        (Operation.ADD, {"a": 2, "b": 3}),
+        (Operation.AREA_CIRCLE, {"radius": 2.5}),
+        (Operation.DISTANCE_3D, {"x1": 0, "y1": 0, "z1": 0, "x2": 1, "y2": 2, "z2": 3}),
+    ]
+    number = 200000
+
+    for operation, kwargs in cases:
+        func = OPERATION_MAP[operation]["func"]
+        args = tuple(kwargs[name] for name in OPERATION_MAP[operation]["required"])
+        bound = bind(operation)
+        bound_positional = bind_positional(operation)
+
+        print(f"\n🔹 {operation.name}")
+        raw = time_per_call(lambda: func(**kwargs), number)
+        print_row("formula function (raw)", raw)
+        print_row("calculate()", time_per_call(lambda: calculate(operation=operation, **kwargs), number), raw)
+        print_row("bind()", time_per_call(lambda: bound(**kwargs), number), raw)
+        print_row("bind_positional()", time_per_call(lambda: bound_positional(*args), number), raw)
+
+
+def bench_batch():
+    """Compare a calculate() loop against calculate_many() over whole columns."""
+    print("\n📦 BATCH EVALUATION (per row)")
+    print("-" * 60)
+
+    size = 100000
+    radii = [i * 0.001 for i in range(size)]
+    cases = [
+        (Operation.AREA_CIRCLE, {"radius": radii}),
+        (Operation.DIVIDE, {"a": radii, "b": [r + 1 for r in radii]}),
+        (Operation.LOG_CUSTOM_BASE, {"x": [r + 1 for r in radii], "base": 10}),
+    ]
+
+    for operation, columns in cases:
+        expanded = [value if isinstance(value, list) else [value] * size for value in columns.values()]
+        rows = [dict(zip(columns, values)) for values in zip(*expanded)]
+
+        print(f"\n🔹 {operation.name} ({size} rows)")
+        baseline = time_per_call(lambda: [calculate(operation=operation, **row) for row in rows], 1) / size
+        print_row("calculate() loop", baseline)
+        print_row("calculate_many()", time_per_call(
+            lambda: calculate_many(operation=operation, **columns), 1) / size, baseline)
+
+
+def bench_vectorized():
+    """Compare the scalar formulas against the NumPy kernels at increasing sizes."""
+    print("\n🚀 VECTORIZED BACKEND (per element)")
+    print("-" * 60)
+
+    if not vectorized.HAS_NUMPY:
+        print("   NumPy is not installed - skipping")
+        return
+    np = vectorized.np
+
+    operations = [Operation.AREA_CIRCLE, Operation.SIN_DEGREES, Operation.ATANH, Operation.NATURAL_LOG]
+    for size in (10 ** 3, 10 ** 5, 10 ** 7):
+        values = np.linspace(0.001, 0.999, size)
+        as_list = values.tolist()
+        print(f"\n🔹 {size} elements")
+        for operation in operations:
+            func = OPERATION_MAP[operation]["func"]
+            kernel = vectorized.get_kernel(func)
+            number = max(1, 10 ** 5 // size)
+            baseline = time_per_call(lambda: list(map(func, as_list)), number) / size
+            print_row(f"{operation.name} scalar", baseline)
+            print_row(f"{operation.name} vectorized", time_per_call(lambda: kernel(values), number) / size, baseline)
+
+
+def bench_cache():
+    """
+    Compare uncached calculate() calls against cache hits.
+    
+    An operation cached by default whose hits are slower than recomputing it
+    belongs in UNCACHED_OPERATIONS, and is reported as a failed check.
+    """
+    print("\n🗃️  RESULT CACHE (per call)")
+    print("-" * 60)
+
+    cases = [
+        (Operation.COMBINATION, {"n": 500, "r": 200}),
+        (Operation.FACTORIAL, {"n": 2000}),
+        (Operation.IS_PRIME, {"n": 1000003}),
+        (Operation.LOG_CUSTOM_BASE, {"x": 1234.5, "base": 3}),
+        (Operation.MEDIAN, {"values": [(i * 7919) % 10007 / 3 for i in range(10000)]}),
+    ]
+    for operation, kwargs in cases:
+        print(f"\n🔹 {operation.name}")
+        baseline = time_per_call(lambda: calculate(operation=operation, **kwargs), 1000)
+        print_row("uncached", baseline)
+        enable_cache(exclude=())
+        try:
+            hit = time_per_call(lambda: calculate(operation=operation, **kwargs), 1000)
+        finally:
+            disable_cache()
+        print_row("cache hit", hit, baseline)
+        if hit > baseline and operation not in UNCACHED_OPERATIONS:
+            print(f"   ⚠️  {operation.name} is cached by default but hits are slower than recomputing")
+            FAILED_CHECKS.append(f"cache: {operation.name}")
+
+
+def time_once(func):
+    """Return the wall time of a single call in seconds."""
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def bench_factorial():
+    """Compare the factorial engine against a one-at-a-time product loop."""
+    print("\n❗ FACTORIAL (per call)")
+    print("-" * 60)
+
+    def multiply_loop(n):
+        result = 1
+        for i in range(2, n + 1):
+            result *= i
+        return result
+
+    for n in (10, 100, 10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6):
+        # Small n are timed over many calls, large n once
+        if n <= 10 ** 3:
+            measure = lambda func: time_per_call(func, 1000)
+        else:
+            measure = lambda func: time_once(func) * 1e9
+
+        print(f"\n🔹 n = {n}")
+        baseline = None
+        if n <= 10 ** 5:
+            baseline = measure(lambda: multiply_loop(n))
+            print_row("product loop", baseline)
+        else:
+            print("   product loop                   (skipped, takes minutes)")
+        print_row("math.factorial", measure(lambda: math.factorial(n)), baseline)
+        print_row("factorial", measure(lambda: factorial(n)), baseline)
+
+
+def bench_primality():
+    """Time IS_PRIME on random odd 32-, 64- and 256-bit candidates."""
+    print("\n🔢 PRIMALITY (per candidate)")
+    print("-" * 60)
+
+    def trial_division(n):
+        if n < 2 or n % 2 == 0:
+            return n == 2
+        for i in range(3, int(math.sqrt(n)) + 1, 2):
+            if n % i == 0:
+                return False
+        return True
+
+    rng = random.Random(42)
+    for bits in (32, 64, 256):
+        candidates = [rng.getrandbits(bits) | (1 << (bits - 1)) | 1 for _ in range(1000)]
+        # Primes are the slow case: every Miller-Rabin round runs to the end
+        primes = [n for n in candidates if is_prime(n)][:50]
+
+        print(f"\n🔹 {bits}-bit ({len(primes)} primes among {len(candidates)} candidates)")
+        baseline = None
+        if bits == 32:
+            baseline = time_per_call(lambda: [trial_division(n) for n in primes], 1) / len(primes)
+            print_row("trial division (primes)", baseline)
+        print_row("is_prime (primes)", time_per_call(lambda: [is_prime(n) for n in primes], 1) / len(primes), baseline)
+        print_row("is_prime (random odd)", time_per_call(
+            lambda: [is_prime(n) for n in candidates], 1) / len(candidates))
+        print_row("is_prime_many (random odd)", time_per_call(
+            lambda: is_prime_many(candidates), 1) / len(candidates))
+
+
+def bench_combinatorics():
+    """Compare exact and modular C(n, r) against the multiply-divide loop."""
+    print("\n🎲 COMBINATORICS (per call)")
+    print("-" * 60)
+
+    def multiply_divide_loop(n, r):
+        result = 1
+        for i in range(r):
+            result = result * (n - i) // (i + 1)
+        return result
+
+    for n, r in ((10 ** 4, 5 * 10 ** 3), (10 ** 5, 5 * 10 ** 4), (10 ** 6, 10 ** 3), (10 ** 6, 5 * 10 ** 5)):
+        print(f"\n🔹 C({n}, {r})")
+        baseline = None
+        if r <= 5 * 10 ** 4:
+            baseline = time_once(lambda: multiply_divide_loop(n, r)) * 1e9
+            print_row("multiply-divide loop", baseline)
+        else:
+            print("   multiply-divide loop           (skipped, takes minutes)")
+        print_row("combination", time_once(lambda: combination(n, r)) * 1e9, baseline)
+        # The first modular call builds the factorial tables for p; later calls only look them up
+        print_row("combination_mod cold, 1e9+7", time_once(
+            lambda: combination_mod(n, r, 1000000007)) * 1e9, baseline)
+        print_row("combination_mod warm, 1e9+7", time_per_call(
+            lambda: combination_mod(n, r, 1000000007), 100), baseline)
+
+    print("\n🔹 C(10**18, 10**9) mod 1000003 (Lucas)")
+    print_row("combination_mod", time_per_call(lambda: combination_mod(10 ** 18, 10 ** 9, 1000003), 1000))
+
+    print("\n🔹 row n = 2000")
+    baseline = time_once(lambda: [combination(2000, k) for k in range(2001)]) * 1e9
+    print_row("combination per k", baseline)
+    print_row("pascal_row", time_once(lambda: pascal_row(2000)) * 1e9, baseline)
+
+
+def bench_gcd():
+    """Compare GCD_MANY and batch GCD against folding and pairing the two-argument GCD."""
+    print("\n🔗 GCD (per list)")
+    print("-" * 60)
+
+    rng = random.Random(7)
+    numbers = [rng.getrandbits(256) * 6 for _ in range(10000)]
+    print("\n🔹 gcd of 10000 256-bit integers")
+    baseline = time_per_call(lambda: functools.reduce(greatest_common_divisor, numbers), 1)
+    print_row("folded greatest_common_divisor", baseline)
+    print_row("gcd_many", time_per_call(lambda: gcd_many(numbers), 1), baseline)
+
+    def random_prime(bits):
+        while True:
+            candidate = rng.getrandbits(bits) | (1 << (bits - 1)) | 1
+            if is_prime(candidate):
+                return candidate
+
+    primes = [random_prime(256) for _ in range(4100)]
+    for count in (100, 500, 2000):
+        # 512-bit moduli, two of which share a prime factor
+        moduli = [primes[2 * i] * primes[2 * i + 1] for i in range(count)]
+        moduli[-1] = primes[0] * primes[-1]
+
+        def pairwise():
+            return [functools.reduce(lambda acc, m: acc if acc > 1 else greatest_common_divisor(n, m),
+                                     moduli[:i] + moduli[i + 1:], 1) for i, n in enumerate(moduli)]
+
+        print(f"\n🔹 {count} moduli of 512 bits")
+        baseline = None
+        if count <= 500:
+            baseline = time_once(pairwise) * 1e9
+            print_row("pairwise gcd", baseline)
+        else:
+            print("   pairwise gcd                   (skipped, quadratic)")
+        print_row("batch_gcd", time_once(lambda: batch_gcd(moduli)) * 1e9, baseline)
+
+
+def bench_roots():
+    """Time POWER_MOD and the exact integer roots on 1k- to 1M-bit operands."""
+    print("\n🌱 POWERS AND ROOTS (per call)")
+    print("-" * 60)
+
+    def newton_isqrt(n):
+        # Plain integer Newton from a power of two, every step at full precision
+        x = 1 << ((n.bit_length() + 1) // 2)
+        while True:
+            y = (x + n // x) // 2
+            if y >= x:
+                return x
+            x = y
+
+    rng = random.Random(11)
+    modulus = rng.getrandbits(1024) | 1
+    for bits in (10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6):
+        n = rng.getrandbits(bits) | (1 << (bits - 1))
+        measure = (lambda func: time_per_call(func, 10)) if bits <= 10 ** 4 else (lambda func: time_once(func) * 1e9)
+
+        print(f"\n🔹 {bits}-bit operands")
+        baseline = None
+        if bits <= 10 ** 5:
+            baseline = measure(lambda: newton_isqrt(n))
+            print_row("full-precision Newton", baseline)
+        if hasattr(math, "isqrt"):
+            print_row("math.isqrt", measure(lambda: math.isqrt(n)), baseline)
+        print_row("isqrt", measure(lambda: isqrt(n)), baseline)
+        print_row("integer_nth_root (n = 3)", measure(lambda: integer_nth_root(n, 3)))
+        print_row("integer_nth_root (n = 101)", measure(lambda: integer_nth_root(n, 101)))
+
+        # 2 ** exponent for a bits-bit exponent only fits in memory for the smallest size
+        exponent = n if bits > 10 ** 3 else bits * 1000
+        baseline = None
+        if bits == 10 ** 3:
+            baseline = measure(lambda: modulo(power(2, exponent), modulus))
+            print_row("power then modulo", baseline)
+        if bits <= 10 ** 5:
+            print_row("power_mod (1024-bit modulus)", measure(lambda: power_mod(2, exponent, modulus)), baseline)
+        else:
+            print("   power_mod (1024-bit modulus)   (skipped, one squaring per exponent bit)")
+
+
+def bench_factorize():
+    """Compare FACTORIZE against trial division, and batch against one-by-one factoring."""
+    print("\n🧩 FACTORIZATION (per integer)")
+    print("-" * 60)
+
+    def trial_division(n):
+        factors, d = [], 2
+        while d * d <= n:
+            while n % d == 0:
+                factors.append(d)
+                n //= d
+            d += 1
+        return factors + [n] if n > 1 else factors
+
+    rng = random.Random(13)
+
+    def random_prime(bits):
+        while True:
+            candidate = rng.getrandbits(bits) | (1 << (bits - 1)) | 1
+            if is_prime(candidate):
+                return candidate
+
+    cases = [
+        ("random 40-bit", [rng.getrandbits(40) for _ in range(50)]),
+        ("40-bit semiprimes", [random_prime(20) * random_prime(20) for _ in range(50)]),
+        ("64-bit semiprimes", [random_prime(32) * random_prime(32) for _ in range(20)]),
+    ]
+    for label, numbers in cases:
+        print(f"\n🔹 {label}")
+        baseline = None
+        if numbers[0].bit_length() <= 40:
+            baseline = time_once(lambda: [trial_division(n) for n in numbers]) * 1e9 / len(numbers)
+            print_row("trial division", baseline)
+        factorization._factor_cofactor.cache_clear()
+        print_row("factorize (cold cache)", time_once(
+            lambda: [factorize(n) for n in numbers]) * 1e9 / len(numbers), baseline)
+        print_row("factorize (warm cache)", time_once(
+            lambda: [factorize(n) for n in numbers]) * 1e9 / len(numbers), baseline)
+
+    # 64-bit moduli drawn from a small pool of 32-bit primes share factors
+    pool = [random_prime(32) for _ in range(10)]
+    moduli = [rng.choice(pool) * rng.choice(pool) for _ in range(200)]
+    print("\n🔹 200 64-bit moduli over 10 shared primes")
+    factorization._factor_cofactor.cache_clear()
+    baseline = time_once(lambda: [factorize(n) for n in moduli]) * 1e9 / len(moduli)
+    print_row("factorize one by one", baseline)
+    factorization._factor_cofactor.cache_clear()
+    print_row("factorize_many", time_once(lambda: factorize_many(moduli)) * 1e9 / len(moduli), baseline)
+
+
+def bench_running():
+    """Compare RunningStats against the two-pass list variance."""
+    print("\n🌊 RUNNING STATISTICS (per value)")
+    print("-" * 60)
+
+    rng = random.Random(17)
+    values = [rng.gauss(0, 1) for _ in range(10 ** 6)]
+    count = len(values)
+
+    def one_at_a_time():
+        stats = RunningStats()
+        for value in values:
+            stats.update(value)
+        return stats
+
+    def merged_shards():
+        shards = [RunningStats(values[start:start + count // 8]) for start in range(0, count, count // 8)]
+        return RunningStats.merged(shards)
+
+    print(f"\n🔹 {count} values")
+    baseline = time_once(lambda: variance_population(values)) * 1e9 / count
+    print_row("variance_population (list)", baseline)
+    print_row("RunningStats.update per value", time_once(one_at_a_time) * 1e9 / count, baseline)
+    print_row("RunningStats(list)", time_once(lambda: RunningStats(values)) * 1e9 / count, baseline)
+    print_row("RunningStats(generator)", time_once(
+        lambda: RunningStats(value for value in values)) * 1e9 / count, baseline)
+    print_row("8 shards + merge", time_once(merged_shards) * 1e9 / count, baseline)
+    if vectorized.HAS_NUMPY:
+        array = vectorized.np.asarray(values)
+        print_row("RunningStats(ndarray)", time_once(lambda: RunningStats(array)) * 1e9 / count, baseline)
+
+
+def bench_describe():
+    """Compare DESCRIBE and PERCENTILES against one order-statistic call each."""
+    print("\n📋 DESCRIBE (per list)")
+    print("-" * 60)
+
+    rng = random.Random(19)
+    for count in (100, 10 ** 4, 10 ** 6):
+        values = [rng.random() for _ in range(count)]
+        number = max(1, 10 ** 5 // count)
+
+        def one_call_each():
+            return (min(values), max(values), statistics.median(values), statistics.quartile_1(values),
+                    statistics.quartile_3(values), statistics.interquartile_range(values),
+                    statistics.percentile(values, 90), statistics.percentile(values, 99))
+
+        print(f"\n🔹 {count} values")
+        baseline = time_per_call(one_call_each, number)
+        print_row("8 separate calls", baseline)
+        print_row("describe", time_per_call(lambda: statistics.describe(values), number), baseline)
+        print_row("percentiles (6 ranks)", time_per_call(
+            lambda: statistics.percentiles(values, [10, 25, 50, 75, 90, 99]), number), baseline)
+
+
+def bench_selection():
+    """Find the crossover between full sorting and selection for MEDIAN and PERCENTILE."""
+    print("\n🎯 SELECTION (per call)")
+    print("-" * 60)
+
+    rng = random.Random(23)
+    threshold = statistics.SELECTION_THRESHOLD
+    try:
+        for count in (10 ** 3, 3 * 10 ** 3, 10 ** 4, 3 * 10 ** 4, 10 ** 5, 10 ** 6):
+            values = [rng.random() for _ in range(count)]
+            number = max(1, 10 ** 5 // count)
+
+            print(f"\n🔹 {count} values")
+            statistics.SELECTION_THRESHOLD = float("inf")
+            baseline = time_per_call(lambda: statistics.median(values), number)
+            print_row("median, sorted()", baseline)
+            print_row("percentile 99, sorted()", time_per_call(
+                lambda: statistics.percentile(values, 99), number))
+            statistics.SELECTION_THRESHOLD = 0
+            print_row("median, selection", time_per_call(lambda: statistics.median(values), number), baseline)
+            print_row("percentile 99, selection", time_per_call(
+                lambda: statistics.percentile(values, 99), number))
+    finally:
+        statistics.SELECTION_THRESHOLD = threshold
+    print(f"\n   Selection is used from SELECTION_THRESHOLD = {threshold} values on")
+
+
+def bench_sketch():
+    """Time TDigest updates and measure its percentile error against an exact sort."""
+    print("\n📐 QUANTILE SKETCH (per value)")
+    print("-" * 60)
+
+    rng = random.Random(29)
+    count = 10 ** 6
+    latencies = [rng.lognormvariate(3, 1) for _ in range(count)]
+    ordered = sorted(latencies)
+    ranks = (50, 95, 99, 99.9)
+
+    print(f"\n🔹 {count} log-normal latencies")
+    baseline = time_once(lambda: statistics.percentiles(latencies, ranks)) * 1e9 / count
+    print_row("sort + percentiles", baseline)
+    for compression in (50, 100, 300):
+        sketch = TDigest(compression)
+        print_row(f"TDigest({compression}).extend", time_once(lambda: sketch.extend(latencies)) * 1e9 / count,
+                  baseline)
+        errors = []
+        for rank in ranks:
+            estimate = statistics.percentile(sketch, rank)
+            # Error in rank space: how far the estimate's true position is from the target
+            position = bisect.bisect_left(ordered, estimate) / (count - 1) * 100
+            errors.append(f"p{rank:g} {abs(position - rank):.3f}")
+        print(f"   {len(sketch.to_bytes())} bytes, rank error in percentage points: {', '.join(errors)}")
+
+
+def bench_frequency():
+    """Time MODE and the heavy-hitter sketches over a skewed stream."""
+    print("\n📊 FREQUENCY SKETCHES (per value)")
+    print("-" * 60)
+
+    rng = random.Random(31)
+    count = 10 ** 6
+    values = [int(rng.paretovariate(1.2)) for _ in range(count)]
+    exact = dict(Counter(values).most_common(10))
+
+    print(f"\n🔹 {count} Pareto-distributed integers, top 10")
+    baseline = time_once(lambda: Counter(values).most_common(10)) * 1e9 / count
+    print_row("Counter.most_common", baseline)
+    print_row("mode", time_once(lambda: statistics.mode(values)) * 1e9 / count, baseline)
+    for label, make in (("MisraGries(100)", lambda: MisraGries(100)),
+                        ("CountMinSketch(2048, 5)", lambda: CountMinSketch(2048, 5))):
+        sketch = make()
+        print_row(f"{label}.extend", time_once(lambda: sketch.extend(values)) * 1e9 / count, baseline)
+        hits = [(value, estimate) for value, estimate in sketch.top(10) if value in exact]
+        worst = max(abs(estimate - exact[value]) for value, estimate in hits)
+        print(f"   {len(hits)}/10 of the exact top 10 found, worst count error {worst}")
+
+
+def bench_rolling():
+    """Compare rolling-window operations with recomputing every window."""
+    print("\n🪟 ROLLING WINDOWS (per value)")
+    print("-" * 60)
+
+    rng = random.Random(37)
+    count = 10 ** 5
+    values = [rng.gauss(0, 1) for _ in range(count)]
+    cases = (
+        ("mean", statistics.mean, rolling.rolling_mean),
+        ("sample variance", statistics.variance_sample, rolling.rolling_variance_sample),
+        ("median", statistics.median, rolling.rolling_median),
+        ("max", max, rolling.rolling_max),
+    )
+
+    for window in (10, 100, 1000):
+        # Recomputing is timed on a slice of the windows and scaled to one value
+        sample = min(count - window + 1, 10 ** 6 // window)
+        print(f"\n🔹 {count} values, window {window}")
+        for label, single, moving in cases:
+            baseline = time_once(lambda: [single(values[i:i + window]) for i in range(sample)]) * 1e9 / sample
+            print_row(f"{label}: every window", baseline)
+            print_row(f"{label}: rolling", time_once(lambda: moving(values, window)) * 1e9 / count, baseline)
+
+
+def bench_covariance():
+    """Compare the correlation matrix with one CORRELATION_COEFFICIENT call per pair."""
+    print("\n🧩 CORRELATION MATRIX (per matrix)")
+    print("-" * 60)
+
+    rng = random.Random(41)
+    length = 500
+    for count in (10, 50, 100):
+        series = [[rng.gauss(0, 1) for _ in range(length)] for _ in range(count)]
+        pairwise = lambda: [[statistics.correlation_coefficient(x, y) for y in series] for x in series]
+        print(f"\n🔹 {count} series of {length} values")
+        baseline = time_once(pairwise) * 1e9
+        print_row("correlation_coefficient per pair", baseline)
+        print_row("correlation_matrix", time_once(lambda: statistics.correlation_matrix(series)) * 1e9, baseline)
+        rows = list(zip(*series))
+        print_row("RunningCovariance over rows", time_once(lambda: RunningCovariance(rows)) * 1e9, baseline)
+
+
+def bench_sources():
+    """Reduce a 1 GB file of doubles through a memory-mapped Float64Source."""
+    print("\n💾 OUT-OF-CORE SOURCES (per value)")
+    print("-" * 60)
+
+    size = 1 << 30
+    count = size // 8
+    rng = random.Random(43)
+    block = array.array("d", (rng.gauss(0, 1) for _ in range(1 << 20)))
+    handle, path = tempfile.mkstemp(suffix=".f64")
+    try:
+        with os.fdopen(handle, "wb") as output:
+            for _ in range(count // len(block)):
+                block.tofile(output)
+
+        # Loading into a list is measured on 1/16 of the file and scaled per value;
+        # the loaded values are freed when load_and_reduce() returns
+        part = count // 16
+
+        def load_and_reduce(data):
+            loaded = array.array("d")
+            elapsed = time_once(lambda: loaded.fromfile(data, part))
+            return elapsed + time_once(lambda: statistics.variance_sample(loaded.tolist()))
+
+        print(f"\n🔹 {size >> 20} MB file, {count} doubles")
+        with open(path, "rb") as data:
+            baseline = load_and_reduce(data) * 1e9 / part
+        print_row("read 1/16 into a list + VARIANCE_SAMPLE", baseline)
+        with Float64Source(path) as source:
+            print_row("Float64Source + VARIANCE_SAMPLE",
+                      time_once(lambda: statistics.variance_sample(source)) * 1e9 / count, baseline)
+
+        # Tracing every allocation is slow, so memory is traced over the last 1/16 only;
+        # the peak is one chunk whatever the length
+        with Float64Source(path, offset=(count - part) * 8) as source:
+            tracemalloc.start()
+            statistics.variance_sample(source)
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+        print(f"   peak Python memory over 1/16 of the file: {peak / 2 ** 20:.1f} MB "
+              f"(as a list: {part * 32 / 2 ** 20:.0f} MB, the whole file {count * 32 / 2 ** 30:.0f} GB)")
+    finally:
+        os.remove(path)
+
+
+def bench_parallel():
+    """Scale VARIANCE_SAMPLE and CORRELATION_MATRIX across 1 to 16 worker processes."""
+    print("\n🧵 PARALLEL MAP-REDUCE (per call)")
+    print("-" * 60)
+
+    rng = random.Random(47)
+    count = 1 << 22
+    values = [rng.gauss(0, 1) for _ in range(count)]
+    series = [values[i::8] for i in range(8)]
+    print(f"\n🔹 VARIANCE_SAMPLE of {count} values, CORRELATION_MATRIX of 8 x {count // 8} ({os.cpu_count()} CPUs)")
+    disable_parallel()
+    variance = time_once(lambda: calculate(operation=Operation.VARIANCE_SAMPLE, values=values)) * 1e9
+    matrix = time_once(lambda: calculate(operation=Operation.CORRELATION_MATRIX, series=series)) * 1e9
+    print_row("variance, single process", variance)
+    print_row("matrix, single process", matrix)
+    for workers in (1, 2, 4, 8, 16):
+        enable_parallel(workers=workers)
+        calculate(operation=Operation.MEAN, values=values)  # start the workers
+        print_row(f"variance, {workers} workers",
+                  time_once(lambda: calculate(operation=Operation.VARIANCE_SAMPLE, values=values)) * 1e9, variance)
+        print_row(f"matrix, {workers} workers",
+                  time_once(lambda: calculate(operation=Operation.CORRELATION_MATRIX, series=series)) * 1e9, matrix)
+    disable_parallel()
+
+
+def bench_grouped():
+    """Compare GROUPED_* with partitioning the values by key and calling the statistic per group."""
+    print("\n📂 GROUPED STATISTICS (per value)")
+    print("-" * 60)
+
+    rng = random.Random(53)
+    count = 10 ** 6
+    cases = [
+        (Operation.GROUPED_MEAN, Operation.MEAN),
+        (Operation.GROUPED_VARIANCE_SAMPLE, Operation.VARIANCE_SAMPLE),
+        (Operation.GROUPED_STANDARD_DEVIATION_SAMPLE, Operation.STANDARD_DEVIATION_SAMPLE),
+        (Operation.GROUPED_MEDIAN, Operation.MEDIAN),
+    ]
+    for group_count in (10, 1000, 50000):
+        keys = [rng.randrange(group_count) for _ in range(count)]
+        values = [rng.random() for _ in range(count)]
+
+        def partition_then_call(operation):
+            groups = {}
+            for key, value in zip(keys, values):
+                groups.setdefault(key, []).append(value)
+            return {key: calculate(operation=operation, values=group) for key, group in groups.items()}
+
+        print(f"\n🔹 {count} values in {group_count} groups")
+        for grouped, single in cases:
+            baseline = time_once(lambda: partition_then_call(single)) * 1e9 / count
+            print_row("partition + per-group call", baseline)
+            print_row(grouped.name,
+                      time_once(lambda: calculate(operation=grouped, keys=keys, values=values)) * 1e9 / count,
+                      baseline)
+
+
+def bench_histogram():
+    """Compare HISTOGRAM with sorting the values and counting each bin by bisection."""
+    print("\n📊 HISTOGRAM (per value)")
+    print("-" * 60)
+
+    rng = random.Random(59)
+    count = 10 ** 6
+    values = [rng.gauss(0, 1) for _ in range(count)]
+    weights = [rng.random() for _ in range(count)]
+    for bins in (10, 100):
+        edges = [-4 + 8 * i / bins for i in range(bins + 1)]
+
+        def sort_and_count():
+            ordered = sorted(values)
+            positions = [bisect.bisect_left(ordered, edge) for edge in edges]
+            return [stop - start for start, stop in zip(positions, positions[1:])]
+
+        print(f"\n🔹 {count} values, {bins} bins")
+        baseline = time_once(sort_and_count) * 1e9 / count
+        print_row("sort + bisect per edge", baseline)
+        print_row("HISTOGRAM (bin count)", time_once(
+            lambda: calculate(operation=Operation.HISTOGRAM, values=values, bins=bins)) * 1e9 / count, baseline)
+        print_row("HISTOGRAM (custom edges)", time_once(
+            lambda: calculate(operation=Operation.HISTOGRAM, values=values, bins=edges)) * 1e9 / count, baseline)
+        print_row("WEIGHTED_HISTOGRAM", time_once(
+            lambda: calculate(operation=Operation.WEIGHTED_HISTOGRAM, values=values, weights=weights,
+                              bins=edges)) * 1e9 / count, baseline)
+        if vectorized.HAS_NUMPY:
+            array = vectorized.np.asarray(values)
+            print_row("Histogram.fixed(ndarray)", time_once(
+                lambda: Histogram.fixed(-4, 4, bins, array)) * 1e9 / count, baseline)
+
+    histogram = Histogram.fixed(-4, 4, 1000, values)
+    exact = calculate(operation=Operation.PERCENTILE, values=values, percentile_rank=99)
+    print(f"\n🔹 p99 of {count} values, 1000 bins (per call)")
+    baseline = time_once(lambda: calculate(operation=Operation.PERCENTILE, values=values, percentile_rank=99)) * 1e9
+    print_row("PERCENTILE (list)", baseline)
+    print_row("PERCENTILE (Histogram)", time_once(
+        lambda: calculate(operation=Operation.PERCENTILE, values=histogram, percentile_rank=99)) * 1e9, baseline)
+    estimate = calculate(operation=Operation.PERCENTILE, values=histogram, percentile_rank=99)
+    print(f"   error of the histogram estimate: {abs(estimate - exact):.2g}")
+
+
+def bench_scaling():
+    """Compare STANDARDIZE with MEAN, STANDARD_DEVIATION_POPULATION and one Z_SCORE call per value."""
+    print("\n📏 SCALING (per value)")
+    print("-" * 60)
+
+    rng = random.Random(61)
+    count = 10 ** 6
+    values = [rng.gauss(50, 10) for _ in range(count)]
+    out = array.array("d", bytes(8 * count))
+
+    def z_score_per_value():
+        mean = calculate(operation=Operation.MEAN, values=values)
+        deviation = calculate(operation=Operation.STANDARD_DEVIATION_POPULATION, values=values)
+        return [calculate(operation=Operation.Z_SCORE, value=value, population_mean=mean,
+                          population_std=deviation) for value in values]
+
+    print(f"\n🔹 {count} values")
+    baseline = time_once(z_score_per_value) * 1e9 / count
+    print_row("MEAN + STD + Z_SCORE each", baseline)
+    for operation in (Operation.STANDARDIZE, Operation.MIN_MAX_SCALE, Operation.ROBUST_SCALE):
+        print_row(operation.name, time_once(lambda: calculate(operation=operation, values=values)) * 1e9 / count,
+                  baseline)
+    print_row("standardize into buffer", time_once(lambda: scaling.standardize(values, out)) * 1e9 / count,
+              baseline)
+    if vectorized.HAS_NUMPY:
+        column = vectorized.np.asarray(values)
+        print_row("STANDARDIZE (ndarray)", time_once(
+            lambda: calculate(operation=Operation.STANDARDIZE, values=column)) * 1e9 / count, baseline)
+
+
+BENCHMARKS = {
+    "dispatch": bench_dispatch,
+    "batch": bench_batch,
+    "vectorized": bench_vectorized,
+    "cache": bench_cache,
+    "factorial": bench_factorial,
+    "primality": bench_primality,
+    "combinatorics": bench_combinatorics,
+    "gcd": bench_gcd,
+    "roots": bench_roots,
+    "factorize": bench_factorize,
+    "running": bench_running,
+    "describe": bench_describe,
+    "selection": bench_selection,
+    "sketch": bench_sketch,
+    "frequency": bench_frequency,
+    "rolling": bench_rolling,
+    "covariance": bench_covariance,
+    "sources": bench_sources,
+    "parallel": bench_parallel,
+    "grouped": bench_grouped,
+    "histogram": bench_histogram,
+    "scaling": bench_scaling,
+}
+
+
+def main():
+    """Run the benchmarks named on the command line, or all of them."""
+    names = sys.argv[1:] or list(BENCHMARKS)
+    unknown = [name for name in names if name not in BENCHMARKS]
+    if unknown:
+        print(f"❌ Unknown benchmarks: {', '.join(unknown)}")
+        print(f"   Available: {', '.join(BENCHMARKS)}")
+        sys.exit(1)
+
+    print("🧮 Math Calculation Engine - Benchmarks")
+    print("=" * 60)
+    for name in names:
+        BENCHMARKS[name]()
+    if FAILED_CHECKS:
+        print(f"\n❌ Failed checks: {', '.join(FAILED_CHECKS)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
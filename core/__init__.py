@@ -3,7 +3,22 @@ Core module for the Math Calculation Engine.
 Provides the main calculate function and operation definitions.
 """
 
-from .calculate import calculate, get_operation_info, list_operations
+from .calculate import (
+    calculate, calculate_many, bind, bind_positional, get_operation_info, list_operations,
+    enable_cache, disable_cache, clear_cache, set_cacheable, cache_info, enable_parallel,
+    disable_parallel
+)
 from .operations import Operation, OPERATION_MAP
+from .formulas.running import RunningStats, RunningCovariance
+from .formulas.sketches import TDigest
+from .formulas.frequency import MisraGries, CountMinSketch
+from .formulas.sources import Float64Source
+from .formulas.histogram import Histogram
 
-__all__ = ['calculate', 'Operation', 'get_operation_info', 'list_operations', 'OPERATION_MAP']
+__all__ = [
+    'calculate', 'calculate_many', 'bind', 'bind_positional', 'Operation', 'get_operation_info',
+    'list_operations', 'OPERATION_MAP', 'enable_cache', 'disable_cache', 'clear_cache',
+    'set_cacheable', 'cache_info', 'enable_parallel', 'disable_parallel', 'RunningStats',
+    'RunningCovariance', 'TDigest', 'MisraGries', 'CountMinSketch', 'Float64Source',
+    'Histogram'
+]
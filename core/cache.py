@@ -0,0 +1,193 @@
+"""
+Result cache for the Math Calculation Engine.
+Provides a bounded memoization layer for the pure operations behind calculate().
+"""
+
+import sys
+import threading
+from collections import OrderedDict
+
+from .operations import Operation
+
+
+# Operations that are not cached unless explicitly enabled with set_cacheable():
+# single arithmetic steps and quick checks such as IS_PRIME and LOG_CUSTOM_BASE, which
+# are cheaper to recompute than to look up (see `python benchmark.py cache`), and
+# statistics over a list, where hashing the list costs about as much as the statistic
+UNCACHED_OPERATIONS = frozenset({
+    Operation.ADD, Operation.SUBTRACT, Operation.MULTIPLY, Operation.DIVIDE,
+    Operation.MODULO, Operation.FLOOR_DIVIDE, Operation.SQUARE, Operation.CUBE,
+    Operation.ABSOLUTE_VALUE, Operation.SIGN, Operation.CEILING, Operation.FLOOR,
+    Operation.ARITHMETIC_MEAN, Operation.PERCENTAGE, Operation.PERCENTAGE_CHANGE,
+    Operation.AREA_RECTANGLE, Operation.AREA_SQUARE, Operation.AREA_TRIANGLE,
+    Operation.PERIMETER_RECTANGLE, Operation.PERIMETER_SQUARE,
+    Operation.DEGREES_TO_RADIANS, Operation.RADIANS_TO_DEGREES, Operation.Z_SCORE,
+    Operation.IS_PRIME, Operation.LOG_CUSTOM_BASE,
+
+    Operation.MEAN, Operation.MEDIAN, Operation.MODE, Operation.VARIANCE_POPULATION,
+    Operation.VARIANCE_SAMPLE, Operation.STANDARD_DEVIATION_POPULATION,
+    Operation.STANDARD_DEVIATION_SAMPLE, Operation.RANGE_VALUES, Operation.QUARTILE_1,
+    Operation.QUARTILE_3, Operation.INTERQUARTILE_RANGE, Operation.CORRELATION_COEFFICIENT,
+    Operation.PERCENTILE, Operation.PERCENTILES, Operation.DESCRIBE, Operation.GCD_MANY,
+    Operation.LCM_MANY, Operation.TOP_K, Operation.ROLLING_MEAN, Operation.ROLLING_VARIANCE_SAMPLE,
+    Operation.ROLLING_STANDARD_DEVIATION_SAMPLE, Operation.ROLLING_MEDIAN, Operation.ROLLING_PERCENTILE,
+    Operation.ROLLING_MIN, Operation.ROLLING_MAX, Operation.COVARIANCE_MATRIX, Operation.CORRELATION_MATRIX,
+    Operation.WEIGHTED_MEAN, Operation.WEIGHTED_VARIANCE_POPULATION, Operation.WEIGHTED_VARIANCE_SAMPLE,
+    Operation.WEIGHTED_PERCENTILE, Operation.GROUPED_COUNT, Operation.GROUPED_SUM, Operation.GROUPED_MEAN,
+    Operation.GROUPED_VARIANCE_SAMPLE, Operation.GROUPED_STANDARD_DEVIATION_SAMPLE, Operation.GROUPED_MIN,
+    Operation.GROUPED_MAX, Operation.GROUPED_MEDIAN, Operation.GROUPED_PERCENTILE,
+    Operation.GROUPED_WEIGHTED_MEAN, Operation.HISTOGRAM, Operation.WEIGHTED_HISTOGRAM, Operation.STANDARDIZE,
+    Operation.MIN_MAX_SCALE, Operation.ROBUST_SCALE, Operation.RESCALE,
+})
+
+
+class ResultCache:
+    """
+    Bounded least-recently-used cache of operation results.
+    
+    Entries are evicted in least-recently-used order when either the number of
+    entries exceeds capacity or, if max_size is set, the estimated memory held by
+    the cached results exceeds max_size bytes. Results larger than max_size on
+    their own are never cached.
+    """
+
+    def __init__(self, capacity=1024, max_size=None, exclude=UNCACHED_OPERATIONS):
+        """
+        Create an empty cache.
+        
+        Args:
+            capacity: Maximum number of cached results
+            max_size: Optional limit on the estimated total size of cached results, in bytes
+            exclude: Operations that are never cached
+        """
+        if capacity < 1:
+            raise ValueError("Cache capacity must be at least 1")
+        if max_size is not None and max_size < 1:
+            raise ValueError("Cache max_size must be positive")
+        self.capacity = capacity
+        self.max_size = max_size
+        self.excluded = set(exclude)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.size = 0
+        self._entries = OrderedDict()  # key -> (result, size)
+        self._lock = threading.Lock()
+
+    def is_cacheable(self, operation):
+        """Return True if results of operation are cached."""
+        return operation not in self.excluded
+
+    def set_cacheable(self, operation, cacheable=True):
+        """Opt an operation in to or out of caching."""
+        if cacheable:
+            self.excluded.discard(operation)
+        else:
+            self.excluded.add(operation)
+
+    def get(self, key):
+        """
+        Look up a cached result.
+        
+        Returns:
+            Tuple of (found, result); lists, including nested ones, are returned as copies
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return True, _copy_lists(entry[0])
+
+    def put(self, key, result):
+        """Store a result, evicting least recently used entries as needed."""
+        if hasattr(result, "__next__"):
+            # Generators can only be consumed once
+            return
+        size = estimate_size(result)
+        if self.max_size is not None and size > self.max_size:
+            return
+        result = _copy_lists(result)
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.size -= previous[1]
+            self._entries[key] = (result, size)
+            self.size += size
+            while len(self._entries) > self.capacity or \
+                    (self.max_size is not None and self.size > self.max_size):
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self.size -= evicted_size
+                self.evictions += 1
+
+    def clear(self):
+        """Remove all entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def info(self):
+        """
+        Get cache statistics.
+        
+        Returns:
+            Dictionary with hit, miss and eviction counters and current usage
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "capacity": self.capacity,
+                "size": self.size,
+                "max_size": self.max_size,
+            }
+
+
+def make_key(operation, required, kwargs):
+    """
+    Build a hashable cache key from an operation and its validated arguments.
+    
+    Values are tagged with their type so that, for example, factorial(5) and
+    factorial(5.0) do not share an entry. Lists and tuples are snapshotted as
+    tuples, so later changes to the caller's list cannot affect the cache.
+    
+    Returns:
+        The key, or None if an argument cannot be hashed
+    """
+    key = [operation]
+    for name in required:
+        value = kwargs[name]
+        if isinstance(value, (list, tuple)):
+            items = tuple(value)
+            types = set(map(type, items))
+            # A single type tag covers homogeneous sequences without a per-item copy
+            tag = next(iter(types)) if len(types) == 1 else tuple(map(type, items))
+            key += (type(value), tag, items)
+        else:
+            key += (type(value), value)
+    key = tuple(key)
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def estimate_size(value):
+    """Estimate the memory held by a result, in bytes."""
+    size = sys.getsizeof(value)
+    if isinstance(value, (list, tuple)):
+        size += sum(map(sys.getsizeof, value))
+    return size
+
+
+def _copy_lists(result):
+    """Copy a list result and the lists nested in it, so callers cannot change a cached entry."""
+    if not isinstance(result, list):
+        return result
+    return [_copy_lists(item) if isinstance(item, list) else item for item in result]
@@ -3,7 +3,30 @@ Core calculation dispatch function for the Math Calculation Engine.
 Provides strict argument validation and operation routing.
 """
 
+import inspect
+from array import array
+from itertools import repeat
+from numbers import Number
+
 from .operations import OPERATION_MAP
+from .cache import ResultCache, UNCACHED_OPERATIONS, make_key
+from .parallel import ParallelExecutor, PARALLEL_THRESHOLD
+from .formulas import vectorized
+
+# How calculate_many() handles rows that fail
+ERROR_POLICIES = ("raise", "nan", "mask", "collect")
+
+# Largest integer magnitude up to which every int converts to float64 exactly
+FLOAT_EXACT_LIMIT = 2 ** 53
+
+# Integer batches whose float64 results reach this magnitude may overflow int64
+INTEGER_RESULT_LIMIT = 2 ** 62
+
+# Result cache used by calculate(), None while caching is disabled
+_cache = None
+
+# Process pool used by calculate(), None while parallel execution is disabled
+_parallel = None
 
 
 def calculate(*, operation, **kwargs):
@@ -28,13 +51,319 @@ def calculate(*, operation, **kwargs):
         314.1592653589793
     """
     # Check if operation is supported
-    config = OPERATION_MAP.get(operation)
-    if not config:
-        raise ValueError(f"Unsupported operation: {operation}")
+    config = _get_config(operation)
 
     # Get required arguments for this operation
     required = config["required"]
+    _validate_arguments(required, kwargs)
+
+    # Serve repeated calls from the result cache when it is enabled
+    cache = _cache
+    key = None
+    if cache is not None and cache.is_cacheable(operation):
+        key = make_key(operation, required, kwargs)
+        if key is not None:
+            found, result = cache.get(key)
+            if found:
+                return result
+
+    # All validation passed, execute the operation
+    parallel = _parallel
+    try:
+        if parallel is not None and parallel.handles(operation):
+            result = parallel.run(operation, config["func"], kwargs)
+        else:
+            result = config["func"](**kwargs)
+    except Exception as e:
+        raise ValueError(f"Calculation error: {str(e)}")
+
+    if key is not None:
+        cache.put(key, result)
+    return result
+
+
+def enable_cache(capacity=1024, max_size=None, exclude=UNCACHED_OPERATIONS):
+    """
+    Turn on memoization of calculate() results.
+    
+    Results are kept in a least-recently-used cache keyed on the operation and its
+    arguments. Operations are assumed to be pure; failed calculations are not cached.
+    Calling this again replaces the cache (and its contents) with a new one. Bound
+    callables from bind() and batch calls through calculate_many() bypass the cache.
     
+    Args:
+        capacity: Maximum number of cached results
+        max_size: Optional limit on the estimated memory held by cached results, in
+            bytes. Least recently used entries are evicted until the total fits, and a
+            result larger than max_size (such as a huge factorial) is not cached at all
+        exclude: Operations not to cache, by default UNCACHED_OPERATIONS: single-step
+            arithmetic, quick checks such as IS_PRIME and list statistics, which are
+            cheaper to recompute than to look up
+        
+    Example:
+        >>> enable_cache(capacity=10000, max_size=64 * 1024 * 1024)
+        >>> calculate(operation=Operation.COMBINATION, n=50, r=3)  # computed and cached
+        19600
+        >>> calculate(operation=Operation.COMBINATION, n=50, r=3)  # served from the cache
+        19600
+    """
+    global _cache
+    _cache = ResultCache(capacity=capacity, max_size=max_size, exclude=exclude)
+
+
+def disable_cache():
+    """Turn off memoization and drop all cached results."""
+    global _cache
+    _cache = None
+
+
+def clear_cache():
+    """Drop all cached results and reset the cache counters."""
+    if _cache is not None:
+        _cache.clear()
+
+
+def set_cacheable(operation, cacheable=True):
+    """
+    Opt a single operation in to or out of caching.
+    
+    Args:
+        operation: Operation enum value
+        cacheable: False to stop caching the operation's results
+        
+    Raises:
+        ValueError: If operation is unsupported or caching is not enabled
+    """
+    _get_config(operation)
+    if _cache is None:
+        raise ValueError("Caching is not enabled")
+    _cache.set_cacheable(operation, cacheable)
+
+
+def cache_info():
+    """
+    Get result cache statistics.
+    
+    Returns:
+        Dictionary with hits, misses, evictions, entries, capacity, size and
+        max_size, or None if caching is disabled
+    """
+    if _cache is None:
+        return None
+    return _cache.info()
+
+
+def enable_parallel(workers=None, min_size=PARALLEL_THRESHOLD):
+    """
+    Turn on parallel map-reduce execution of the mergeable statistics.
+    
+    MEAN, VARIANCE_*, STANDARD_DEVIATION_*, RANGE_VALUES, CORRELATION_COEFFICIENT,
+    COVARIANCE_MATRIX and CORRELATION_MATRIX split lists of at least min_size values
+    across a process pool. Each worker reduces its slice of a shared-memory copy of
+    the input to partial aggregates, which are merged exactly. Results match the
+    single-process ones up to floating-point rounding. Calling this again replaces
+    the pool with a new one.
+    
+    Args:
+        workers: Number of worker processes, by default one per CPU
+        min_size: Smallest input worth sending to the pool
+        
+    Example:
+        >>> enable_parallel(workers=8)
+        >>> calculate(operation=Operation.VARIANCE_SAMPLE, values=readings)  # 8 processes
+    """
+    global _parallel
+    previous, _parallel = _parallel, ParallelExecutor(workers=workers, min_size=min_size)
+    if previous is not None:
+        previous.shutdown()
+
+
+def disable_parallel():
+    """Turn off parallel execution and stop the worker processes."""
+    global _parallel
+    previous, _parallel = _parallel, None
+    if previous is not None:
+        previous.shutdown()
+
+
+def calculate_many(*, operation, errors="raise", **columns):
+    """
+    Batch calculation function that applies an operation to whole columns of arguments.
+    
+    Each argument is a sequence (list, tuple, array.array, memoryview or NumPy array)
+    holding one value per row, and all sequences must have the same length. A plain
+    number is used for every row. Arguments are validated once for the whole batch.
+    When NumPy is installed and the operation has a vectorized implementation the
+    batch is computed with whole-array operations, otherwise the formula is applied
+    row by row. All-integer batches of formulas that return exact ints for them (ADD,
+    MODULO, SIGN, ...) are computed in int64, and go row by row when a result could
+    overflow int64 or is not an integer (2 ** -1); integers beyond 2**53 in magnitude
+    always go row by row. So result values do not depend on whether NumPy is installed.
+    
+    Rows that fail are handled according to the errors policy:
+        "raise":   raise ValueError for the first failing row (default)
+        "nan":     put nan in the failing rows
+        "mask":    as "nan", and also return a validity bitmap (1/True for valid rows)
+        "collect": as "nan", and also return a list of (index, message) pairs
+    
+    Args:
+        operation: Operation enum value specifying which calculation to perform
+        errors: Error policy for failing rows, one of ERROR_POLICIES
+        **columns: Named argument columns required for the specific operation
+        
+    Returns:
+        The result column: a float64 (or int64) NumPy array on the vectorized path,
+        otherwise an array.array when every result is a float (or every result an int),
+        else a list. With errors="mask" a (column, valid) tuple, where valid is a
+        bytearray; with errors="collect" a (column, failures) tuple.
+        
+    Raises:
+        ValueError: If operation or error policy is unsupported, arguments are missing
+        or unexpected, columns differ in length, or a row fails with errors="raise"
+        
+    Example:
+        >>> from core.operations import Operation
+        >>> calculate_many(operation=Operation.ADD, a=[1, 2, 3], b=10)  # without NumPy
+        array('q', [11, 12, 13])
+        >>> calculate_many(operation=Operation.DIVIDE, a=[1, 2], b=[2, 0], errors="collect")
+        (array('d', [0.5, nan]), [(1, 'Division by zero is not allowed')])
+    """
+    config = _get_config(operation)
+    required = config["required"]
+    _validate_arguments(required, columns)
+    if errors not in ERROR_POLICIES:
+        raise ValueError(f"Unsupported error policy: {errors} (expected one of: {', '.join(ERROR_POLICIES)})")
+
+    # Columns in the formula's parameter order
+    ordered = [_as_column(columns[name]) for name in required]
+    length = _batch_length(required, ordered)
+
+    kernel = vectorized.get_kernel(config["func"])
+    if kernel is not None:
+        arrays = _as_arrays(ordered)
+        if arrays is not None:
+            if vectorized.returns_integers(config["func"]) and all(
+                    column.dtype.kind in "biu" for column in arrays):
+                result = _calculate_integers(kernel, arrays, length, errors)
+            else:
+                result = _calculate_vectorized(kernel, config["func"], arrays, length, errors)
+            if result is not None:
+                return result
+
+    return _calculate_rows(config["func"], ordered, length, errors)
+
+
+def bind(operation):
+    """
+    Resolve an operation once and return a callable that takes its keyword arguments.
+    
+    The returned function skips the per-call lookup and argument validation done by
+    calculate(); the arguments are only checked when the formula call fails, so a
+    successful call costs little more than calling the formula directly. Formulas
+    that take parameters beyond the required ones (such as an optional out buffer)
+    are checked on every call instead. Errors are reported exactly like calculate()
+    reports them.
+    
+    Args:
+        operation: Operation enum value to bind
+        
+    Returns:
+        Callable accepting the operation's required arguments as keywords
+        
+    Raises:
+        ValueError: If operation is unsupported
+        
+    Example:
+        >>> from core.operations import Operation
+        >>> area = bind(Operation.AREA_CIRCLE)
+        >>> area(radius=10)
+        314.1592653589793
+    """
+    config = _get_config(operation)
+    func = config["func"]
+    required = config["required"]
+
+    if not _accepts_exactly(func, required):
+        # The formula would accept arguments that calculate() rejects (such as an
+        # optional out buffer), so check every call up front
+        def bound(**kwargs):
+            _validate_arguments(required, kwargs)
+            try:
+                return func(**kwargs)
+            except Exception as e:
+                raise ValueError(f"Calculation error: {str(e)}")
+
+        return _describe_bound(bound, operation, func)
+
+    def bound(**kwargs):
+        try:
+            return func(**kwargs)
+        except Exception as e:
+            # Wrong argument names surface here as a TypeError from the formula,
+            # report them the same way calculate() does
+            _validate_arguments(required, kwargs)
+            raise ValueError(f"Calculation error: {str(e)}")
+
+    return _describe_bound(bound, operation, func)
+
+
+def bind_positional(operation):
+    """
+    Resolve an operation once and return a callable that takes positional arguments.
+    
+    Arguments are passed in the order listed by the operation's required arguments
+    (see get_operation_info()). Like bind(), the argument count is only checked
+    when the formula call fails, unless the formula takes optional extra parameters.
+    
+    Args:
+        operation: Operation enum value to bind
+        
+    Returns:
+        Callable accepting the operation's required arguments positionally
+        
+    Raises:
+        ValueError: If operation is unsupported
+        
+    Example:
+        >>> from core.operations import Operation
+        >>> add = bind_positional(Operation.ADD)
+        >>> add(5, 3)
+        8
+    """
+    config = _get_config(operation)
+    func = config["func"]
+    required = config["required"]
+
+    if not _accepts_exactly(func, required):
+        def bound(*args):
+            _validate_positional(required, args)
+            try:
+                return func(*args)
+            except Exception as e:
+                raise ValueError(f"Calculation error: {str(e)}")
+
+        return _describe_bound(bound, operation, func)
+
+    def bound(*args):
+        try:
+            return func(*args)
+        except Exception as e:
+            _validate_positional(required, args)
+            raise ValueError(f"Calculation error: {str(e)}")
+
+    return _describe_bound(bound, operation, func)
+
+
+def _get_config(operation):
+    """Look up the OPERATION_MAP entry for an operation or raise ValueError."""
+    config = OPERATION_MAP.get(operation)
+    if not config:
+        raise ValueError(f"Unsupported operation: {operation}")
+    return config
+
+
+def _validate_arguments(required, kwargs):
+    """Raise ValueError if kwargs does not match the required argument names exactly."""
     # Check for missing required arguments
     missing = [arg for arg in required if arg not in kwargs]
     if missing:
@@ -45,11 +374,226 @@ def calculate(*, operation, **kwargs):
     if unexpected:
         raise ValueError(f"Unexpected arguments: {', '.join(unexpected)}")
 
-    # All validation passed, execute the operation
+
+def _validate_positional(required, args):
+    """Raise ValueError if args does not hold exactly one value per required argument."""
+    if len(args) < len(required):
+        missing = required[len(args):]
+        raise ValueError(f"Missing required arguments: {', '.join(missing)}")
+    if len(args) > len(required):
+        raise ValueError(
+            f"Unexpected arguments: expected {len(required)} "
+            f"({', '.join(required)}), got {len(args)}"
+        )
+
+
+def _accepts_exactly(func, required):
+    """Return True if func takes exactly the required arguments, so a call that fits it fits calculate()."""
     try:
-        return config["func"](**kwargs)
-    except Exception as e:
-        raise ValueError(f"Calculation error: {str(e)}")
+        parameters = list(inspect.signature(func).parameters.values())
+    except (TypeError, ValueError):
+        return False
+    return [parameter.name for parameter in parameters] == list(required) and all(
+        parameter.kind is inspect.Parameter.POSITIONAL_OR_KEYWORD for parameter in parameters)
+
+
+def _as_column(value):
+    """Return value unchanged if it is a number or a sized sequence, else materialize it as a list."""
+    if isinstance(value, Number) or hasattr(value, "__len__"):
+        return value
+    return list(value)
+
+
+def _batch_length(required, columns):
+    """Check that all sequence columns share one length and return it."""
+    lengths = {name: len(column) for name, column in zip(required, columns)
+               if not isinstance(column, Number)}
+    if not lengths:
+        raise ValueError("At least one argument must be a sequence")
+    if len(set(lengths.values())) > 1:
+        details = ', '.join(f"{name}={size}" for name, size in lengths.items())
+        raise ValueError(f"Columns must have the same length: {details}")
+    return next(iter(lengths.values()))
+
+
+def _as_arrays(columns):
+    """
+    Convert columns to NumPy arrays for a kernel, or return None to use the scalar formula.
+    
+    The scalar formula is kept for non-numeric columns and for integers that float64
+    cannot hold exactly. Integer columns keep their integer dtype.
+    """
+    np = vectorized.np
+    arrays = []
+    for column in columns:
+        converted = np.asarray(column)
+        kind = converted.dtype.kind
+        if kind not in "biuf":
+            return None
+        if kind != "f" and converted.size and (int(converted.max()) > FLOAT_EXACT_LIMIT or
+                                               int(converted.min()) < -FLOAT_EXACT_LIMIT):
+            return None
+        arrays.append(converted)
+    return arrays
+
+
+def _calculate_integers(kernel, arrays, length, errors):
+    """
+    Evaluate a kernel over all-integer columns in int64, so exact int results stay ints.
+    
+    int64 wraps around silently, so the kernel also runs in float64 and any result
+    reaching INTEGER_RESULT_LIMIT there sends the batch to the row path. Returns None
+    for that, for results that are not integers (such as 2 ** -1), and for failing
+    rows under a policy other than "raise", since an int64 column cannot hold nan.
+    """
+    np = vectorized.np
+    integers = [column.astype(np.int64, copy=False) for column in arrays]
+    try:
+        result, failures = vectorized.evaluate(kernel, integers, length)
+    except ValueError:
+        # NumPy refuses negative integer powers, which the scalar formula turns into floats
+        return None
+    if failures and errors != "raise":
+        return None
+    reference, _ = vectorized.evaluate(kernel, [column.astype(np.float64) for column in integers], length)
+    valid = ~vectorized.failure_mask(failures, length)
+    with np.errstate(invalid="ignore"):
+        if not (np.abs(reference[valid]) < INTEGER_RESULT_LIMIT).all():
+            return None
+    if result.dtype.kind == "f":
+        # ceil, floor and 10 ** x come back as floats; keep them only if they are exact ints
+        values = result[valid]
+        if not ((values == np.floor(values)) & (np.abs(values) <= FLOAT_EXACT_LIMIT)).all():
+            return None
+        result = result.astype(np.int64)
+    elif result.dtype.kind not in "iu":
+        return None
+    failure = vectorized.first_failure(failures)
+    if failure is not None:
+        index, message = failure
+        raise ValueError(f"Calculation error at index {index}: {message}")
+    if errors == "mask":
+        return result, bytearray(b"\x01") * length
+    if errors == "collect":
+        return result, []
+    return result
+
+
+def _calculate_vectorized(kernel, func, arrays, length, errors):
+    """
+    Evaluate a vectorized kernel over a batch in float64 and apply the error policy.
+    
+    Returns None if the batch has results that only the row path can represent.
+    """
+    arrays = [column.astype(vectorized.np.float64, copy=False) for column in arrays]
+    result, failures = vectorized.evaluate(kernel, arrays, length)
+    if not _recheck_non_finite(func, arrays, result, failures, length):
+        return None
+    if errors == "raise":
+        failure = vectorized.first_failure(failures)
+        if failure is not None:
+            index, message = failure
+            raise ValueError(f"Calculation error at index {index}: {message}")
+        return result
+
+    invalid = vectorized.failure_mask(failures, length)
+    if failures:
+        result[invalid] = vectorized.np.nan
+    if errors == "mask":
+        # A bytearray like the row path returns, whether or not NumPy is installed
+        return result, bytearray((~invalid).tobytes())
+    if errors == "collect":
+        return result, vectorized.failure_messages(failures, invalid)
+    return result
+
+
+def _recheck_non_finite(func, arrays, result, failures, length):
+    """
+    Recompute with the scalar formula the rows where the kernel turned finite arguments into inf or nan.
+    
+    NumPy overflows to inf and gives nan for complex results, where the scalar
+    formulas raise OverflowError or ZeroDivisionError, or return a complex number.
+    Rows that raise are added to failures with the scalar message, other results
+    are written into result.
+    
+    Returns:
+        False if a row has a result that a float64 column cannot hold, else True
+    """
+    np = vectorized.np
+    # Kernels with tuple results (MIDPOINT_2D) return one row of values per input row
+    settled = np.isfinite(result).reshape(length, -1).all(axis=1) | vectorized.failure_mask(failures, length)
+    for column in arrays:
+        # Non-finite arguments give non-finite results on both paths
+        settled |= ~np.isfinite(column)
+    rows = np.flatnonzero(~settled)
+    if not rows.size:
+        return True
+
+    columns = [np.broadcast_to(column, (length,))[rows].tolist() for column in arrays]
+    raised = {}
+    for index, row in zip(rows.tolist(), zip(*columns)):
+        try:
+            value = func(*row)
+        except Exception as e:
+            raised.setdefault(str(e), []).append(index)
+            continue
+        if not all(isinstance(item, (int, float)) for item in (value if isinstance(value, tuple) else (value,))):
+            return False
+        result[index] = value
+    for message, indices in raised.items():
+        invalid = np.zeros(length, dtype=bool)
+        invalid[indices] = True
+        failures.append((invalid, message))
+    return True
+
+
+def _calculate_rows(func, columns, length, errors):
+    """Apply a scalar formula row by row and apply the error policy."""
+    rows = zip(*[repeat(column, length) if isinstance(column, Number) else column
+                 for column in columns])
+    results = []
+    failures = []
+    append = results.append
+    for index, row in enumerate(rows):
+        try:
+            append(func(*row))
+        except Exception as e:
+            if errors == "raise":
+                raise ValueError(f"Calculation error at index {index}: {str(e)}")
+            failures.append((index, str(e)))
+            append(float("nan"))
+
+    result = _compact(results)
+    if errors == "mask":
+        valid = bytearray(b"\x01") * length
+        for index, _ in failures:
+            valid[index] = 0
+        return result, valid
+    if errors == "collect":
+        return result, failures
+    return result
+
+
+def _compact(results):
+    """Pack results into an array.array when they are all floats or all ints."""
+    kinds = set(map(type, results))
+    if kinds <= {float}:
+        return array("d", results)
+    if kinds == {int}:
+        try:
+            return array("q", results)
+        except OverflowError:
+            pass
+    return results
+
+
+def _describe_bound(bound, operation, func):
+    """Copy the formula's name and docstring onto a bound callable."""
+    bound.__name__ = func.__name__
+    bound.__qualname__ = func.__qualname__
+    bound.__doc__ = func.__doc__
+    bound.operation = operation
+    return bound
 
 
 def get_operation_info(operation):
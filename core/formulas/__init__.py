@@ -2,6 +2,13 @@
 Formula modules for mathematical calculations.
 """
 
-from . import arithmetic, geometry, volumes, trigonometry, logarithms, statistics
+from . import (
+    arithmetic, primes, factorization, geometry, volumes, trigonometry, logarithms, statistics, running,
+    sketches, frequency, rolling, sources, grouped, histogram, scaling, vectorized
+)
 
-__all__ = ['arithmetic', 'geometry', 'volumes', 'trigonometry', 'logarithms', 'statistics']
+__all__ = [
+    'arithmetic', 'primes', 'factorization', 'geometry', 'volumes', 'trigonometry', 'logarithms',
+    'statistics', 'running', 'sketches', 'frequency', 'rolling', 'sources',
+    'grouped', 'histogram', 'scaling', 'vectorized'
+]
@@ -4,6 +4,10 @@ Contains basic and advanced mathematical operations.
 """
 
 import math
+from collections import OrderedDict
+from functools import lru_cache
+
+from .primes import primes_up_to, is_small_prime, SIEVE_CACHE_LIMIT
 
 
 # Basic arithmetic operations
@@ -77,6 +81,86 @@ def nth_root(num, n):
         return -((-num) ** (1/n))
 
 
+def power_mod(base, exponent, modulus):
+    """Calculate base ** exponent modulo modulus without forming the full power."""
+    if not isinstance(base, int) or not isinstance(exponent, int) or not isinstance(modulus, int):
+        raise ValueError("Modular power is only defined for integers")
+    if modulus == 0:
+        raise ValueError("Modulo by zero is not allowed")
+    if exponent < 0:
+        # a ** -e is (a^-1) ** e, where a^-1 is the Bezout coefficient of a
+        g, inverse, _ = extended_gcd(base, modulus)
+        if g != 1:
+            raise ValueError("Base is not invertible for this modulus")
+        return pow(inverse, -exponent, modulus)
+    return pow(base, exponent, modulus)
+
+
+def isqrt(n):
+    """Calculate the integer square root floor(sqrt(n)) exactly."""
+    if not isinstance(n, int):
+        raise ValueError("Integer square root is only defined for integers")
+    if n < 0:
+        raise ValueError("Square root of negative number is not supported")
+    return _isqrt(n)
+
+
+def _isqrt(n):
+    """Calculate floor(sqrt(n)) exactly for a non-negative integer n."""
+    if n < 2 ** 52:
+        # Exact: the correctly rounded float square root cannot reach the next integer
+        return int(math.sqrt(n))
+    # Newton's method with the precision doubling every step, so that only the
+    # last step works on the full-size n (the algorithm behind math.isqrt)
+    c = (n.bit_length() - 1) // 2
+    a, d = 1, 0
+    for s in reversed(range(c.bit_length())):
+        e, d = d, c >> s
+        a = (a << d - e - 1) + _divmod(n >> 2 * c - e - d + 1, a)[0]
+    return a - (a * a > n)
+
+
+def integer_nth_root(num, n):
+    """Calculate the integer nth root of num, truncated towards zero."""
+    if not isinstance(num, int) or not isinstance(n, int):
+        raise ValueError("Integer root is only defined for integers")
+    if n == 0:
+        raise ValueError("Cannot calculate 0th root")
+    if n < 0:
+        raise ValueError("Root degree must be positive")
+    if num < 0:
+        if n % 2 == 0:
+            raise ValueError("Even root of negative number is not supported")
+        return -_integer_root(-num, n)
+    return _integer_root(num, n)
+
+
+def _integer_root(num, n):
+    """Calculate floor(num ** (1/n)) exactly for non-negative num and positive n."""
+    if n == 1 or num < 2:
+        return num
+    if n == 2:
+        return _isqrt(num)
+    shift = num.bit_length() // n // 2
+    if shift == 0 or num < 2 ** 52:
+        # The root has at most 26 bits, so the float estimate is within one of it
+        root = int(round(math.exp(math.log(num) / n)))
+        while root ** n > num:
+            root -= 1
+        while (root + 1) ** n <= num:
+            root += 1
+        return root
+    
+    # The root of the leading bits, scaled back up, bounds the root from above with
+    # half its bits correct, so Newton's method from there needs only a step or two
+    root = (_integer_root(num >> n * shift, n) + 1) << shift
+    while True:
+        estimate = ((n - 1) * root + _divmod(num, root ** (n - 1))[0]) // n
+        if estimate >= root:
+            return root
+        root = estimate
+
+
 def square(num):
     """Calculate the square of a number."""
     return num ** 2
@@ -120,19 +204,75 @@ def round_to_decimals(num, decimals):
     return round(num, decimals)
 
 
+# Factorials below this n are served from a precomputed table
+_SMALL_FACTORIAL_LIMIT = 256
+_SMALL_FACTORIALS = [1]
+for _i in range(1, _SMALL_FACTORIAL_LIMIT):
+    _SMALL_FACTORIALS.append(_SMALL_FACTORIALS[-1] * _i)
+
+# From this n on the prime-swing algorithm beats math.factorial's binary splitting
+_PRIME_SWING_THRESHOLD = 20000
+
+
 def factorial(n):
     """Calculate factorial of n."""
     if not isinstance(n, int):
         raise ValueError("Factorial is only defined for integers")
     if n < 0:
         raise ValueError("Factorial of negative number is undefined")
-    if n == 0 or n == 1:
-        return 1
+    if n < _SMALL_FACTORIAL_LIMIT:
+        return _SMALL_FACTORIALS[n]
+    if n < _PRIME_SWING_THRESHOLD:
+        return math.factorial(n)
+    return _prime_swing_factorial(n, primes_up_to(n))
+
+
+def _prime_swing_factorial(n, primes):
+    """
+    Calculate n! as (floor(n/2)!)^2 * swing(n), where swing(n) = n! / (floor(n/2)!)^2.
     
-    result = 1
-    for i in range(2, n + 1):
-        result *= i
-    return result
+    The swing is built from prime powers, so most of the work is one squaring per
+    halving of n, which is cheaper than multiplying n factors together.
+    """
+    if n < _SMALL_FACTORIAL_LIMIT:
+        return _SMALL_FACTORIALS[n]
+    return _prime_swing_factorial(n // 2, primes) ** 2 * _swing(n, primes)
+
+
+def _swing(n, primes):
+    """Calculate the swinging factorial n! / (floor(n/2)!)^2 from its prime factorization."""
+    factors = []
+    for p in primes:
+        if p > n:
+            break
+        # The exponent of p is the number of odd quotients n // p**k
+        q, exponent = n, 0
+        while q:
+            q //= p
+            exponent += q & 1
+        if exponent:
+            factors.append(p if exponent == 1 else p ** exponent)
+    return _product(factors, 0, len(factors))
+
+
+def _product(values, start, stop):
+    """Multiply values[start:stop] by binary splitting, keeping operands balanced."""
+    if stop - start <= 8:
+        result = 1
+        for i in range(start, stop):
+            result *= values[i]
+        return result
+    middle = (start + stop) // 2
+    return _product(values, start, middle) * _product(values, middle, stop)
+
+
+# From this min(r, n - r) on, building C(n, r) from its prime factorization beats the
+# multiply-divide loop, as long as r is also large next to sqrt(n) (the sieve costs O(n))
+_COMBINATION_FACTOR_THRESHOLD = 512
+_COMBINATION_FACTOR_RATIO = 32
+
+# Permutations with at least this many factors are multiplied by binary splitting
+_PERMUTATION_SPLIT_THRESHOLD = 64
 
 
 def combination(n, r):
@@ -149,12 +289,34 @@ def combination(n, r):
     
     # Use the more efficient formula to avoid large factorials
     r = min(r, n - r)  # Take advantage of symmetry
+    if r >= _COMBINATION_FACTOR_THRESHOLD and r * r >= _COMBINATION_FACTOR_RATIO * n:
+        return _binomial_from_primes(n, r)
     result = 1
     for i in range(r):
         result = result * (n - i) // (i + 1)
     return result
 
 
+def _binomial_from_primes(n, r):
+    """Calculate C(n, r) for r <= n - r from its prime factorization (Legendre's formula)."""
+    factors = []
+    for p in primes_up_to(n):
+        if p > n - r:
+            # p divides exactly one of the factors n - r + 1..n and none of 1..r
+            factors.append(p)
+            continue
+        if p * p > n:
+            exponent = n // p - r // p - (n - r) // p
+        else:
+            exponent, q = 0, p
+            while q <= n:
+                exponent += n // q - r // q - (n - r) // q
+                q *= p
+        if exponent:
+            factors.append(p if exponent == 1 else p ** exponent)
+    return _product(factors, 0, len(factors))
+
+
 def permutation(n, r):
     """Calculate permutation P(n,r) = n! / (n-r)!."""
     if not isinstance(n, int) or not isinstance(r, int):
@@ -164,18 +326,134 @@ def permutation(n, r):
     if r > n:
         raise ValueError("r cannot be greater than n")
     
+    if r >= _PERMUTATION_SPLIT_THRESHOLD:
+        return _product(range(n - r + 1, n + 1), 0, r)
     result = 1
     for i in range(n, n - r, -1):
         result *= i
     return result
 
 
+def pascal_row(n):
+    """List the binomial coefficients C(n, 0), ..., C(n, n)."""
+    if not isinstance(n, int):
+        raise ValueError("Pascal row is only defined for integers")
+    if n < 0:
+        raise ValueError("Row index must be non-negative")
+    
+    # Each coefficient follows from the previous one; the second half mirrors the first
+    row = [1] * (n + 1)
+    value = 1
+    for k in range(n // 2):
+        value = value * (n - k) // (k + 1)
+        row[k + 1] = row[n - k - 1] = value
+    return row
+
+
+# Factorial tables mod p are built for n below this; larger n fall back to a loop
+_MODULAR_TABLE_LIMIT = 1 << 20
+
+# Entries kept across all factorial tables mod p: one full-size table, about 75 MB
+_MODULAR_TABLE_BUDGET = 1 << 20
+
+# Factorial tables mod p by prime, least recently used first
+_modular_tables = OrderedDict()
+
+
+def combination_mod(n, r, p):
+    """Calculate C(n,r) modulo a prime p."""
+    _check_modular_arguments("Combination", n, r, p)
+    if n < p:
+        return _small_combination_mod(n, r, p)
+    
+    # Lucas' theorem: C(n, r) is congruent to the product of C(n_i, r_i) over the base-p digits
+    result = 1
+    while r:
+        n, n_digit = divmod(n, p)
+        r, r_digit = divmod(r, p)
+        if r_digit > n_digit:
+            return 0
+        result = result * _small_combination_mod(n_digit, r_digit, p) % p
+    return result
+
+
+def permutation_mod(n, r, p):
+    """Calculate P(n,r) modulo a prime p."""
+    _check_modular_arguments("Permutation", n, r, p)
+    
+    # P(n, r) is the product of n - r + 1..n, which vanishes once that run reaches a multiple of p
+    if n // p != (n - r) // p:
+        return 0
+    low, n = (n - r) % p, n % p
+    if n < _MODULAR_TABLE_LIMIT:
+        factorials, inverses = _modular_factorials(p, n)
+        return factorials[n] * inverses[low] % p
+    result = 1
+    for i in range(low + 1, n + 1):
+        result = result * i % p
+    return result
+
+
+def _check_modular_arguments(name, n, r, p):
+    """Validate the arguments of combination_mod and permutation_mod."""
+    if not isinstance(n, int) or not isinstance(r, int) or not isinstance(p, int):
+        raise ValueError(f"{name} is only defined for integers")
+    if n < 0 or r < 0:
+        raise ValueError("n and r must be non-negative")
+    if r > n:
+        raise ValueError("r cannot be greater than n")
+    if not is_prime(p):
+        raise ValueError("Modulus must be a prime number")
+
+
+def _small_combination_mod(n, r, p):
+    """Calculate C(n, r) mod p for 0 <= r <= n < p, where every factor is invertible."""
+    if n < _MODULAR_TABLE_LIMIT:
+        factorials, inverses = _modular_factorials(p, n)
+        return factorials[n] * inverses[r] % p * inverses[n - r] % p
+    r = min(r, n - r)
+    numerator = denominator = 1
+    for i in range(r):
+        numerator = numerator * (n - i) % p
+        denominator = denominator * (i + 1) % p
+    return numerator * pow(denominator, p - 2, p) % p
+
+
+def _modular_factorials(p, n):
+    """
+    Return the tables k! mod p and (k!)^-1 mod p, covering at least 0 <= k <= n < p.
+    
+    Each prime keeps one table, grown to the next power of two (at most p) when a
+    larger n needs it. The least recently used tables are dropped once all of them
+    hold more than _MODULAR_TABLE_BUDGET entries.
+    """
+    tables = _modular_tables.get(p)
+    if tables is not None and n < len(tables[0]):
+        _modular_tables.move_to_end(p)
+        return tables
+    
+    size = min(1 << n.bit_length(), p)
+    factorials = [1] if tables is None else list(tables[0])
+    for k in range(len(factorials), size):
+        factorials.append(factorials[-1] * k % p)
+    # One Fermat inversion at the top, then (k-1)!^-1 = k!^-1 * k on the way down
+    inverses = [1] * size
+    inverses[-1] = pow(factorials[-1], p - 2, p)
+    for k in range(size - 1, 0, -1):
+        inverses[k - 1] = inverses[k] * k % p
+    
+    _modular_tables[p] = tables = factorials, inverses
+    _modular_tables.move_to_end(p)
+    total = sum(len(entries) for entries, _ in _modular_tables.values())
+    while total > _MODULAR_TABLE_BUDGET and len(_modular_tables) > 1:
+        _, (evicted, _) = _modular_tables.popitem(last=False)
+        total -= len(evicted)
+    return tables
+
+
 def greatest_common_divisor(a, b):
     """Calculate the greatest common divisor using Euclidean algorithm."""
-    a, b = abs(int(a)), abs(int(b))
-    while b:
-        a, b = b, a % b
-    return a
+    return math.gcd(int(a), int(b))
 
 
 def least_common_multiple(a, b):
@@ -183,7 +461,150 @@ def least_common_multiple(a, b):
     a, b = abs(int(a)), abs(int(b))
     if a == 0 or b == 0:
         return 0
-    return abs(a * b) // greatest_common_divisor(a, b)
+    return a // math.gcd(a, b) * b
+
+
+def gcd_many(values):
+    """Calculate the greatest common divisor of a list of integers."""
+    _check_integer_list(values, "GCD")
+    result = 0
+    for value in values:
+        result = math.gcd(result, value)
+        if result == 1:
+            break
+    return result
+
+
+def lcm_many(values):
+    """Calculate the least common multiple of a list of integers."""
+    _check_integer_list(values, "LCM")
+    result = 1
+    for value in values:
+        if value == 0:
+            return 0
+        result = result // math.gcd(result, value) * abs(value)
+    return result
+
+
+def extended_gcd(a, b):
+    """Calculate (g, x, y) with g = gcd(a, b) and a*x + b*y = g."""
+    if not isinstance(a, int) or not isinstance(b, int):
+        raise ValueError("Extended GCD is only defined for integers")
+    old_r, r = a, b
+    old_x, x = 1, 0
+    old_y, y = 0, 1
+    while r:
+        q = old_r // r
+        old_r, r = r, old_r - q * r
+        old_x, x = x, old_x - q * x
+        old_y, y = y, old_y - q * y
+    if old_r < 0:
+        return -old_r, -old_x, -old_y
+    return old_r, old_x, old_y
+
+
+def batch_gcd(values):
+    """
+    For each integer in the list, calculate its gcd with the product of all the others.
+    
+    Uses Bernstein's product and remainder trees: every value is reduced modulo
+    its own square from the product of all values, which costs a few multiplications
+    per tree level instead of one gcd per pair.
+    """
+    if not all(isinstance(n, int) for n in values):
+        raise ValueError("Batch GCD is only defined for integers")
+    values = [abs(n) for n in values]
+    if 0 in values:
+        raise ValueError("Batch GCD is not defined for zero")
+    if not values:
+        return []
+    
+    # Product tree: each level multiplies neighbouring pairs of the level below
+    tree = [values]
+    while len(tree[-1]) > 1:
+        level = tree[-1]
+        tree.append([level[i] * level[i + 1] if i + 1 < len(level) else level[i]
+                     for i in range(0, len(level), 2)])
+    
+    # Remainder tree: reduce the full product modulo the square of every node on the way down
+    remainders = tree.pop()
+    while tree:
+        level = tree.pop()
+        remainders = [_divmod(remainders[i // 2], node * node)[1] for i, node in enumerate(level)]
+    return [math.gcd(remainder // n, n) for remainder, n in zip(remainders, values)]
+
+
+# Divisions with divisor and quotient both this large use Burnikel-Ziegler recursion,
+# which turns one long division into multiplications (Karatsuba) instead of the
+# quadratic built-in
+_FAST_DIVISION_BITS = 8000
+
+
+def _divmod(a, b):
+    """Divide non-negative a by positive b, recursively when the divisor and quotient are huge."""
+    n = b.bit_length()
+    if n < _FAST_DIVISION_BITS or a.bit_length() - n < _FAST_DIVISION_BITS:
+        return divmod(a, b)
+    # Long division in base 2**n: each step divides a value below b * 2**n by b
+    mask = (1 << n) - 1
+    quotient = remainder = 0
+    for shift in range((a.bit_length() - 1) // n * n, -1, -n):
+        digit, remainder = _divide_2n_by_n((remainder << n) | ((a >> shift) & mask), b, n)
+        quotient = (quotient << n) | digit
+    return quotient, remainder
+
+
+def _divide_2n_by_n(a, b, n):
+    """Divide a < b * 2**n by the n-bit integer b, returning the quotient and remainder."""
+    if a.bit_length() - n < _FAST_DIVISION_BITS:
+        return divmod(a, b)
+    odd = n & 1
+    if odd:
+        a, b, n = a << 1, b << 1, n + 1
+    half = n >> 1
+    mask = (1 << half) - 1
+    b_high, b_low = b >> half, b & mask
+    # Two 3-by-2 half-size steps, each producing half of the quotient
+    q_high, r = _divide_3_by_2(a >> n, (a >> half) & mask, b, b_high, b_low, half)
+    q_low, r = _divide_3_by_2(r, a & mask, b, b_high, b_low, half)
+    if odd:
+        r >>= 1
+    return q_high << half | q_low, r
+
+
+def _divide_3_by_2(a_high, a_low, b, b_high, b_low, n):
+    """Divide (a_high * 2**n + a_low) by b = b_high * 2**n + b_low, for _divide_2n_by_n."""
+    if a_high >> n == b_high:
+        q, r = (1 << n) - 1, a_high - (b_high << n) + b_high
+    else:
+        q, r = _divide_2n_by_n(a_high, b_high, n)
+    # The estimate from the high half is at most two too large
+    r = (r << n | a_low) - q * b_low
+    while r < 0:
+        q -= 1
+        r += b
+    return q, r
+
+
+def _check_integer_list(values, name):
+    """Validate a non-empty list of integers for gcd_many and lcm_many."""
+    if not values:
+        raise ValueError(f"Cannot calculate {name} of empty list")
+    if not all(isinstance(n, int) for n in values):
+        raise ValueError(f"{name} is only defined for integers")
+
+
+# Primes below 100: tested together with a single gcd against their product
+_SMALL_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47, 53, 59, 61, 67, 71,
+                 73, 79, 83, 89, 97)
+_SMALL_PRIMES_PRODUCT = 1
+for _p in _SMALL_PRIMES:
+    _SMALL_PRIMES_PRODUCT *= _p
+
+# Miller-Rabin bases that are deterministic below 4759123141 (Jaeschke) and for
+# every n < 2**64 (Jim Sinclair's set)
+_MILLER_RABIN_BASES_32 = (2, 7, 61)
+_MILLER_RABIN_BASES_64 = (2, 325, 9375, 28178, 450775, 9780504, 1795265022)
 
 
 def is_prime(n):
@@ -192,32 +613,190 @@ def is_prime(n):
         raise ValueError("Prime check is only defined for integers")
     if n < 2:
         return False
-    if n == 2:
-        return True
-    if n % 2 == 0:
+    if n <= _SMALL_PRIMES[-1]:
+        return n in _SMALL_PRIMES
+    if math.gcd(n, _SMALL_PRIMES_PRODUCT) != 1:
         return False
+    if n < _SMALL_PRIMES[-1] ** 2:
+        return True
     
-    # Check odd divisors up to sqrt(n)
-    for i in range(3, int(math.sqrt(n)) + 1, 2):
-        if n % i == 0:
+    if n < SIEVE_CACHE_LIMIT:
+        return is_small_prime(n)
+    if n < 4759123141:
+        return _miller_rabin(n, _MILLER_RABIN_BASES_32)
+    if n < 2 ** 64:
+        return _miller_rabin(n, _MILLER_RABIN_BASES_64)
+    # Baillie-PSW: no composite passing both tests is known
+    return _miller_rabin(n, (2,)) and _strong_lucas_probable_prime(n)
+
+
+def is_prime_many(values):
+    """Check a list of integers for primality, returning a list of booleans."""
+    if not all(isinstance(n, int) for n in values):
+        raise ValueError("Prime check is only defined for integers")
+    return [is_prime(n) for n in values]
+
+
+def _miller_rabin(n, bases):
+    """Strong probable-prime test of odd n > 2 to each of the given bases."""
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    
+    for a in bases:
+        a %= n
+        if a == 0:
+            continue
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
             return False
     return True
 
 
+def _strong_lucas_probable_prime(n):
+    """Strong Lucas probable-prime test of odd n with Selfridge's parameters."""
+    # Perfect squares have no D with Jacobi symbol -1
+    if _isqrt(n) ** 2 == n:
+        return False
+    
+    # Selfridge's method A: first D in 5, -7, 9, -11, ... with (D/n) = -1
+    D = 5
+    while True:
+        jacobi = _jacobi_symbol(D, n)
+        if jacobi == -1:
+            break
+        if jacobi == 0 and abs(D) != n:
+            return False
+        D = -D - 2 if D > 0 else -D + 2
+    P, Q = 1, (1 - D) // 4
+    
+    d, s = n + 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    
+    # Compute U_d, V_d and Q^d mod n from the top bit of d down
+    U, V, Q_k = 1, P, Q % n
+    for bit in bin(d)[3:]:
+        U, V = U * V % n, (V * V - 2 * Q_k) % n
+        Q_k = Q_k * Q_k % n
+        if bit == "1":
+            U, V = P * U + V, D * U + P * V
+            # Halve modulo n (n is odd, so adding n makes an odd value even)
+            U = (U + n if U % 2 else U) // 2 % n
+            V = (V + n if V % 2 else V) // 2 % n
+            Q_k = Q_k * Q % n
+    
+    if U == 0 or V == 0:
+        return True
+    for _ in range(s - 1):
+        V = (V * V - 2 * Q_k) % n
+        if V == 0:
+            return True
+        Q_k = Q_k * Q_k % n
+    return False
+
+
+def _jacobi_symbol(a, n):
+    """Calculate the Jacobi symbol (a/n) for odd positive n."""
+    a %= n
+    result = 1
+    while a:
+        while a % 2 == 0:
+            a //= 2
+            if n % 8 in (3, 5):
+                result = -result
+        a, n = n, a
+        if a % 4 == 3 and n % 4 == 3:
+            result = -result
+        a %= n
+    return result if n == 1 else 0
+
+
 def fibonacci(n):
     """Calculate the nth Fibonacci number."""
     if not isinstance(n, int):
         raise ValueError("Fibonacci is only defined for integers")
     if n < 0:
         raise ValueError("Fibonacci index must be non-negative")
+    return _fibonacci_pair(n)[0]
+
+
+# Pisano periods are computed (in at most 6m steps, then cached) for moduli up to this
+# size, and only used for indices beyond 64 bits where they save doubling steps
+_PISANO_LIMIT = 10 ** 4
+
+
+def fibonacci_mod(n, m):
+    """Calculate the nth Fibonacci number modulo m."""
+    if not isinstance(n, int) or not isinstance(m, int):
+        raise ValueError("Fibonacci modulo is only defined for integers")
+    if n < 0:
+        raise ValueError("Fibonacci index must be non-negative")
+    if m < 1:
+        raise ValueError("Modulus must be positive")
     
-    if n <= 1:
-        return n
+    # F(n) mod m repeats with the Pisano period of m
+    if m <= _PISANO_LIMIT and n.bit_length() > 64:
+        n %= _pisano_period(m)
+    return _fibonacci_pair(n, m)[0]
+
+
+def fibonacci_sequence(start, stop):
+    """Generate the Fibonacci numbers F(start) up to but excluding F(stop)."""
+    if not isinstance(start, int) or not isinstance(stop, int):
+        raise ValueError("Fibonacci is only defined for integers")
+    if start < 0 or stop < 0:
+        raise ValueError("Fibonacci index must be non-negative")
+    return _fibonacci_range(start, stop)
+
+
+def _fibonacci_range(start, stop):
+    """Yield F(start)..F(stop - 1), jumping to start by fast doubling."""
+    a, b = _fibonacci_pair(start)
+    for _ in range(start, stop):
+        yield a
+        a, b = b, a + b
+
+
+def _fibonacci_pair(n, m=None):
+    """
+    Calculate (F(n), F(n+1)) by fast doubling, optionally modulo m.
     
+    Uses F(2k) = F(k) * (2F(k+1) - F(k)) and F(2k+1) = F(k)^2 + F(k+1)^2,
+    one step per bit of n.
+    """
     a, b = 0, 1
-    for _ in range(2, n + 1):
-        a, b = b, a + b
-    return b
+    for bit in bin(n)[2:]:
+        c = a * (2 * b - a)
+        d = a * a + b * b
+        if bit == "1":
+            a, b = d, c + d
+        else:
+            a, b = c, d
+        if m is not None:
+            a, b = a % m, b % m
+    return a, b
+
+
+@lru_cache(maxsize=128)
+def _pisano_period(m):
+    """Find the period of the Fibonacci sequence modulo m."""
+    if m == 1:
+        return 1
+    a, b = 0, 1
+    for i in range(1, 6 * m + 1):
+        a, b = b, (a + b) % m
+        if a == 0 and b == 1:
+            return i
+    raise AssertionError("Pisano period not found")  # pi(m) <= 6m for all m
 
 
 def arithmetic_mean(a, b):
@@ -0,0 +1,192 @@
+"""
+Integer factorization for the Math Calculation Engine.
+Contains trial division, Pollard-Brent rho and the operations built on them.
+"""
+
+import math
+from functools import lru_cache
+
+from .arithmetic import is_prime, batch_gcd, integer_nth_root
+from .primes import primes_up_to
+
+# Prime factors below this bound are found by trial division, larger ones by rho
+TRIAL_DIVISION_LIMIT = 1000
+
+# Number of cofactors whose factorizations are kept between calls
+FACTOR_CACHE_SIZE = 4096
+
+_TRIAL_PRIMES = tuple(primes_up_to(TRIAL_DIVISION_LIMIT - 1))
+_TRIAL_PRODUCT = 1
+for _p in _TRIAL_PRIMES:
+    _TRIAL_PRODUCT *= _p
+
+# Rho steps whose differences are multiplied together before taking one gcd
+_RHO_BATCH = 128
+
+
+def factorize(n):
+    """Factor a positive integer into a sorted list of (prime, exponent) pairs."""
+    _check_positive_integer(n, "Factorization")
+    factors, cofactor = _trial_division(n)
+    if cofactor > 1:
+        factors.extend(_factor_cofactor(cofactor))
+    return _collect(factors)
+
+
+def factorize_many(values):
+    """
+    Factor a list of positive integers, returning one list of (prime, exponent) pairs each.
+    
+    Repeated values are factored once. Cofactors left after trial division are first
+    split against each other with a batch gcd, then divided by the large primes already
+    found for earlier inputs, so a prime shared between inputs costs one rho search.
+    """
+    for n in values:
+        _check_positive_integer(n, "Factorization")
+    
+    distinct = {}
+    for n in values:
+        if n not in distinct:
+            distinct[n] = _trial_division(n)
+    cofactors = sorted({cofactor for _, cofactor in distinct.values() if cofactor > 1})
+    composites = [c for c in cofactors if c >= TRIAL_DIVISION_LIMIT ** 2 and not is_prime(c)]
+    
+    parts = {c: (c,) for c in cofactors}
+    if len(composites) > 1:
+        for cofactor, shared in zip(composites, batch_gcd(composites)):
+            shared = math.gcd(cofactor, shared)
+            if 1 < shared < cofactor:
+                parts[cofactor] = (shared, cofactor // shared)
+    
+    found, found_product = [], 1
+    large_factors = {}
+    for cofactor in cofactors:
+        primes = []
+        for part in parts[cofactor]:
+            common = math.gcd(part, found_product)
+            for p in found:
+                if common == 1:
+                    break
+                if common % p == 0:
+                    common //= p
+                    while part % p == 0:
+                        part //= p
+                        primes.append(p)
+            if part > 1:
+                new_primes = _factor_cofactor(part)
+                primes.extend(new_primes)
+                for p in set(new_primes):
+                    if found_product % p:
+                        found.append(p)
+                        found_product *= p
+        large_factors[cofactor] = primes
+    
+    results = {n: _collect(factors + large_factors.get(cofactor, []))
+               for n, (factors, cofactor) in distinct.items()}
+    return [list(results[n]) for n in values]
+
+
+def divisor_count(n):
+    """Count the positive divisors of a positive integer."""
+    count = 1
+    for _, exponent in factorize(n):
+        count *= exponent + 1
+    return count
+
+
+def euler_phi(n):
+    """Count the integers in 1..n that are coprime to n (Euler's totient)."""
+    result = n
+    for p, _ in factorize(n):
+        result = result // p * (p - 1)
+    return result
+
+
+def radical(n):
+    """Calculate the product of the distinct prime factors of a positive integer."""
+    result = 1
+    for p, _ in factorize(n):
+        result *= p
+    return result
+
+
+def _check_positive_integer(n, name):
+    """Validate the argument of a factorization-based operation."""
+    if not isinstance(n, int):
+        raise ValueError(f"{name} is only defined for integers")
+    if n < 1:
+        raise ValueError(f"{name} is only defined for positive integers")
+
+
+def _trial_division(n):
+    """Remove the prime factors below TRIAL_DIVISION_LIMIT, returning them and the cofactor."""
+    factors = []
+    # One gcd tells which trial primes divide n at all; usually none or a few do
+    common = math.gcd(n, _TRIAL_PRODUCT)
+    for p in _TRIAL_PRIMES:
+        if common == 1:
+            break
+        if common % p == 0:
+            common //= p
+            while n % p == 0:
+                n //= p
+                factors.append(p)
+    return factors, n
+
+
+@lru_cache(maxsize=FACTOR_CACHE_SIZE)
+def _factor_cofactor(n):
+    """Factor n > 1 without prime factors below TRIAL_DIVISION_LIMIT into a tuple of primes."""
+    if n < TRIAL_DIVISION_LIMIT ** 2 or is_prime(n):
+        return (n,)
+    # Rho gains nothing on a prime power, so split perfect powers on their root first;
+    # every prime factor is at least TRIAL_DIVISION_LIMIT, which bounds the exponent
+    for k in _TRIAL_PRIMES:
+        if TRIAL_DIVISION_LIMIT ** k > n:
+            break
+        root = integer_nth_root(n, k)
+        if root ** k == n:
+            return tuple(sorted(_factor_cofactor(root) * k))
+    divisor = _pollard_brent(n)
+    return tuple(sorted(_factor_cofactor(divisor) + _factor_cofactor(n // divisor)))
+
+
+def _pollard_brent(n):
+    """Find a proper divisor of an odd composite n with Brent's variant of Pollard's rho."""
+    for c in range(1, n):
+        y, r, q, g = 2, 1, 1, 1
+        x = ys = y
+        while g == 1:
+            x = y
+            for _ in range(r):
+                y = (y * y + c) % n
+            # Walk r more steps, taking one gcd per batch of accumulated differences
+            k = 0
+            while k < r and g == 1:
+                ys = y
+                for _ in range(min(_RHO_BATCH, r - k)):
+                    y = (y * y + c) % n
+                    q = q * (x - y) % n
+                g = math.gcd(q, n)
+                k += _RHO_BATCH
+            r *= 2
+        if g == n:
+            # The batch overshot the collision: replay its steps one gcd at a time
+            g = 1
+            while g == 1:
+                ys = (ys * ys + c) % n
+                g = math.gcd(x - ys, n)
+        if g != n:
+            return g
+    raise AssertionError("Pollard's rho found no divisor")
+
+
+def _collect(primes):
+    """Group a list of primes into sorted (prime, exponent) pairs."""
+    pairs = []
+    for p in sorted(primes):
+        if pairs and pairs[-1][0] == p:
+            pairs[-1] = (p, pairs[-1][1] + 1)
+        else:
+            pairs.append((p, 1))
+    return pairs
@@ -0,0 +1,264 @@
+"""
+Frequency estimation for the Math Calculation Engine.
+Contains exact and sketched value counts for MODE and TOP_K over streams.
+"""
+
+import hashlib
+import math
+from collections import Counter
+from itertools import islice
+from numbers import Number
+
+# Values counted together before they are folded into a summary
+CHUNK_SIZE = 4096
+
+_MASK_64 = (1 << 64) - 1
+
+
+def top_k(values, k):
+    """List the k most frequent values with their counts, most frequent first."""
+    if not isinstance(k, int) or k < 1:
+        raise ValueError("k must be a positive integer")
+    if isinstance(values, (MisraGries, CountMinSketch)):
+        return values.top(k)
+    if not isinstance(values, Counter):
+        values = Counter(values)
+    return values.most_common(k)
+
+
+class MisraGries:
+    """
+    Misra-Gries heavy-hitter summary with a fixed number of counters.
+    
+    Every value occurring more than count / (capacity + 1) times is guaranteed to
+    be kept. Kept counts never overestimate, and underestimate by at most
+    error <= count / (capacity + 1). Summaries of separate shards combine with
+    merge() under the same bound (Agarwal et al.'s mergeable summaries).
+    """
+
+    __slots__ = ("capacity", "count", "error", "_counters")
+
+    # Summaries change as values arrive, so they must never be used as cache keys
+    __hash__ = None
+
+    def __init__(self, capacity=100, values=None):
+        """
+        Create an empty summary.
+        
+        Args:
+            capacity: Number of counters kept
+            values: Optional iterable of values to add straight away
+        """
+        if not isinstance(capacity, int) or capacity < 1:
+            raise ValueError("Summary capacity must be a positive integer")
+        self.capacity = capacity
+        self.count = 0
+        self.error = 0
+        self._counters = {}
+        if values is not None:
+            self.extend(values)
+
+    def __len__(self):
+        return self.count
+
+    def __repr__(self):
+        return f"MisraGries(capacity={self.capacity}, count={self.count}, error={self.error})"
+
+    def update(self, value):
+        """Add one occurrence of a value."""
+        counters = self._counters
+        self.count += 1
+        if value in counters:
+            counters[value] += 1
+        elif len(counters) < self.capacity:
+            counters[value] = 1
+        else:
+            # No free counter: decrement them all instead of counting value
+            self.error += 1
+            for key in list(counters):
+                counters[key] -= 1
+                if not counters[key]:
+                    del counters[key]
+
+    def extend(self, values):
+        """
+        Add every value from an iterable, counting CHUNK_SIZE values at a time.
+        
+        Returns:
+            The summary itself
+        """
+        iterator = iter(values)
+        chunk = Counter(islice(iterator, CHUNK_SIZE))
+        while chunk:
+            self._combine(chunk, sum(chunk.values()), 0)
+            chunk = Counter(islice(iterator, CHUNK_SIZE))
+        return self
+
+    def merge(self, other):
+        """
+        Fold another summary into this one.
+        
+        Returns:
+            The summary itself
+        """
+        self._combine(other._counters, other.count, other.error)
+        return self
+
+    def top(self, k):
+        """List up to k kept values with their (lower-bound) counts, most frequent first."""
+        return Counter(self._counters).most_common(k)
+
+    def estimate(self, value):
+        """Estimate how often value occurred; the true count is at most estimate + error."""
+        return self._counters.get(value, 0)
+
+    def _combine(self, counts, count, error):
+        """Add a table of counts, then shrink back to capacity counters."""
+        counters = self._counters
+        for value, occurrences in counts.items():
+            counters[value] = counters.get(value, 0) + occurrences
+        self.count += count
+        self.error += error
+        if len(counters) > self.capacity:
+            # Subtracting the (capacity + 1)-th largest count from every counter leaves
+            # at most capacity positive ones and costs each value at most that much
+            cut = sorted(counters.values(), reverse=True)[self.capacity]
+            self.error += cut
+            self._counters = {value: occurrences - cut for value, occurrences in counters.items()
+                              if occurrences > cut}
+
+
+class CountMinSketch:
+    """
+    Count-Min sketch of value frequencies, with a bounded list of heavy-hitter candidates.
+    
+    Estimates never undercount; with probability at least 1 - exp(-depth) each one
+    overcounts by at most error_bound() = e * count / width. Values are hashed
+    identically in every process, so sketches with the same width and depth built
+    by separate workers combine with merge().
+    """
+
+    __slots__ = ("width", "depth", "tracked", "count", "_table", "_candidates", "_floor")
+
+    # Sketches change as values arrive, so they must never be used as cache keys
+    __hash__ = None
+
+    def __init__(self, width=2048, depth=5, tracked=100, values=None):
+        """
+        Create an empty sketch.
+        
+        Args:
+            width: Counters per row; the error bound shrinks as 1 / width
+            depth: Number of rows; the failure probability shrinks as exp(-depth)
+            tracked: Number of candidate heavy hitters kept for top()
+            values: Optional iterable of values to add straight away
+        """
+        if not all(isinstance(size, int) and size >= 1 for size in (width, depth, tracked)):
+            raise ValueError("Sketch width, depth and tracked must be positive integers")
+        self.width = width
+        self.depth = depth
+        self.tracked = tracked
+        self.count = 0
+        self._table = [[0] * width for _ in range(depth)]
+        self._candidates = {}
+        self._floor = 0
+        if values is not None:
+            self.extend(values)
+
+    def __len__(self):
+        return self.count
+
+    def __repr__(self):
+        return f"CountMinSketch(width={self.width}, depth={self.depth}, count={self.count})"
+
+    def update(self, value, occurrences=1):
+        """Add occurrences of a value."""
+        self.count += occurrences
+        estimate = None
+        for row, index in zip(self._table, self._indices(value)):
+            row[index] += occurrences
+            if estimate is None or row[index] < estimate:
+                estimate = row[index]
+        self._track(value, estimate)
+
+    def extend(self, values):
+        """
+        Add every value from an iterable, counting CHUNK_SIZE values at a time.
+        
+        Returns:
+            The sketch itself
+        """
+        iterator = iter(values)
+        chunk = Counter(islice(iterator, CHUNK_SIZE))
+        while chunk:
+            for value, occurrences in chunk.items():
+                self.update(value, occurrences)
+            chunk = Counter(islice(iterator, CHUNK_SIZE))
+        return self
+
+    def merge(self, other):
+        """
+        Fold another sketch of the same shape into this one.
+        
+        Returns:
+            The sketch itself
+        """
+        if (other.width, other.depth) != (self.width, self.depth):
+            raise ValueError("Only sketches with the same width and depth can be merged")
+        for row, other_row in zip(self._table, other._table):
+            row[:] = map(int.__add__, row, other_row)
+        self.count += other.count
+        candidates = set(self._candidates) | set(other._candidates)
+        estimates = {value: self.estimate(value) for value in candidates}
+        self._candidates = dict(Counter(estimates).most_common(self.tracked))
+        self._floor = min(self._candidates.values(), default=0)
+        return self
+
+    def estimate(self, value):
+        """Estimate how often value occurred; never less than the true count."""
+        return min(row[index] for row, index in zip(self._table, self._indices(value)))
+
+    def error_bound(self):
+        """Overcount that each estimate stays within with probability 1 - exp(-depth)."""
+        return math.e * self.count / self.width
+
+    def top(self, k):
+        """List up to k candidate heavy hitters with their estimated counts, most frequent first."""
+        return Counter({value: self.estimate(value) for value in self._candidates}).most_common(k)
+
+    def _track(self, value, estimate):
+        """Keep value as a heavy-hitter candidate if it beats the weakest one."""
+        candidates = self._candidates
+        if value in candidates or len(candidates) < self.tracked:
+            candidates[value] = estimate
+        elif estimate > self._floor:
+            # Stored estimates only lag behind, so _floor is a cheap lower bound
+            # on the weakest candidate and most misses stop at the comparison above
+            weakest = min(candidates, key=candidates.__getitem__)
+            if estimate > candidates[weakest]:
+                del candidates[weakest]
+                candidates[value] = estimate
+            self._floor = min(candidates.values())
+
+    def _indices(self, value):
+        """Column of value in every row, by double hashing one 64-bit hash."""
+        h = _stable_hash(value)
+        step = ((h >> 32) | 1) % self.width or 1
+        return [(h + row * step) % self.width for row in range(self.depth)]
+
+
+def _stable_hash(value):
+    """
+    Hash value the same way in every process.
+    
+    Numeric hashes are already deterministic (and equal for 1 and 1.0); str and
+    bytes hashes are salted per process, so other values hash their repr instead.
+    """
+    if isinstance(value, Number):
+        h = hash(value) & _MASK_64
+    else:
+        h = int.from_bytes(hashlib.blake2b(repr(value).encode(), digest_size=8).digest(), "little")
+    # SplitMix64 finalizer: spread consecutive integers over all 64 bits
+    h = (h ^ (h >> 30)) * 0xBF58476D1CE4E5B9 & _MASK_64
+    h = (h ^ (h >> 27)) * 0x94D049BB133111EB & _MASK_64
+    return h ^ (h >> 31)
@@ -0,0 +1,159 @@
+"""
+Grouped statistics for the Math Calculation Engine.
+Contains per-key aggregations computed from one hash-based pass over keys and values.
+"""
+
+import math
+from collections import Counter, defaultdict
+
+from . import statistics
+
+
+def group_values(keys, values):
+    """
+    Partition values by key in a single pass.
+    
+    Only the order statistics (GROUPED_MEDIAN, GROUPED_PERCENTILE) need every value
+    of a group; the other grouped statistics keep a running accumulator per key.
+    
+    Returns:
+        Dictionary of key -> list of that key's values, in order of first appearance
+    """
+    _check_lengths(keys, values)
+    # defaultdict's C-level missing-key path beats get() and an explicit branch
+    groups = defaultdict(list)
+    for key, value in zip(keys, values):
+        groups[key].append(value)
+    return dict(groups)
+
+
+def grouped_count(keys, values):
+    """Count the values of each key."""
+    _check_lengths(keys, values)
+    # Only the keys matter, and Counter tallies them in C without building the groups
+    return dict(Counter(keys))
+
+
+def grouped_sum(keys, values):
+    """Calculate the sum of each key's values."""
+    return {key: total for key, (count, total) in _running_sums(keys, values).items()}
+
+
+def grouped_mean(keys, values):
+    """Calculate the mean of each key's values."""
+    return {key: total / count for key, (count, total) in _running_sums(keys, values).items()}
+
+
+def grouped_variance_sample(keys, values):
+    """Calculate the sample variance of each key's values."""
+    return {key: _sample_variance(state) for key, state in _running_moments(keys, values).items()}
+
+
+def grouped_standard_deviation_sample(keys, values):
+    """Calculate the sample standard deviation of each key's values."""
+    return {key: math.sqrt(_sample_variance(state)) for key, state in _running_moments(keys, values).items()}
+
+
+def grouped_min(keys, values):
+    """Find the smallest value of each key."""
+    _check_lengths(keys, values)
+    smallest = {}
+    get = smallest.get
+    for key, value in zip(keys, values):
+        current = get(key)
+        if current is None or value < current:
+            smallest[key] = value
+    return smallest
+
+
+def grouped_max(keys, values):
+    """Find the largest value of each key."""
+    _check_lengths(keys, values)
+    largest = {}
+    get = largest.get
+    for key, value in zip(keys, values):
+        current = get(key)
+        if current is None or value > current:
+            largest[key] = value
+    return largest
+
+
+def grouped_median(keys, values):
+    """Calculate the median of each key's values."""
+    return {key: statistics.median(group) for key, group in group_values(keys, values).items()}
+
+
+def grouped_percentile(keys, values, percentile_rank):
+    """Calculate the value at a given percentile of each key's values."""
+    statistics._check_percentile_rank(percentile_rank)
+    return {key: statistics.percentile(group, percentile_rank)
+            for key, group in group_values(keys, values).items()}
+
+
+def grouped_weighted_mean(keys, values, weights):
+    """Calculate the weighted mean of each key's values."""
+    _check_lengths(keys, values)
+    if len(values) != len(weights):
+        raise ValueError("values and weights must have the same length")
+    # Per key: [total weight, weighted sum]
+    sums = {}
+    get = sums.get
+    for key, value, weight in zip(keys, values, weights):
+        if weight < 0:
+            raise ValueError("Weights must not be negative")
+        state = get(key)
+        if state is None:
+            sums[key] = [weight, value * weight]
+        else:
+            state[0] += weight
+            state[1] += value * weight
+    if any(total_weight <= 0 for total_weight, _ in sums.values()):
+        raise ValueError("Sum of weights must be positive")
+    return {key: total / total_weight for key, (total_weight, total) in sums.items()}
+
+
+def _check_lengths(keys, values):
+    """Validate that keys and values pair up."""
+    if len(keys) != len(values):
+        raise ValueError("keys and values must have the same length")
+
+
+def _running_sums(keys, values):
+    """Accumulate [count, sum] per key in one pass, in order of first appearance."""
+    _check_lengths(keys, values)
+    sums = {}
+    get = sums.get
+    for key, value in zip(keys, values):
+        state = get(key)
+        if state is None:
+            sums[key] = [1, value]
+        else:
+            state[0] += 1
+            state[1] += value
+    return sums
+
+
+def _running_moments(keys, values):
+    """Accumulate [count, mean, M2] per key in one pass with Welford's update."""
+    _check_lengths(keys, values)
+    moments = {}
+    get = moments.get
+    for key, value in zip(keys, values):
+        state = get(key)
+        if state is None:
+            moments[key] = [1, value, 0.0]
+        else:
+            count = state[0] + 1
+            delta = value - state[1]
+            mean = state[1] + delta / count
+            state[0], state[1] = count, mean
+            state[2] += delta * (value - mean)
+    return moments
+
+
+def _sample_variance(state):
+    """Sample variance of one key's [count, mean, M2] accumulator."""
+    count, _, m2 = state
+    if count < 2:
+        raise ValueError("Sample variance requires at least 2 values")
+    return m2 / (count - 1)
@@ -0,0 +1,282 @@
+"""
+Histograms for the Math Calculation Engine.
+Contains fixed-width and custom-edge binning with weights and incremental updates.
+"""
+
+from array import array
+from bisect import bisect_right
+from collections import Counter
+from itertools import accumulate, islice, repeat
+from math import floor
+
+from .vectorized import np
+
+# Values binned together before their bin counts are tallied
+CHUNK_SIZE = 1 << 14
+
+
+def histogram(values, bins):
+    """
+    Count values into bins.
+    
+    Args:
+        values: Numbers to count
+        bins: Number of equal-width bins spanning min(values)..max(values), or a
+            strictly increasing list of bin edges
+    
+    Returns:
+        A Histogram; its counts are an array('q') with one entry per bin
+    """
+    return _histogram_for(values, bins).extend(values)
+
+
+def weighted_histogram(values, weights, bins):
+    """Sum the weights of values into bins (see histogram); counts are an array('d')."""
+    if len(values) != len(weights):
+        raise ValueError("values and weights must have the same length")
+    return _histogram_for(values, bins).extend(values, weights)
+
+
+class Histogram:
+    """
+    Counts (or summed weights) of values in consecutive bins [edge_i, edge_i+1).
+    
+    The last bin also includes its upper edge; values outside the edges are counted
+    in underflow and overflow instead, and NaN is rejected. Histograms made with fixed() locate a value's
+    bin with one subtraction and multiplication; custom edges are searched with
+    bisection. Chunks of a stream can be added with update() and extend(), and
+    histograms with the same bins combine with merge().
+    
+    PERCENTILE and MEDIAN accept a Histogram in place of a list of values and
+    estimate the result by spreading each bin's values evenly across it.
+    """
+
+    __slots__ = ("edges", "counts", "underflow", "overflow", "count", "_low", "_scale")
+
+    # Histograms change as values arrive, so they must never be used as cache keys
+    __hash__ = None
+
+    def __init__(self, edges, values=None):
+        """
+        Create an empty histogram with custom bins.
+        
+        Args:
+            edges: Strictly increasing bin edges; n + 1 edges make n bins
+            values: Optional iterable of numbers to add straight away
+        """
+        edges = [float(edge) for edge in edges]
+        if len(edges) < 2:
+            raise ValueError("Histogram needs at least one bin")
+        if any(a >= b for a, b in zip(edges, edges[1:])):
+            raise ValueError("Bin edges must be strictly increasing")
+        self.edges = edges
+        self.counts = array("q", bytes(8 * (len(edges) - 1)))
+        self.underflow = self.overflow = 0
+        self.count = 0
+        self._low = self._scale = None
+        if values is not None:
+            self.extend(values)
+
+    @classmethod
+    def fixed(cls, low, high, bins, values=None):
+        """Create a histogram of bins equal-width bins spanning low..high, adding any values given."""
+        if not isinstance(bins, int) or bins < 1:
+            raise ValueError("Histogram needs at least one bin")
+        if not low < high:
+            raise ValueError("Bin edges must be strictly increasing")
+        width = (high - low) / bins
+        result = cls([low + i * width for i in range(bins)] + [high])
+        result._low, result._scale = float(low), bins / (high - low)
+        if values is not None:
+            result.extend(values)
+        return result
+
+    def __len__(self):
+        return self.count
+
+    def __repr__(self):
+        return f"Histogram(bins={len(self.counts)}, count={self.count})"
+
+    @property
+    def total(self):
+        """Number (or total weight) of the values inside the edges."""
+        return sum(self.counts)
+
+    def update(self, value, weight=None):
+        """Add one value, with an optional weight."""
+        if weight is None:
+            self._extend_values((value,), None)
+        else:
+            self.extend((value,), (weight,))
+
+    def extend(self, values, weights=None):
+        """
+        Add every value from an iterable, each with the matching weight if weights are given.
+        
+        A NaN raises ValueError; the values before it (none, for a NumPy array) stay added.
+        
+        Returns:
+            The histogram itself
+        """
+        if weights is not None and self.counts.typecode == "q":
+            # Weighted counts are sums of arbitrary numbers, so switch to doubles
+            self.counts = array("d", self.counts)
+        if np is not None and isinstance(values, np.ndarray):
+            self._extend_array(values.ravel(), None if weights is None else np.asarray(weights).ravel())
+            return self
+        if weights is not None:
+            return self._extend_values(values, weights)
+        iterator = iter(values)
+        chunk = list(islice(iterator, CHUNK_SIZE))
+        while chunk:
+            self._extend_chunk(chunk)
+            chunk = list(islice(iterator, CHUNK_SIZE))
+        return self
+
+    def merge(self, other):
+        """
+        Fold another histogram with the same bins into this one.
+        
+        Returns:
+            The histogram itself
+        """
+        if other.edges != self.edges:
+            raise ValueError("Only histograms with the same bins can be merged")
+        if other.counts.typecode == "d" and self.counts.typecode == "q":
+            self.counts = array("d", self.counts)
+        self.counts = array(self.counts.typecode, map(sum, zip(self.counts, other.counts)))
+        self.underflow += other.underflow
+        self.overflow += other.overflow
+        self.count += other.count
+        return self
+
+    def quantile(self, q):
+        """Estimate the value below which a fraction q of the values inside the edges fall (0 <= q <= 1)."""
+        if not 0 <= q <= 1:
+            raise ValueError("Quantile must be between 0 and 1")
+        return self.value_at_rank(q * max(self.total - 1, 0))
+
+    def value_at_rank(self, rank):
+        """
+        Estimate the value at a fractional 0-based position of the sorted values inside the edges.
+        
+        The values of a bin are taken to sit evenly spaced across it, the k-th of n
+        at the centre of the k-th of n equal slices.
+        """
+        cumulative = list(accumulate(self.counts))
+        if not cumulative[-1]:
+            raise ValueError("Cannot calculate quantile of empty histogram")
+        i = min(bisect_right(cumulative, rank), len(cumulative) - 1)
+        count = self.counts[i]
+        position = (rank - (cumulative[i] - count) + 0.5) / count
+        low, high = self.edges[i], self.edges[i + 1]
+        return low + min(max(position, 0.0), 1.0) * (high - low)
+
+    def _extend_chunk(self, chunk):
+        """Count a list of values with C-level passes: locate every bin, then tally the bins."""
+        bins, high = len(self.counts), self.edges[-1]
+        if self._scale is not None:
+            low, scale = self._low, self._scale
+            try:
+                located = Counter(map(floor, [(x - low) * scale for x in chunk]))
+            except (ValueError, OverflowError):
+                # NaN and infinities have no bin index, so count this chunk value by value
+                # (which also rejects NaN)
+                return self._extend_values(chunk, None)
+            # Rounding can put values at the upper edge one bin past the end (or values just
+            # above it into the last bin), so the overflow is recounted exactly
+            past = sum(occurrences for index, occurrences in located.items() if index >= bins)
+            if past:
+                above = sum(1 for x in chunk if x > high)
+                located = {index: occurrences for index, occurrences in located.items() if index < bins}
+                located[bins - 1] = located.get(bins - 1, 0) + past - above
+                located[bins] = above
+        else:
+            located = Counter(map(bisect_right, repeat(self.edges), chunk))
+            located = {index - 1: occurrences for index, occurrences in located.items()}
+            if bins in located:
+                if any(x != x for x in chunk):
+                    # NaN sorts past every edge, so the value-by-value path rejects it
+                    return self._extend_values(chunk, None)
+                # The last bin is closed, so values equal to the last edge belong to it
+                at_high = chunk.count(high)
+                located[bins - 1] = located.get(bins - 1, 0) + at_high
+                located[bins] -= at_high
+
+        counts = self.counts
+        for index, occurrences in located.items():
+            if index < 0:
+                self.underflow += occurrences
+            elif index < bins:
+                counts[index] += occurrences
+            else:
+                self.overflow += occurrences
+        self.count += len(chunk)
+
+    def _extend_values(self, values, weights):
+        """Add values one by one, each with the matching weight if weights are given."""
+        counts, edges = self.counts, self.edges
+        last = len(counts) - 1
+        low, high = edges[0], edges[-1]
+        scale = self._scale
+        underflow = overflow = seen = 0
+        invalid = False
+        for value, weight in zip(values, repeat(1) if weights is None else weights):
+            if low <= value <= high:
+                if scale is not None:
+                    i = int((value - low) * scale)
+                else:
+                    i = bisect_right(edges, value) - 1
+                counts[i if i < last else last] += weight
+            elif value < low:
+                underflow += weight
+            elif value > high:
+                overflow += weight
+            else:
+                # Only NaN compares false with both edges
+                invalid = True
+                break
+            seen += 1
+        self.underflow += underflow
+        self.overflow += overflow
+        self.count += seen
+        if invalid:
+            raise ValueError("Cannot bin NaN values")
+        return self
+
+    def _extend_array(self, values, weights):
+        """Bin a one-dimensional NumPy array with one vectorized pass."""
+        if np.isnan(values).any():
+            raise ValueError("Cannot bin NaN values")
+        edges = np.asarray(self.edges)
+        inside = (values >= edges[0]) & (values <= edges[-1])
+        if self._scale is not None:
+            indices = ((values[inside] - self._low) * self._scale).astype(np.int64)
+        else:
+            indices = np.searchsorted(edges, values[inside], side="right") - 1
+        np.minimum(indices, len(self.counts) - 1, out=indices)
+        below = values < edges[0]
+        if weights is None:
+            binned = np.bincount(indices, minlength=len(self.counts)).tolist()
+            self.underflow += int(below.sum())
+            self.overflow += int(len(values) - inside.sum() - below.sum())
+        else:
+            binned = np.bincount(indices, weights=weights[inside], minlength=len(self.counts)).tolist()
+            self.underflow += float(weights[below].sum())
+            self.overflow += float(weights[~inside & ~below].sum())
+        self.counts = array(self.counts.typecode, map(sum, zip(self.counts, binned)))
+        self.count += len(values)
+
+
+def _histogram_for(values, bins):
+    """Create the empty histogram that HISTOGRAM's bins argument describes."""
+    if isinstance(bins, int):
+        if not len(values):
+            raise ValueError("Cannot calculate histogram of empty list")
+        low, high = min(values), max(values)
+        if low == high:
+            # Like NumPy, centre a unit-wide range on a constant input
+            low, high = low - 0.5, high + 0.5
+        return Histogram.fixed(low, high, bins)
+    return Histogram(bins)
+
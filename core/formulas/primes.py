@@ -0,0 +1,166 @@
+"""
+Prime number generation and counting for the Math Calculation Engine.
+Contains a segmented Sieve of Eratosthenes and the operations built on it.
+"""
+
+import math
+from array import array
+
+# Odd numbers per sieve segment: one byte each, so every segment uses 256 KB
+# however large the range is
+SEGMENT_SIZE = 1 << 18
+
+# Odd numbers below this are answered from a sieve built once and cached
+SIEVE_CACHE_LIMIT = 1 << 21
+
+# Ranges narrower than sqrt(stop) / NARROW_RANGE_RATIO are tested value by value with
+# is_prime (a few microseconds each), which is cheaper than sieving the base primes
+# up to sqrt(stop) (tens of nanoseconds per number)
+NARROW_RANGE_RATIO = 128
+
+_sieve_cache = None
+
+
+def primes_in_range(start, stop):
+    """List the primes p with start <= p < stop."""
+    _check_bounds(start, stop)
+    return list(iter_primes(start, stop))
+
+
+def prime_count(n):
+    """Count the primes less than or equal to n."""
+    if not isinstance(n, int):
+        raise ValueError("Prime count is only defined for integers")
+    if n < 2:
+        return 0
+    return 1 + sum(flags.count(1) for _, flags in _odd_segments(3, n + 1))
+
+
+def nth_prime(n):
+    """Find the nth prime, counting 2 as the first."""
+    if not isinstance(n, int):
+        raise ValueError("Nth prime is only defined for integers")
+    if n < 1:
+        raise ValueError("Prime index must be at least 1")
+    if n == 1:
+        return 2
+    
+    # Rosser's bound: p_n < n (ln n + ln ln n) for n >= 6
+    bound = 15 if n < 6 else int(n * (math.log(n) + math.log(math.log(n)))) + 1
+    remaining = n - 1  # 2 is not in the odd segments
+    for low, flags in _odd_segments(3, bound + 1):
+        found = flags.count(1)
+        if found < remaining:
+            remaining -= found
+            continue
+        index = -1
+        for _ in range(remaining):
+            index = flags.find(1, index + 1)
+        return low + 2 * index
+    raise AssertionError("nth prime exceeded its upper bound")
+
+
+def iter_primes(start, stop):
+    """
+    Generate the primes p with start <= p < stop in increasing order, segment by segment.
+    
+    Ranges far narrower than sqrt(stop), such as a few values near 2**62, are tested
+    value by value instead, so no base primes are sieved for them.
+    """
+    if start <= 2 < stop:
+        yield 2
+    if ((stop - start) * NARROW_RANGE_RATIO) ** 2 < stop:
+        # arithmetic imports this module, so is_prime can only be imported on use
+        from .arithmetic import is_prime
+        yield from filter(is_prime, range(max(start, 3) | 1, stop, 2))
+        return
+    for low, flags in _odd_segments(start, stop):
+        index = flags.find(1)
+        while index != -1:
+            yield low + 2 * index
+            index = flags.find(1, index + 1)
+
+
+def primes_up_to(n):
+    """List the primes <= n."""
+    return list(iter_primes(2, n + 1))
+
+
+def is_small_prime(n):
+    """Check an integer 0 <= n < SIEVE_CACHE_LIMIT against the cached sieve."""
+    global _sieve_cache
+    if n % 2 == 0:
+        return n == 2
+    if _sieve_cache is None:
+        _sieve_cache = b"".join(flags for _, flags in _odd_segments(1, SIEVE_CACHE_LIMIT))
+    return _sieve_cache[n // 2] == 1
+
+
+def _check_bounds(start, stop):
+    """Validate the bounds of a prime range."""
+    if not isinstance(start, int) or not isinstance(stop, int):
+        raise ValueError("Prime range bounds must be integers")
+    if start < 0 or stop < 0:
+        raise ValueError("Prime range bounds must be non-negative")
+
+
+def _odd_segments(start, stop, segment_size=SEGMENT_SIZE):
+    """
+    Sieve the odd numbers in [start, stop) one bounded segment at a time.
+    
+    Yields:
+        (low, flags) pairs where low is odd and flags[i] is 1 if low + 2i is prime
+        and 0 otherwise
+    """
+    low = max(start, 1) | 1
+    if low >= stop:
+        return
+    base_primes = _odd_base_primes(_isqrt(stop - 1))
+    
+    while low < stop:
+        high = min(low + 2 * segment_size, stop)
+        count = (high - low + 1) // 2
+        flags = bytearray(b"\x01") * count
+        if low == 1:
+            flags[0] = 0
+        for p in base_primes:
+            square = p * p
+            if square >= high:
+                break
+            # First odd multiple of p in the segment, not below p*p
+            first = max(square, (low + p - 1) // p * p)
+            if first % 2 == 0:
+                first += p
+            index = (first - low) // 2
+            if index < count:
+                # Odd multiples of p are 2p apart, i.e. p flags apart
+                flags[index::p] = bytes(len(range(index, count, p)))
+        yield low, flags
+        low = high
+
+
+def _odd_base_primes(limit):
+    """
+    Collect the odd primes <= limit into an array('q').
+    
+    They are sieved in bounded segments themselves (recursing on sqrt(limit)), and
+    the array holds 8 bytes per prime rather than a boxed int each.
+    """
+    primes = array("q")
+    for low, flags in _odd_segments(3, limit + 1):
+        index = flags.find(1)
+        while index != -1:
+            primes.append(low + 2 * index)
+            index = flags.find(1, index + 1)
+    return primes
+
+
+def _isqrt(n):
+    """Calculate floor(sqrt(n)) exactly for a non-negative integer n."""
+    root = int(math.sqrt(n))
+    # The float square root of a large n can be off by a few units either way
+    while root * root > n:
+        root -= 1
+    while (root + 1) * (root + 1) <= n:
+        root += 1
+    return root
@@ -0,0 +1,165 @@
+"""
+Rolling-window statistics for the Math Calculation Engine.
+Contains moving mean, variance, median, percentile, min and max computed incrementally.
+"""
+
+import math
+from array import array
+from bisect import bisect_left, insort
+from collections import deque
+from itertools import islice
+from operator import lt, gt
+
+from .statistics import _median_sorted, _percentile_sorted, _check_percentile_rank
+
+
+def rolling_mean(values, window):
+    """
+    Calculate the mean of every window of consecutive values.
+    
+    Like every rolling operation, values may be any iterable (it is read once) and
+    the result is an array('d') with one entry per full window.
+    """
+    return _column(_means, values, window)
+
+
+def rolling_variance_sample(values, window):
+    """Calculate the sample variance of every window of consecutive values."""
+    _check_sample_window(window)
+    return _column(_variances, values, window)
+
+
+def rolling_standard_deviation_sample(values, window):
+    """Calculate the sample standard deviation of every window of consecutive values."""
+    _check_sample_window(window)
+    return array("d", map(math.sqrt, _variances(iter(values), window)))
+
+
+def rolling_median(values, window):
+    """Calculate the median of every window of consecutive values."""
+    return _column(_order_statistics, values, window, _median_sorted)
+
+
+def rolling_percentile(values, window, percentile_rank):
+    """Calculate the value at a percentile of every window of consecutive values."""
+    _check_percentile_rank(percentile_rank)
+    return _column(_order_statistics, values, window,
+                   lambda ordered: _percentile_sorted(ordered, percentile_rank))
+
+
+def rolling_min(values, window):
+    """Calculate the smallest value of every window of consecutive values."""
+    return _column(_extremes, values, window, lt)
+
+
+def rolling_max(values, window):
+    """Calculate the largest value of every window of consecutive values."""
+    return _column(_extremes, values, window, gt)
+
+
+def _check_window(window):
+    """Validate a window length."""
+    if not isinstance(window, int) or window < 1:
+        raise ValueError("Window must be a positive integer")
+
+
+def _check_sample_window(window):
+    """Validate a window length for the sample statistics."""
+    _check_window(window)
+    if window < 2:
+        raise ValueError("Sample variance requires a window of at least 2 values")
+
+
+def _column(generator, values, window, *args):
+    """Run a window generator over values and collect its output as a float array."""
+    _check_window(window)
+    return array("d", generator(iter(values), window, *args))
+
+
+def _means(iterator, window):
+    """Yield window means, adding the new value and removing the old one at each step."""
+    buffer = deque(islice(iterator, window))
+    if len(buffer) < window:
+        return
+    total = math.fsum(buffer)
+    yield total / window
+    steps = 0
+    for value in iterator:
+        old = buffer.popleft()
+        buffer.append(value)
+        steps += 1
+        if steps == window:
+            # Resumming once per window keeps rounding drift bounded at O(1) amortized cost
+            total = math.fsum(buffer)
+            steps = 0
+        else:
+            total += value - old
+        yield total / window
+
+
+def _variances(iterator, window):
+    """Yield window sample variances with Welford's add/remove update."""
+    buffer = deque(islice(iterator, window))
+    if len(buffer) < window:
+        return
+    mean, m2 = _mean_and_m2(buffer)
+    yield m2 / (window - 1)
+    steps = 0
+    for value in iterator:
+        old = buffer.popleft()
+        buffer.append(value)
+        steps += 1
+        if steps == window:
+            mean, m2 = _mean_and_m2(buffer)
+            steps = 0
+        else:
+            # Replacing old by value moves the mean by delta / window
+            delta = value - old
+            new_mean = mean + delta / window
+            m2 += delta * (value - new_mean + old - mean)
+            mean = new_mean
+        yield max(m2, 0.0) / (window - 1)
+
+
+def _mean_and_m2(values):
+    """Mean and sum of squared deviations of a window, computed from scratch."""
+    mean = math.fsum(values) / len(values)
+    return mean, math.fsum((x - mean) ** 2 for x in values)
+
+
+def _order_statistics(iterator, window, statistic):
+    """
+    Yield statistic(sorted window), keeping the window in a sorted list.
+    
+    Each step is two bisections plus one insertion and one deletion, which shift
+    at most window pointers in C; no window is ever sorted again.
+    """
+    buffer = deque(islice(iterator, window))
+    if len(buffer) < window:
+        return
+    ordered = sorted(buffer)
+    yield statistic(ordered)
+    for value in iterator:
+        old = buffer.popleft()
+        buffer.append(value)
+        del ordered[bisect_left(ordered, old)]
+        insort(ordered, value)
+        yield statistic(ordered)
+
+
+def _extremes(iterator, window, keep):
+    """
+    Yield window minima (keep=lt) or maxima (keep=gt) with a monotonic deque.
+    
+    The deque holds (index, value) pairs of the values that can still become the
+    extreme of a later window; every value is pushed and popped at most once.
+    """
+    candidates = deque()
+    for index, value in enumerate(iterator):
+        while candidates and not keep(candidates[-1][1], value):
+            candidates.pop()
+        candidates.append((index, value))
+        if candidates[0][0] <= index - window:
+            candidates.popleft()
+        if index >= window - 1:
+            yield candidates[0][1]
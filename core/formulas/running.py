@@ -0,0 +1,291 @@
+"""
+Streaming statistics for the Math Calculation Engine.
+Contains a single-pass accumulator that can be fed in chunks and merged across shards.
+"""
+
+import math
+from array import array
+from itertools import islice
+from operator import mul
+
+from .sources import Float64Source
+from .vectorized import np
+
+# Values taken from an iterator at a time
+CHUNK_SIZE = 4096
+
+# NumPy elements reduced at a time, bounding the temporary deviations array to 2 MB
+ARRAY_CHUNK_SIZE = 1 << 18
+
+
+class RunningStats:
+    """
+    Single-pass accumulator of count, mean, M2 (the sum of squared deviations), min and max.
+    
+    Values are added one at a time with update() or in bulk with extend(), which
+    reduces each chunk with built-in sums before folding it in. Accumulators built
+    over separate shards combine exactly with merge(), so partial results from
+    parallel workers can be reduced in any order.
+    
+    The MEAN, VARIANCE_*, STANDARD_DEVIATION_* and RANGE_VALUES operations accept
+    a RunningStats in place of a list of values.
+    """
+
+    __slots__ = ("count", "mean", "m2", "min", "max")
+
+    # Accumulators change as values arrive, so they must never be used as cache keys
+    __hash__ = None
+
+    def __init__(self, values=None):
+        """
+        Create an accumulator.
+        
+        Args:
+            values: Optional iterable of numbers to add straight away
+        """
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        if values is not None:
+            self.extend(values)
+
+    def __len__(self):
+        return self.count
+
+    def __repr__(self):
+        return (f"RunningStats(count={self.count}, mean={self.mean}, m2={self.m2}, "
+                f"min={self.min}, max={self.max})")
+
+    def update(self, value):
+        """Add one value (Welford's update)."""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def extend(self, values):
+        """
+        Add every value from a list, array, NumPy array, Float64Source or any iterable.
+        
+        Sequences and arrays are reduced in place and sources one chunk at a time;
+        other iterables are read CHUNK_SIZE values at a time, so they are never held
+        in memory whole.
+        
+        Returns:
+            The accumulator itself
+        """
+        if np is not None and isinstance(values, np.ndarray):
+            values = values.ravel()
+            for start in range(0, len(values), ARRAY_CHUNK_SIZE):
+                self._add_array(values[start:start + ARRAY_CHUNK_SIZE])
+        elif isinstance(values, Float64Source):
+            # Chunks are views of the mapped data, so only one chunk is ever boxed
+            for chunk in values.chunks(ARRAY_CHUNK_SIZE if np is not None else CHUNK_SIZE):
+                if np is not None:
+                    self._add_array(np.frombuffer(chunk))
+                else:
+                    self._add_chunk(chunk)
+        elif isinstance(values, (list, tuple, range, array)):
+            self._add_chunk(values)
+        else:
+            iterator = iter(values)
+            chunk = list(islice(iterator, CHUNK_SIZE))
+            while chunk:
+                self._add_chunk(chunk)
+                chunk = list(islice(iterator, CHUNK_SIZE))
+        return self
+
+    def merge(self, other):
+        """
+        Fold another accumulator into this one (Chan et al.'s pairwise update).
+        
+        Returns:
+            The accumulator itself
+        """
+        self._combine(other.count, other.mean, other.m2, other.min, other.max)
+        return self
+
+    @classmethod
+    def merged(cls, accumulators):
+        """Combine any number of accumulators into a new one, leaving them unchanged."""
+        result = cls()
+        for accumulator in accumulators:
+            result.merge(accumulator)
+        return result
+
+    def _add_chunk(self, chunk):
+        """Reduce a sequence with built-in sums (two passes over the chunk) and fold it in."""
+        count = len(chunk)
+        if not count:
+            return
+        chunk_mean = sum(chunk) / count
+        deviations = [x - chunk_mean for x in chunk]
+        self._combine(count, chunk_mean, sum(map(mul, deviations, deviations)), min(chunk), max(chunk))
+
+    def _add_array(self, chunk):
+        """Reduce a one-dimensional NumPy array and fold it in."""
+        count = len(chunk)
+        if not count:
+            return
+        chunk_mean = float(chunk.mean())
+        deviations = chunk - chunk_mean
+        self._combine(count, chunk_mean, float(np.dot(deviations, deviations)),
+                      chunk.min().item(), chunk.max().item())
+
+    def _combine(self, count, mean, m2, minimum, maximum):
+        """Fold in the summary of another set of values."""
+        if not count:
+            return
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / total
+        self.m2 += m2 + delta * delta * self.count * count / total
+        self.count = total
+        if minimum < self.min:
+            self.min = minimum
+        if maximum > self.max:
+            self.max = maximum
+
+
+class RunningCovariance:
+    """
+    Single-pass accumulator of the means and co-moments of several series observed together.
+    
+    Each observation holds one value per series (a row of a table whose columns
+    are the series). Rows are added one at a time with update() or in bulk with
+    extend(), which centres each chunk once per series before folding it in;
+    accumulators built over separate shards combine exactly with merge().
+    
+    The COVARIANCE_MATRIX and CORRELATION_MATRIX operations accept a
+    RunningCovariance in place of a list of series.
+    """
+
+    __slots__ = ("count", "means", "comoments")
+
+    # Accumulators change as values arrive, so they must never be used as cache keys
+    __hash__ = None
+
+    def __init__(self, observations=None):
+        """
+        Create an accumulator.
+        
+        Args:
+            observations: Optional iterable of rows (or 2-D NumPy array) to add straight away
+        """
+        self.count = 0
+        self.means = []
+        self.comoments = []
+        if observations is not None:
+            self.extend(observations)
+
+    def __len__(self):
+        return self.count
+
+    def __repr__(self):
+        return f"RunningCovariance(count={self.count}, series={len(self.means)})"
+
+    @classmethod
+    def from_series(cls, series):
+        """Build an accumulator from a list of series (one sequence of values per variable)."""
+        result = cls()
+        if np is not None and isinstance(series, np.ndarray):
+            result._add_array(series.T)
+            return result
+        columns = [list(values) for values in series]
+        if len(set(map(len, columns))) > 1:
+            raise ValueError("All series must have the same length")
+        if np is not None:
+            # One matrix product replaces the pairwise Python sums
+            result._add_array(np.array(columns, dtype=float).T)
+        else:
+            result._add_columns(columns)
+        return result
+
+    def update(self, observation):
+        """Add one row, holding one value per series."""
+        self._add_columns([[value] for value in observation])
+
+    def extend(self, observations):
+        """
+        Add every row from an iterable, or every row of a 2-D NumPy array.
+        
+        Returns:
+            The accumulator itself
+        """
+        if np is not None and isinstance(observations, np.ndarray):
+            self._add_array(observations)
+            return self
+        iterator = iter(observations)
+        chunk = list(islice(iterator, CHUNK_SIZE))
+        while chunk:
+            columns = [list(column) for column in zip(*chunk)]
+            if any(len(row) != len(columns) for row in chunk):
+                raise ValueError("All observations must have the same number of values")
+            self._add_columns(columns)
+            chunk = list(islice(iterator, CHUNK_SIZE))
+        return self
+
+    def merge(self, other):
+        """
+        Fold another accumulator into this one.
+        
+        Returns:
+            The accumulator itself
+        """
+        self._combine(other.count, other.means, other.comoments)
+        return self
+
+    def _add_columns(self, columns):
+        """Centre each column once, take every pairwise sum of products and fold them in."""
+        count = len(columns[0]) if columns else 0
+        if not count:
+            return
+        means = [sum(column) / count for column in columns]
+        centered = [[x - column_mean for x in column] for column, column_mean in zip(columns, means)]
+        comoments = [[0.0] * len(columns) for _ in columns]
+        for i, x in enumerate(centered):
+            for j in range(i + 1):
+                comoments[i][j] = comoments[j][i] = sum(map(mul, x, centered[j]))
+        self._combine(count, means, comoments)
+
+    def _add_array(self, observations):
+        """Reduce a 2-D NumPy array of rows in chunks of about ARRAY_CHUNK_SIZE elements."""
+        if observations.ndim != 2:
+            raise ValueError("Observations must form a two-dimensional table")
+        count, width = observations.shape
+        step = max(1, ARRAY_CHUNK_SIZE // max(width, 1))
+        total, means, comoments = 0, np.zeros(width), np.zeros((width, width))
+        for start in range(0, count, step):
+            chunk = observations[start:start + step]
+            chunk_mean = chunk.mean(axis=0)
+            centered = chunk - chunk_mean
+            size = len(chunk)
+            delta = chunk_mean - means
+            comoments += centered.T @ centered + np.outer(delta, delta) * (total * size / (total + size))
+            means += delta * size / (total + size)
+            total += size
+        self._combine(total, means.tolist(), comoments.tolist())
+
+    def _combine(self, count, means, comoments):
+        """Fold in the summary of another set of rows (Chan et al.'s pairwise update)."""
+        if not count:
+            return
+        if not self.count:
+            self.count, self.means, self.comoments = count, list(means), [list(row) for row in comoments]
+            return
+        if len(means) != len(self.means):
+            raise ValueError("All observations must have the same number of values")
+        total = self.count + count
+        weight = self.count * count / total
+        deltas = [other - own for own, other in zip(self.means, means)]
+        for row, other_row, delta_i in zip(self.comoments, comoments, deltas):
+            for j, (other_value, delta_j) in enumerate(zip(other_row, deltas)):
+                row[j] += other_value + delta_i * delta_j * weight
+        self.means = [own + delta * count / total for own, delta in zip(self.means, deltas)]
+        self.count = total
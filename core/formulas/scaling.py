@@ -0,0 +1,121 @@
+"""
+Feature scaling for the Math Calculation Engine.
+Contains standardization, min-max and robust scaling of whole arrays into preallocated buffers.
+"""
+
+import math
+from array import array
+from itertools import islice
+
+from . import statistics
+from .running import RunningStats
+from .vectorized import np
+
+# Values transformed together before they are written to the output buffer
+CHUNK_SIZE = 1 << 14
+
+
+def standardize(values, out=None):
+    """
+    Rescale values to zero mean and unit population standard deviation (z-scores).
+    
+    The mean and deviation come from one RunningStats pass, which reduces chunks with
+    built-in sums; a second pass writes (x - mean) / deviation straight into out, so
+    no temporary list of centered values is built.
+    
+    Args:
+        values: Numbers to rescale (list, array, NumPy array or Float64Source)
+        out: Optional writable float64 buffer of len(values) doubles, such as an
+            array('d') or NumPy array, to write the results to
+    
+    Returns:
+        Dictionary of the rescaled "values" (out, if given) and the fitted "mean"
+        and "standard_deviation"; RESCALE applies the same fit to later batches
+    """
+    if not len(values):
+        raise ValueError("Cannot scale empty list")
+    # An iterator makes RunningStats reduce a list in bounded chunks, not one whole-list copy
+    stats = RunningStats(iter(values) if isinstance(values, (list, tuple, array)) else values)
+    center, deviation = stats.mean, math.sqrt(stats.m2 / stats.count)
+    if deviation <= 0:
+        raise ValueError("Standard deviation must be positive")
+    return {"values": rescale(values, center, deviation, out), "mean": center, "standard_deviation": deviation}
+
+
+def min_max_scale(values, out=None):
+    """
+    Rescale values linearly onto 0..1, the minimum to 0 and the maximum to 1.
+    
+    Returns:
+        Dictionary of the rescaled "values" and the fitted "min" and "max"
+        (see standardize for the arguments)
+    """
+    if not len(values):
+        raise ValueError("Cannot scale empty list")
+    if np is not None and isinstance(values, np.ndarray):
+        low, high = values.min().item(), values.max().item()
+    else:
+        low, high = min(values), max(values)
+    if not low < high:
+        raise ValueError("Range must be positive")
+    return {"values": rescale(values, low, high - low, out), "min": low, "max": high}
+
+
+def robust_scale(values, out=None):
+    """
+    Rescale values by their median and interquartile range, which outliers barely move.
+    
+    Returns:
+        Dictionary of the rescaled "values" and the fitted "median" and
+        "interquartile_range" (see standardize for the arguments)
+    """
+    if not len(values):
+        raise ValueError("Cannot scale empty list")
+    if np is not None and isinstance(values, np.ndarray):
+        order = np.sort(values, axis=None).tolist()
+    else:
+        # One sort (or selection, for long lists) serves all three order statistics
+        order = statistics._order_statistics(values)
+    median = statistics._median_sorted(order)
+    spread = statistics._quartile_3_sorted(order) - statistics._quartile_1_sorted(order)
+    if spread <= 0:
+        raise ValueError("Interquartile range must be positive")
+    return {"values": rescale(values, median, spread, out), "median": median, "interquartile_range": spread}
+
+
+def rescale(values, center, scale, out=None):
+    """
+    Calculate (value - center) / scale for every value in one pass.
+    
+    Args:
+        values: Numbers to rescale (list, array, NumPy array or Float64Source)
+        center: Value subtracted from each value
+        scale: Divisor applied after centering
+        out: Optional writable float64 buffer of len(values) doubles
+    
+    Returns:
+        out, or a new array('d') (NumPy array for NumPy input) of the results
+    """
+    if scale == 0:
+        raise ValueError("Scale must not be zero")
+    is_array = np is not None and isinstance(values, np.ndarray)
+    count = values.size if is_array else len(values)
+    if out is None:
+        out = np.empty(values.shape) if is_array else array("d", [0.0]) * count
+    view = memoryview(out)
+    if view.format != "d" or view.nbytes != 8 * count:
+        view.release()
+        raise ValueError("out must be a float64 buffer with one slot per value")
+    with view, view.cast("B").cast("d") as flat:
+        if is_array:
+            target = np.frombuffer(flat)
+            np.subtract(values.ravel(), center, out=target)
+            np.divide(target, scale, out=target)
+            del target
+        else:
+            # Chunks bound the temporary list to CHUNK_SIZE values, whatever the input size
+            iterator = iter(values)
+            for start in range(0, count, CHUNK_SIZE):
+                flat[start:start + CHUNK_SIZE] = array("d", [(x - center) / scale
+                                                             for x in islice(iterator, CHUNK_SIZE)])
+    return out
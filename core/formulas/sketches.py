@@ -0,0 +1,243 @@
+"""
+Approximate quantile sketches for the Math Calculation Engine.
+Contains a merging t-digest that summarizes a stream in bounded memory.
+"""
+
+import math
+import struct
+import sys
+from array import array
+from bisect import bisect_right
+from itertools import accumulate, islice
+from operator import mul
+
+# Values buffered before they are merged into the centroids, per unit of compression
+_BUFFER_FACTOR = 20
+
+# Serialized header: magic, compression, count, min, max, number of centroids
+_HEADER = struct.Struct("<4sdqddI")
+_MAGIC = b"TDG1"
+
+
+class TDigest:
+    """
+    Merging t-digest (Dunning) for approximate quantiles of a stream.
+    
+    The values are summarized by at most about compression centroids (mean, weight).
+    Centroids near the tails are kept small, so extreme quantiles such as p99 and
+    p99.9 stay accurate; larger compression means more centroids and smaller error.
+    Memory does not grow with the number of values added.
+    
+    Sketches built over separate shards combine with merge(), and to_bytes() and
+    from_bytes() ship them between processes. The PERCENTILE, MEDIAN, QUARTILE_*
+    and INTERQUARTILE_RANGE operations accept a TDigest in place of a list of values.
+    """
+
+    __slots__ = ("compression", "count", "min", "max", "_means", "_weights", "_centers", "_buffer")
+
+    # Sketches change as values arrive, so they must never be used as cache keys
+    __hash__ = None
+
+    def __init__(self, compression=100, values=None):
+        """
+        Create an empty sketch.
+        
+        Args:
+            compression: Accuracy parameter; roughly the number of centroids kept
+            values: Optional iterable of numbers to add straight away
+        """
+        if compression < 20:
+            raise ValueError("Sketch compression must be at least 20")
+        self.compression = float(compression)
+        self.count = 0
+        self.min = math.inf
+        self.max = -math.inf
+        self._means = []
+        self._weights = []
+        self._centers = []
+        self._buffer = []
+        if values is not None:
+            self.extend(values)
+
+    def __len__(self):
+        return self.count
+
+    def __repr__(self):
+        return f"TDigest(compression={self.compression:g}, count={self.count}, centroids={len(self._means)})"
+
+    def update(self, value):
+        """Add one value."""
+        self._buffer.append(value)
+        self.count += 1
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        if len(self._buffer) >= _BUFFER_FACTOR * self.compression:
+            self._compress()
+
+    def extend(self, values):
+        """
+        Add every value from an iterable, a buffer's worth at a time.
+        
+        Returns:
+            The sketch itself
+        """
+        iterator = iter(values)
+        capacity = int(_BUFFER_FACTOR * self.compression)
+        while True:
+            chunk = list(islice(iterator, capacity - len(self._buffer)))
+            if not chunk:
+                return self
+            self._buffer.extend(chunk)
+            self.count += len(chunk)
+            self.min = min(self.min, min(chunk))
+            self.max = max(self.max, max(chunk))
+            if len(self._buffer) >= capacity:
+                self._compress()
+
+    def merge(self, other):
+        """
+        Fold another sketch into this one.
+        
+        Returns:
+            The sketch itself
+        """
+        other._compress()
+        self.count += other.count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._compress(other._means, other._weights)
+        return self
+
+    def quantile(self, q):
+        """Estimate the value below which a fraction q of the values fall (0 <= q <= 1)."""
+        if not 0 <= q <= 1:
+            raise ValueError("Quantile must be between 0 and 1")
+        return self.value_at_rank(q * (self.count - 1))
+
+    def value_at_rank(self, rank):
+        """
+        Estimate the value at a fractional 0-based position of the sorted values.
+        
+        This is the position that PERCENTILE and QUARTILE_* interpolate at; while no
+        values have been merged into larger centroids, the estimate is exact.
+        """
+        if not self.count:
+            raise ValueError("Cannot calculate quantile of empty sketch")
+        self._compress()
+        if rank <= 0:
+            return self.min
+        if rank >= self.count - 1:
+            return self.max
+
+        # Interpolate between centroid centres, with the exact min and max at the ends
+        means, centers = self._means, self._centers
+        i = bisect_right(centers, rank)
+        if i == 0:
+            return _interpolate(rank, -0.5, self.min, centers[0], means[0])
+        if i == len(centers):
+            return _interpolate(rank, centers[-1], means[-1], self.count - 0.5, self.max)
+        return _interpolate(rank, centers[i - 1], means[i - 1], centers[i], means[i])
+
+    def centroids(self):
+        """List the (mean, weight) centroids in increasing order of mean."""
+        self._compress()
+        return list(zip(self._means, self._weights))
+
+    def to_bytes(self):
+        """Serialize the sketch as a compact little-endian byte string."""
+        self._compress()
+        means, weights = array("d", self._means), array("d", self._weights)
+        if sys.byteorder == "big":
+            means.byteswap()
+            weights.byteswap()
+        header = _HEADER.pack(_MAGIC, self.compression, self.count, self.min, self.max, len(means))
+        return header + means.tobytes() + weights.tobytes()
+
+    @classmethod
+    def from_bytes(cls, data):
+        """Rebuild a sketch from the output of to_bytes()."""
+        try:
+            magic, compression, count, minimum, maximum, size = _HEADER.unpack_from(data)
+        except struct.error:
+            raise ValueError("Invalid t-digest data") from None
+        if magic != _MAGIC or len(data) != _HEADER.size + 16 * size:
+            raise ValueError("Invalid t-digest data")
+        means, weights = array("d"), array("d")
+        means.frombytes(data[_HEADER.size:_HEADER.size + 8 * size])
+        weights.frombytes(data[_HEADER.size + 8 * size:])
+        if sys.byteorder == "big":
+            means.byteswap()
+            weights.byteswap()
+
+        sketch = cls(compression)
+        sketch.count, sketch.min, sketch.max = count, minimum, maximum
+        sketch._means, sketch._weights = means.tolist(), weights.tolist()
+        sketch._centers = _centers(sketch._weights)
+        return sketch
+
+    def _compress(self, extra_means=(), extra_weights=()):
+        """Merge the buffered values (and any extra centroids) into the centroid list."""
+        if not self._buffer and not extra_means:
+            return
+        # Sort the buffer on its own (plain floats sort fastest), then insert the few
+        # centroids into it from the largest down so earlier insertion points stay valid
+        means = self._buffer
+        means.sort()
+        weights = [1.0] * len(means)
+        self._buffer = []
+        centroids = sorted(zip(self._means + list(extra_means), self._weights + list(extra_weights)))
+        for mean, weight in reversed(centroids):
+            i = bisect_right(means, mean)
+            means.insert(i, mean)
+            weights.insert(i, weight)
+        
+        # Prefix sums let each new centroid be cut out with one bisection instead of
+        # a Python-level step per merged value
+        cumulative = list(accumulate(weights))
+        cumulative_moment = list(accumulate(map(mul, weights, means)))
+        total = cumulative[-1]
+        new_means, new_weights = [], []
+        start, before = 0, 0.0
+        while start < len(means):
+            # Largest weight the next centroid may take under the k1 scale function
+            limit = total * self._q_from_k(self._k_from_q(before / total) + 1)
+            end = max(bisect_right(cumulative, limit, start), start + 1)
+            if end == start + 1:
+                new_means.append(means[start])
+                new_weights.append(weights[start])
+            else:
+                weight = cumulative[end - 1] - before
+                moment = cumulative_moment[end - 1] - (cumulative_moment[start - 1] if start else 0.0)
+                new_means.append(moment / weight)
+                new_weights.append(weight)
+            before = cumulative[end - 1]
+            start = end
+        self._means, self._weights = new_means, new_weights
+        self._centers = _centers(new_weights)
+
+    def _k_from_q(self, q):
+        """Scale function k1: map a quantile to the centroid index scale."""
+        return self.compression / (2 * math.pi) * math.asin(2 * min(max(q, 0.0), 1.0) - 1)
+
+    def _q_from_k(self, k):
+        """Inverse of _k_from_q."""
+        if k >= self.compression / 4:
+            return 1.0
+        return (math.sin(k * 2 * math.pi / self.compression) + 1) / 2
+
+
+def _centers(weights):
+    """
+    Ranks of the centroids' centres: a centroid of weight w after c values is centred
+    on rank c + (w - 1) / 2, so single values sit exactly on their own rank.
+    """
+    return [cumulative - (weight + 1) / 2 for cumulative, weight in zip(accumulate(weights), weights)]
+
+
+def _interpolate(x, x0, y0, x1, y1):
+    """Linear interpolation between (x0, y0) and (x1, y1)."""
+    if x1 == x0:
+        return y0
+    return y0 + (x - x0) / (x1 - x0) * (y1 - y0)
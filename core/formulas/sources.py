@@ -0,0 +1,99 @@
+"""
+Out-of-core data sources for the Math Calculation Engine.
+Contains a float64 view over memory-mapped files and buffer-protocol objects.
+"""
+
+import mmap
+import os
+
+# Values per chunk handed out by Float64Source.chunks() (512 KB of doubles)
+CHUNK_SIZE = 1 << 16
+
+_ITEM_SIZE = 8
+
+
+class Float64Source:
+    """
+    Read-only sequence of native-endian float64 values, read zero-copy in chunks.
+    
+    The data is either a file path, which is memory-mapped, or any object supporting
+    the buffer protocol (bytes, bytearray, mmap, array('d'), memoryview, NumPy arrays).
+    chunks() yields memoryview slices of the underlying buffer, so no value is boxed
+    or copied until a consumer reads it and peak memory does not grow with the data.
+    
+    MEAN, VARIANCE_*, STANDARD_DEVIATION_* and RANGE_VALUES accept a Float64Source in
+    place of a list of values and reduce it chunk by chunk; RunningStats, TDigest and
+    the rolling and frequency operations accept one as an iterable.
+    """
+
+    __slots__ = ("_file", "_map", "_view")
+
+    # Sources read buffers that can change underneath them, so they must never be used as cache keys
+    __hash__ = None
+
+    def __init__(self, data, offset=0):
+        """
+        Open a source.
+        
+        Args:
+            data: Path of a binary file of doubles, or a buffer-protocol object
+            offset: Number of leading bytes (such as a header) to skip
+        """
+        self._file = self._map = None
+        if isinstance(data, (str, os.PathLike)):
+            self._file = open(data, "rb")
+            if os.fstat(self._file.fileno()).st_size:
+                self._map = data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                # mmap refuses empty files, which are simply an empty source
+                data = b""
+        view = memoryview(data).cast("B")[offset:]
+        if len(view) % _ITEM_SIZE:
+            view.release()
+            self.close()
+            raise ValueError("Data size is not a multiple of 8 bytes")
+        self._view = view.cast("d")
+
+    def __len__(self):
+        return len(self._view)
+
+    def __repr__(self):
+        return f"Float64Source(count={len(self)})"
+
+    def __iter__(self):
+        for chunk in self.chunks():
+            yield from chunk
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def chunks(self, size=CHUNK_SIZE):
+        """Yield consecutive memoryview slices of at most size values each."""
+        view = self._view
+        for start in range(0, len(view), size):
+            yield view[start:start + size]
+
+    def close(self):
+        """
+        Release the buffer and close the mapped file, if any.
+        
+        Chunks still in use keep the mapping readable; it is unmapped once the last
+        of them is released.
+        """
+        try:
+            if getattr(self, "_view", None) is not None:
+                self._view.release()
+        finally:
+            mapped, file = self._map, self._file
+            self._file = self._map = None
+            if file is not None:
+                file.close()
+            if mapped is not None:
+                try:
+                    mapped.close()
+                except BufferError:
+                    # A live chunk still exports the mapping, which then closes with it
+                    pass
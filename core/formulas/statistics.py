@@ -4,13 +4,36 @@ Contains measures of central tendency, dispersion, and probability distributions
 """
 
 import math
+import random
+from array import array
+from bisect import bisect_right
+from collections import Counter
+from itertools import accumulate, repeat
+from operator import lt, mul
 from typing import List
 
+from .frequency import MisraGries, CountMinSketch
+from .histogram import Histogram
+from .running import RunningStats, RunningCovariance
+from .sketches import TDigest
+from .sources import Float64Source
+
+# From this many values on, single order statistics are found by selection
+# instead of a full sort (see benchmark.py selection for the crossover)
+SELECTION_THRESHOLD = 10000
+
+# Private generator for selection samples, so the global random state is untouched
+_sampler = random.Random()
+
 
 def mean(values: List[float]):
     """Calculate arithmetic mean (average)."""
     if not values:
         raise ValueError("Cannot calculate mean of empty list")
+    if isinstance(values, Float64Source):
+        values = RunningStats(values)
+    if isinstance(values, RunningStats):
+        return values.mean
     return sum(values) / len(values)
 
 
@@ -18,31 +41,38 @@ def median(values: List[float]):
     """Calculate median (middle value)."""
     if not values:
         raise ValueError("Cannot calculate median of empty list")
-    
-    sorted_values = sorted(values)
-    n = len(sorted_values)
-    
-    if n % 2 == 0:
-        # Even number of values - average of two middle values
-        return (sorted_values[n//2 - 1] + sorted_values[n//2]) / 2
-    else:
-        # Odd number of values - middle value
-        return sorted_values[n//2]
+    if isinstance(values, TDigest):
+        return values.value_at_rank((len(values) - 1) / 2)
+    if isinstance(values, Histogram):
+        return values.quantile(0.5)
+    return _median_sorted(_order_statistics(values))
 
 
 def mode(values: List[float]):
-    """Calculate mode (most frequent value)."""
+    """
+    Calculate mode (most frequent value).
+    
+    Accepts a collections.Counter of value counts (exact, and mergeable with +)
+    or a MisraGries / CountMinSketch summary, whose modes are the values with
+    the largest estimated count.
+    """
     if not values:
         raise ValueError("Cannot calculate mode of empty list")
-    
-    frequency = {}
-    for value in values:
-        frequency[value] = frequency.get(value, 0) + 1
+    if isinstance(values, (MisraGries, CountMinSketch)):
+        frequency = dict(values.top(None))
+        if not frequency:
+            # A summary whose counters all cancelled out holds no candidate at all
+            raise ValueError("No mode found - no value occurs often enough to be kept")
+    elif isinstance(values, Counter):
+        frequency = values
+    else:
+        frequency = Counter(values)
     
     max_frequency = max(frequency.values())
     modes = [value for value, freq in frequency.items() if freq == max_frequency]
     
-    if len(modes) == len(set(values)):
+    # Every distinct value is a key, so the tie check needs no second pass over values
+    if len(modes) == len(frequency) and not isinstance(values, (MisraGries, CountMinSketch)):
         raise ValueError("No mode found - all values appear equally")
     
     return modes[0] if len(modes) == 1 else modes
@@ -52,6 +82,10 @@ def variance_population(values: List[float]):
     """Calculate population variance."""
     if not values:
         raise ValueError("Cannot calculate variance of empty list")
+    if isinstance(values, Float64Source):
+        values = RunningStats(values)
+    if isinstance(values, RunningStats):
+        return values.m2 / len(values)
     
     mean_val = mean(values)
     return sum((x - mean_val) ** 2 for x in values) / len(values)
@@ -61,6 +95,10 @@ def variance_sample(values: List[float]):
     """Calculate sample variance."""
     if len(values) < 2:
         raise ValueError("Sample variance requires at least 2 values")
+    if isinstance(values, Float64Source):
+        values = RunningStats(values)
+    if isinstance(values, RunningStats):
+        return values.m2 / (len(values) - 1)
     
     mean_val = mean(values)
     return sum((x - mean_val) ** 2 for x in values) / (len(values) - 1)
@@ -80,6 +118,10 @@ def range_values(values: List[float]):
     """Calculate range (max - min)."""
     if not values:
         raise ValueError("Cannot calculate range of empty list")
+    if isinstance(values, Float64Source):
+        values = RunningStats(values)
+    if isinstance(values, RunningStats):
+        return values.max - values.min
     return max(values) - min(values)
 
 
@@ -87,51 +129,28 @@ def quartile_1(values: List[float]):
     """Calculate first quartile (Q1)."""
     if not values:
         raise ValueError("Cannot calculate quartile of empty list")
-    
-    sorted_values = sorted(values)
-    n = len(sorted_values)
-    
-    if n == 1:
-        return sorted_values[0]
-    
-    # Position of Q1
-    pos = (n + 1) / 4
-    
-    if pos == int(pos):
-        return sorted_values[int(pos) - 1]
-    else:
-        lower = int(pos) - 1
-        upper = int(pos)
-        fraction = pos - int(pos)
-        return sorted_values[lower] + fraction * (sorted_values[upper] - sorted_values[lower])
+    if isinstance(values, TDigest):
+        return values.value_at_rank((len(values) + 1) / 4 - 1)
+    return _quartile_1_sorted(_order_statistics(values))
 
 
 def quartile_3(values: List[float]):
     """Calculate third quartile (Q3)."""
     if not values:
         raise ValueError("Cannot calculate quartile of empty list")
-    
-    sorted_values = sorted(values)
-    n = len(sorted_values)
-    
-    if n == 1:
-        return sorted_values[0]
-    
-    # Position of Q3
-    pos = 3 * (n + 1) / 4
-    
-    if pos == int(pos):
-        return sorted_values[int(pos) - 1]
-    else:
-        lower = int(pos) - 1
-        upper = min(int(pos), n - 1)
-        fraction = pos - int(pos)
-        return sorted_values[lower] + fraction * (sorted_values[upper] - sorted_values[lower])
+    if isinstance(values, TDigest):
+        return values.value_at_rank(3 * (len(values) + 1) / 4 - 1)
+    return _quartile_3_sorted(_order_statistics(values))
 
 
 def interquartile_range(values: List[float]):
     """Calculate interquartile range (Q3 - Q1)."""
-    return quartile_3(values) - quartile_1(values)
+    if not values:
+        raise ValueError("Cannot calculate quartile of empty list")
+    if isinstance(values, TDigest):
+        return quartile_3(values) - quartile_1(values)
+    sorted_values = _order_statistics(values)
+    return _quartile_3_sorted(sorted_values) - _quartile_1_sorted(sorted_values)
 
 
 def correlation_coefficient(x_values: List[float], y_values: List[float]):
@@ -141,14 +160,16 @@ def correlation_coefficient(x_values: List[float], y_values: List[float]):
     if len(x_values) < 2:
         raise ValueError("Need at least 2 data points for correlation")
     
-    n = len(x_values)
+    # Centre each list once and reuse the deviations for all three sums
     mean_x = mean(x_values)
     mean_y = mean(y_values)
+    deviations_x = [x - mean_x for x in x_values]
+    deviations_y = [y - mean_y for y in y_values]
     
-    numerator = sum((x_values[i] - mean_x) * (y_values[i] - mean_y) for i in range(n))
+    numerator = sum(map(mul, deviations_x, deviations_y))
     
-    sum_sq_x = sum((x - mean_x) ** 2 for x in x_values)
-    sum_sq_y = sum((y - mean_y) ** 2 for y in y_values)
+    sum_sq_x = sum(map(mul, deviations_x, deviations_x))
+    sum_sq_y = sum(map(mul, deviations_y, deviations_y))
     
     denominator = math.sqrt(sum_sq_x * sum_sq_y)
     
@@ -158,6 +179,29 @@ def correlation_coefficient(x_values: List[float], y_values: List[float]):
     return numerator / denominator
 
 
+def covariance_matrix(series):
+    """
+    Calculate the sample covariance matrix of several series of equal length.
+    
+    Accepts a list of series (one list of values per variable), a 2-D NumPy array
+    with one row per series, or a RunningCovariance built over a stream of rows.
+    Each series is centred once; with NumPy installed the products are one matrix
+    multiplication. Returns a list of rows.
+    """
+    accumulator = _covariance_accumulator(series)
+    return [[value / (accumulator.count - 1) for value in row] for row in accumulator.comoments]
+
+
+def correlation_matrix(series):
+    """Calculate the Pearson correlation matrix of several series (see covariance_matrix)."""
+    comoments = _covariance_accumulator(series).comoments
+    scales = [math.sqrt(row[i]) for i, row in enumerate(comoments)]
+    if not all(scales):
+        raise ValueError("Correlation undefined - one variable has no variation")
+    return [[value / (scale_i * scale_j) for value, scale_j in zip(row, scales)]
+            for row, scale_i in zip(comoments, scales)]
+
+
 def z_score(value: float, population_mean: float, population_std: float):
     """Calculate z-score (standard score)."""
     if population_std <= 0:
@@ -169,10 +213,153 @@ def percentile(values: List[float], percentile_rank: float):
     """Calculate the value at a given percentile."""
     if not values:
         raise ValueError("Cannot calculate percentile of empty list")
-    if not 0 <= percentile_rank <= 100:
-        raise ValueError("Percentile rank must be between 0 and 100")
-    
+    _check_percentile_rank(percentile_rank)
+    if isinstance(values, TDigest):
+        return values.value_at_rank(percentile_rank / 100 * (len(values) - 1))
+    if isinstance(values, Histogram):
+        return values.quantile(percentile_rank / 100)
+    return _percentile_sorted(_order_statistics(values), percentile_rank)
+
+
+def percentiles(values: List[float], ranks: List[float]):
+    """Calculate the values at several percentiles, sorting the values once."""
+    if not values:
+        raise ValueError("Cannot calculate percentile of empty list")
+    for rank in ranks:
+        _check_percentile_rank(rank)
+    sorted_values = sorted(values)
+    return [_percentile_sorted(sorted_values, rank) for rank in ranks]
+
+
+def describe(values: List[float]):
+    """Summarize a list of values: count, mean, spread and order statistics from one sort."""
+    if not values:
+        raise ValueError("Cannot describe empty list")
     sorted_values = sorted(values)
+    q1 = _quartile_1_sorted(sorted_values)
+    q3 = _quartile_3_sorted(sorted_values)
+    return {
+        "count": len(sorted_values),
+        "mean": mean(values),
+        "standard_deviation_population": standard_deviation_population(values),
+        "min": sorted_values[0],
+        "quartile_1": q1,
+        "median": _median_sorted(sorted_values),
+        "quartile_3": q3,
+        "interquartile_range": q3 - q1,
+        "percentile_90": _percentile_sorted(sorted_values, 90),
+        "percentile_99": _percentile_sorted(sorted_values, 99),
+        "max": sorted_values[-1],
+    }
+
+
+def weighted_mean(values: List[float], weights: List[float]):
+    """Calculate the weighted arithmetic mean."""
+    total_weight = _check_weights(values, weights, "mean")
+    return sum(map(mul, values, weights)) / total_weight
+
+
+def weighted_variance_population(values: List[float], weights: List[float]):
+    """Calculate the weighted population variance (weights as relative importance)."""
+    total_weight = _check_weights(values, weights, "variance")
+    return _weighted_m2(values, weights, total_weight) / total_weight
+
+
+def weighted_variance_sample(values: List[float], weights: List[float]):
+    """Calculate the weighted sample variance, reading weights as repeat counts."""
+    total_weight = _check_weights(values, weights, "variance")
+    if total_weight <= 1:
+        raise ValueError("Weighted sample variance requires a total weight above 1")
+    return _weighted_m2(values, weights, total_weight) / (total_weight - 1)
+
+
+def weighted_percentile(values: List[float], weights: List[float], percentile_rank: float):
+    """
+    Calculate the value at a given percentile of weighted values.
+    
+    Each value spans as many ranks as its weight, so integer weights give the
+    PERCENTILE of the list with every value repeated weight times.
+    """
+    total_weight = _check_weights(values, weights, "percentile")
+    _check_percentile_rank(percentile_rank)
+    ordered = sorted(zip(values, weights))
+    cumulative = list(accumulate(weight for _, weight in ordered))
+    
+    # Position on the expanded list, interpolated between the values at its two ranks
+    pos = percentile_rank / 100 * max(total_weight - 1, 0)
+    lower = int(pos)
+    below = ordered[min(bisect_right(cumulative, lower), len(ordered) - 1)][0]
+    if pos == lower:
+        return below
+    above = ordered[min(bisect_right(cumulative, lower + 1), len(ordered) - 1)][0]
+    return below + (pos - lower) * (above - below)
+
+
+def _covariance_accumulator(series):
+    """Summarize the argument of a covariance-based operation as a RunningCovariance."""
+    if not isinstance(series, RunningCovariance):
+        if not len(series):
+            raise ValueError("Cannot calculate covariance of empty list")
+        series = RunningCovariance.from_series(series)
+    if series.count < 2:
+        raise ValueError("Need at least 2 data points for covariance")
+    return series
+
+
+# Order statistics of an already sorted, non-empty list (or of a _SelectedOrder
+# standing in for one); the public functions above sort once and share these
+def _median_sorted(sorted_values):
+    """Median of a sorted list."""
+    n = len(sorted_values)
+    
+    if n % 2 == 0:
+        # Even number of values - average of two middle values
+        return (sorted_values[n//2 - 1] + sorted_values[n//2]) / 2
+    else:
+        # Odd number of values - middle value
+        return sorted_values[n//2]
+
+
+def _quartile_1_sorted(sorted_values):
+    """First quartile of a sorted list."""
+    n = len(sorted_values)
+    
+    if n == 1:
+        return sorted_values[0]
+    
+    # Position of Q1
+    pos = (n + 1) / 4
+    
+    if pos == int(pos):
+        return sorted_values[int(pos) - 1]
+    else:
+        lower = int(pos) - 1
+        upper = int(pos)
+        fraction = pos - int(pos)
+        return sorted_values[lower] + fraction * (sorted_values[upper] - sorted_values[lower])
+
+
+def _quartile_3_sorted(sorted_values):
+    """Third quartile of a sorted list."""
+    n = len(sorted_values)
+    
+    if n == 1:
+        return sorted_values[0]
+    
+    # Position of Q3
+    pos = 3 * (n + 1) / 4
+    
+    if pos == int(pos):
+        return sorted_values[int(pos) - 1]
+    else:
+        lower = int(pos) - 1
+        upper = min(int(pos), n - 1)
+        fraction = pos - int(pos)
+        return sorted_values[lower] + fraction * (sorted_values[upper] - sorted_values[lower])
+
+
+def _percentile_sorted(sorted_values, percentile_rank):
+    """Value at a percentile rank of a sorted list."""
     n = len(sorted_values)
     
     if percentile_rank == 0:
@@ -190,3 +377,100 @@ def percentile(values: List[float], percentile_rank: float):
         upper = lower + 1
         fraction = pos - lower
         return sorted_values[lower] + fraction * (sorted_values[upper] - sorted_values[lower])
+
+
+def _check_weights(values, weights, name):
+    """Validate the arguments of a weighted statistic and return the total weight."""
+    if len(values) != len(weights):
+        raise ValueError("values and weights must have the same length")
+    if not values:
+        raise ValueError(f"Cannot calculate weighted {name} of empty list")
+    if min(weights) < 0:
+        raise ValueError("Weights must not be negative")
+    total_weight = sum(weights)
+    if total_weight <= 0:
+        raise ValueError("Sum of weights must be positive")
+    return total_weight
+
+
+def _weighted_m2(values, weights, total_weight):
+    """Weighted sum of squared deviations from the weighted mean."""
+    mean_val = sum(map(mul, values, weights)) / total_weight
+    return sum(weight * (x - mean_val) ** 2 for x, weight in zip(values, weights))
+
+
+def _check_percentile_rank(percentile_rank):
+    """Validate a percentile rank."""
+    if not 0 <= percentile_rank <= 100:
+        raise ValueError("Percentile rank must be between 0 and 100")
+
+
+def _order_statistics(values):
+    """Return the values sorted, or a _SelectedOrder for sequences long enough to select from."""
+    if isinstance(values, (list, tuple, array)) and len(values) >= SELECTION_THRESHOLD:
+        return _SelectedOrder(values)
+    return sorted(values)
+
+
+class _SelectedOrder:
+    """
+    Read-only stand-in for sorted(values) that finds each requested rank by selection.
+    
+    Reading rank k sorts a random sample of about n^(2/3) values, takes two sample
+    values that bracket rank k with high probability as pivots (Floyd-Rivest), and
+    sorts only the values between them: two linear passes and a sort of about
+    4 n^(2/3) values, in place of an O(n log n) sort of a full copy. Each window also
+    covers the neighbouring rank k + 1 that the interpolation rules read next.
+    """
+    
+    __slots__ = ("_values", "_windows")
+    
+    def __init__(self, values):
+        self._values = values
+        self._windows = []  # (rank of the first value, sorted values)
+    
+    def __len__(self):
+        return len(self._values)
+    
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self._values)
+        for below, window in self._windows:
+            if below <= index < below + len(window):
+                return window[index - below]
+        below, window = self._select(index)
+        self._windows.append((below, window))
+        return window[index - below]
+    
+    def _select(self, rank):
+        """Return (below, window): the sorted values around rank and how many values precede them."""
+        values = self._values
+        n = len(values)
+        size = int(n ** (2 / 3))
+        sample = sorted(_sampler.sample(values, size))
+        
+        # The target's rank within the sample has a standard deviation below sqrt(size) / 2,
+        # so pivots 2 sqrt(size) away on either side miss it about once in 10**4 calls
+        margin = 2 * int(math.sqrt(size)) + 1
+        position = rank * size // n
+        low, high = position - margin, position + margin + 1
+        if low > 0 and high < size:
+            low_pivot, high_pivot = sample[low], sample[high]
+            window = [x for x in values if low_pivot <= x <= high_pivot]
+            below = sum(map(lt, values, repeat(low_pivot)))
+        elif low > 0:
+            low_pivot = sample[low]
+            window = [x for x in values if low_pivot <= x]
+            below = n - len(window)
+        elif high < size:
+            high_pivot = sample[high]
+            window = [x for x in values if x <= high_pivot]
+            below = 0
+        else:
+            window, below = list(values), 0
+        window.sort()
+        
+        # An unlucky sample that fails to bracket rank and its neighbour costs a full sort
+        if not below <= rank or not min(rank + 1, n - 1) < below + len(window):
+            return 0, sorted(values)
+        return below, window
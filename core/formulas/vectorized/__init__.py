@@ -0,0 +1,72 @@
+"""
+Vectorized formula implementations for whole-array evaluation.
+Mirrors the scalar formula modules using NumPy when it is installed.
+
+The scalar formulas remain the reference: each vectorized function has the same
+name, arguments, domain checks and error messages as its scalar counterpart.
+Float overflow gives inf rather than raising OverflowError; calculate_many()
+recomputes such rows, where finite arguments gave inf or nan, with the scalar formula.
+"""
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional
+    np = None
+
+HAS_NUMPY = np is not None
+
+_KERNEL_MODULES = {}
+
+# Formulas that return an int when every argument is an int; NumPy would compute
+# them in float64 (or wrap around in int64), so all-integer batches skip the kernels
+_INTEGER_RESULTS = {
+    "arithmetic": frozenset({
+        "add", "subtract", "multiply", "modulo", "floor_divide", "power", "square", "cube",
+        "absolute_value", "sign", "ceiling", "floor", "round_to_decimals",
+    }),
+    "geometry": frozenset({
+        "area_rectangle", "area_square", "perimeter_rectangle", "perimeter_square",
+        "perimeter_triangle", "perimeter_regular_polygon",
+    }),
+    "volumes": frozenset({"volume_cube", "volume_rectangular_prism"}),
+    "logarithms": frozenset({"exponential_base_10", "exponential_base_2", "exponential_custom_base"}),
+}
+
+if HAS_NUMPY:
+    from . import arithmetic, geometry, volumes, trigonometry, logarithms
+    from .domain import evaluate, first_failure, failure_mask, failure_messages
+
+    _KERNEL_MODULES = {
+        "arithmetic": arithmetic,
+        "geometry": geometry,
+        "volumes": volumes,
+        "trigonometry": trigonometry,
+        "logarithms": logarithms,
+    }
+
+
+def get_kernel(func):
+    """
+    Get the vectorized counterpart of a scalar formula function.
+    
+    Args:
+        func: Formula function from one of the core.formulas modules
+        
+    Returns:
+        The NumPy function with the same name, or None if NumPy is not
+        installed or the formula has no vectorized implementation
+    """
+    module = _KERNEL_MODULES.get(func.__module__.rsplit(".", 1)[-1])
+    if module is None:
+        return None
+    return getattr(module, func.__name__, None)
+
+
+def returns_integers(func):
+    """Return True if a scalar formula gives exact int results for int arguments."""
+    return func.__name__ in _INTEGER_RESULTS.get(func.__module__.rsplit(".", 1)[-1], ())
+
+
+__all__ = ['HAS_NUMPY', 'get_kernel', 'returns_integers']
+if HAS_NUMPY:
+    __all__ += ['evaluate', 'first_failure', 'failure_mask', 'failure_messages']
@@ -0,0 +1,150 @@
+"""
+Vectorized arithmetic operations for the Math Calculation Engine.
+NumPy counterparts of core.formulas.arithmetic, applied element-wise to arrays.
+
+The integer-only functions (factorial, combination, permutation, gcd, lcm,
+is_prime, fibonacci) produce arbitrary-precision results and have no
+vectorized form.
+"""
+
+import numpy as np
+
+from .domain import reject
+
+
+# Basic arithmetic operations
+def add(a, b):
+    """Add two arrays element-wise."""
+    return a + b
+
+
+def subtract(a, b):
+    """Subtract b from a element-wise."""
+    return a - b
+
+
+def multiply(a, b):
+    """Multiply two arrays element-wise."""
+    return a * b
+
+
+def divide(a, b):
+    """Divide a by b element-wise."""
+    reject(b == 0, "Division by zero is not allowed")
+    return a / b
+
+
+def modulo(a, b):
+    """Calculate a modulo b element-wise."""
+    reject(b == 0, "Modulo by zero is not allowed")
+    return np.mod(a, b)
+
+
+def floor_divide(a, b):
+    """Floor division element-wise."""
+    reject(b == 0, "Division by zero is not allowed")
+    return np.floor_divide(a, b)
+
+
+# Power and root operations
+def power(num, power):
+    """
+    Raise num to the given power element-wise.
+    
+    Negative bases with fractional powers have complex results in Python;
+    they are nan here.
+    """
+    reject((num == 0) & (power < 0), "0.0 cannot be raised to a negative power")
+    return np.power(num, power)
+
+
+def square_root(num):
+    """Calculate the square root element-wise."""
+    reject(num < 0, "Square root of negative number is not supported")
+    return np.sqrt(num)
+
+
+def cube_root(num):
+    """Calculate the cube root element-wise."""
+    root = np.abs(num) ** (1/3)
+    return np.where(num >= 0, root, -root)
+
+
+def nth_root(num, n):
+    """Calculate the nth root element-wise."""
+    reject(n == 0, "Cannot calculate 0th root")
+    reject((num < 0) & (n % 2 == 0), "Even root of negative number is not supported")
+    root = np.abs(num) ** (1/n)
+    return np.where(num >= 0, root, -root)
+
+
+def square(num):
+    """Calculate the square element-wise."""
+    return num ** 2
+
+
+def cube(num):
+    """Calculate the cube element-wise."""
+    return num ** 3
+
+
+# Advanced arithmetic operations
+def absolute_value(num):
+    """Calculate the absolute value element-wise."""
+    return np.abs(num)
+
+
+def sign(num):
+    """Return the sign (-1, 0, or 1) element-wise."""
+    return np.sign(num)
+
+
+def ceiling(num):
+    """Round up to the nearest integer element-wise."""
+    return np.ceil(num)
+
+
+def floor(num):
+    """Round down to the nearest integer element-wise."""
+    return np.floor(num)
+
+
+def round_to_decimals(num, decimals):
+    """Round to specified number of decimal places element-wise."""
+    reject(decimals < 0, "Number of decimal places cannot be negative")
+    num, decimals = np.broadcast_arrays(num, decimals)
+    result = np.empty(num.shape)
+    # np.round takes a single precision, so round once per distinct value
+    for places in np.unique(decimals):
+        selected = decimals == places
+        result[selected] = np.round(num[selected], max(int(places), 0))
+    return result
+
+
+def arithmetic_mean(a, b):
+    """Calculate arithmetic mean element-wise."""
+    return (a + b) / 2
+
+
+def geometric_mean(a, b):
+    """Calculate geometric mean element-wise."""
+    reject((a < 0) | (b < 0), "Geometric mean requires non-negative numbers")
+    return np.sqrt(a * b)
+
+
+def harmonic_mean(a, b):
+    """Calculate harmonic mean element-wise."""
+    reject((a == 0) | (b == 0), "Harmonic mean undefined when either number is zero")
+    return 2 / (1/a + 1/b)
+
+
+def percentage(part, whole):
+    """Calculate what percentage 'part' is of 'whole' element-wise."""
+    reject(whole == 0, "Cannot calculate percentage of zero")
+    return (part / whole) * 100
+
+
+def percentage_change(old_value, new_value):
+    """Calculate percentage change element-wise."""
+    reject(old_value == 0, "Cannot calculate percentage change from zero")
+    return ((new_value - old_value) / old_value) * 100
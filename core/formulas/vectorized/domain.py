@@ -0,0 +1,115 @@
+"""
+Domain checking for vectorized formulas.
+Replaces the per-element `if ...: raise ValueError(...)` of the scalar formulas
+with one mask check per array.
+"""
+
+import threading
+
+import numpy as np
+
+# Per-thread list of (invalid_mask, message) pairs recorded by reject() while
+# evaluate() is running; None when kernels are called directly
+_state = threading.local()
+
+
+def reject(invalid, message):
+    """
+    Flag the elements where invalid is True as outside the formula's domain.
+    
+    Called directly, this raises ValueError like the scalar formula would. Inside
+    evaluate() the mask is recorded instead so the caller can decide what to do
+    with the offending rows.
+    
+    Args:
+        invalid: Boolean array (or scalar) marking the invalid elements
+        message: Error message used by the scalar formula for the same check
+        
+    Raises:
+        ValueError: If any element is invalid and no evaluation is in progress
+    """
+    if not np.any(invalid):
+        return
+    failures = getattr(_state, "failures", None)
+    if failures is None:
+        raise ValueError(message)
+    failures.append((invalid, message))
+
+
+def evaluate(kernel, arrays, length):
+    """
+    Run a kernel over whole arrays, collecting domain failures instead of raising.
+    
+    Floating point warnings are silenced because invalid rows are still computed;
+    callers are expected to discard them using the returned failures.
+    
+    Args:
+        kernel: Vectorized formula function
+        arrays: Positional arguments for the kernel (arrays or scalars)
+        length: Number of rows in the batch
+        
+    Returns:
+        Tuple of (result, failures) where failures is a list of
+        (invalid_mask, message) pairs in the order the checks were made
+    """
+    previous = getattr(_state, "failures", None)
+    _state.failures = failures = []
+    try:
+        with np.errstate(all="ignore"):
+            result = kernel(*arrays)
+    finally:
+        _state.failures = previous
+    return result, [(np.broadcast_to(invalid, (length,)), message) for invalid, message in failures]
+
+
+def first_failure(failures):
+    """
+    Find the first failing row, as the scalar formulas would have reported it.
+    
+    Args:
+        failures: List of (invalid_mask, message) pairs from evaluate()
+        
+    Returns:
+        Tuple of (index, message) for the lowest failing row, or None if no row failed
+    """
+    index = min((int(np.argmax(invalid)) for invalid, _ in failures), default=None)
+    if index is None:
+        return None
+    # The scalar formula raises on the first check it fails, in source order
+    message = next(message for invalid, message in failures if invalid[index])
+    return index, message
+
+
+def failure_mask(failures, length):
+    """
+    Combine recorded domain failures into one mask of invalid rows.
+    
+    Args:
+        failures: List of (invalid_mask, message) pairs from evaluate()
+        length: Number of rows in the batch
+        
+    Returns:
+        Boolean array that is True for every row that failed any check
+    """
+    invalid = np.zeros(length, dtype=bool)
+    for mask, _ in failures:
+        invalid |= mask
+    return invalid
+
+
+def failure_messages(failures, invalid):
+    """
+    List the failing rows with the message the scalar formula would have raised.
+    
+    Args:
+        failures: List of (invalid_mask, message) pairs from evaluate()
+        invalid: Combined mask from failure_mask()
+        
+    Returns:
+        List of (index, message) pairs in row order
+    """
+    # Index of the first check each row failed, in source order
+    check = np.full(len(invalid), -1)
+    for position in range(len(failures) - 1, -1, -1):
+        check[failures[position][0]] = position
+    return [(int(index), failures[check[index]][1]) for index in np.flatnonzero(invalid)]
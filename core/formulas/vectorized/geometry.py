@@ -0,0 +1,160 @@
+"""
+Vectorized geometry operations for the Math Calculation Engine.
+NumPy counterparts of core.formulas.geometry, applied element-wise to arrays.
+"""
+
+import numpy as np
+
+from .domain import reject
+
+
+# Area calculations
+def area_circle(radius):
+    """Calculate the area of circles given their radii."""
+    reject(radius < 0, "Radius cannot be negative")
+    return np.pi * radius ** 2
+
+
+def area_rectangle(length, width):
+    """Calculate the area of rectangles."""
+    reject((length < 0) | (width < 0), "Dimensions cannot be negative")
+    return length * width
+
+
+def area_square(side):
+    """Calculate the area of squares."""
+    reject(side < 0, "Side length cannot be negative")
+    return side ** 2
+
+
+def area_triangle(base, height):
+    """Calculate the area of triangles using base and height."""
+    reject((base < 0) | (height < 0), "Dimensions cannot be negative")
+    return 0.5 * base * height
+
+
+def area_triangle_heron(a, b, c):
+    """Calculate the area of triangles using Heron's formula."""
+    reject((a <= 0) | (b <= 0) | (c <= 0), "Side lengths must be positive")
+    reject((a + b <= c) | (a + c <= b) | (b + c <= a), "Invalid triangle - triangle inequality violated")
+    
+    s = (a + b + c) / 2  # semi-perimeter
+    return np.sqrt(s * (s - a) * (s - b) * (s - c))
+
+
+def area_rhombus(diagonal1, diagonal2):
+    """Calculate the area of rhombi using diagonals."""
+    reject((diagonal1 < 0) | (diagonal2 < 0), "Diagonal lengths cannot be negative")
+    return (diagonal1 * diagonal2) / 2
+
+
+def area_trapezoid(base1, base2, height):
+    """Calculate the area of trapezoids."""
+    reject((base1 < 0) | (base2 < 0) | (height < 0), "Dimensions cannot be negative")
+    return ((base1 + base2) * height) / 2
+
+
+def area_regular_polygon(perimeter, apothem):
+    """Calculate the area of regular polygons."""
+    reject((perimeter < 0) | (apothem < 0), "Dimensions cannot be negative")
+    return (perimeter * apothem) / 2
+
+
+def area_ellipse(semi_major_axis, semi_minor_axis):
+    """Calculate the area of ellipses."""
+    reject((semi_major_axis < 0) | (semi_minor_axis < 0), "Semi-axes cannot be negative")
+    return np.pi * semi_major_axis * semi_minor_axis
+
+
+def area_sector(radius, angle_degrees):
+    """Calculate the area of circular sectors."""
+    reject(radius < 0, "Radius cannot be negative")
+    reject((angle_degrees < 0) | (angle_degrees > 360), "Angle must be between 0 and 360 degrees")
+    return (angle_degrees / 360) * np.pi * radius ** 2
+
+
+def area_annulus(outer_radius, inner_radius):
+    """Calculate the area of annuli (rings)."""
+    reject((outer_radius < 0) | (inner_radius < 0), "Radii cannot be negative")
+    reject(inner_radius >= outer_radius, "Inner radius must be less than outer radius")
+    return np.pi * (outer_radius ** 2 - inner_radius ** 2)
+
+
+# Perimeter/Circumference calculations
+def circumference_circle(radius):
+    """Calculate the circumference of circles."""
+    reject(radius < 0, "Radius cannot be negative")
+    return 2 * np.pi * radius
+
+
+def perimeter_rectangle(length, width):
+    """Calculate the perimeter of rectangles."""
+    reject((length < 0) | (width < 0), "Dimensions cannot be negative")
+    return 2 * (length + width)
+
+
+def perimeter_square(side):
+    """Calculate the perimeter of squares."""
+    reject(side < 0, "Side length cannot be negative")
+    return 4 * side
+
+
+def perimeter_triangle(a, b, c):
+    """Calculate the perimeter of triangles."""
+    reject((a <= 0) | (b <= 0) | (c <= 0), "Side lengths must be positive")
+    return a + b + c
+
+
+def perimeter_regular_polygon(num_sides, side_length):
+    """Calculate the perimeter of regular polygons."""
+    reject(num_sides < 3, "A polygon must have at least 3 sides")
+    reject(side_length < 0, "Side length cannot be negative")
+    return num_sides * side_length
+
+
+def perimeter_ellipse_approximation(semi_major_axis, semi_minor_axis):
+    """Calculate approximate perimeters of ellipses using Ramanujan's approximation."""
+    reject((semi_major_axis < 0) | (semi_minor_axis < 0), "Semi-axes cannot be negative")
+    # The scalar formula divides by zero when both axes are zero
+    reject((semi_major_axis + semi_minor_axis) == 0, "float division by zero")
+    
+    a, b = semi_major_axis, semi_minor_axis
+    h = ((a - b) ** 2) / ((a + b) ** 2)
+    return np.pi * (a + b) * (1 + (3 * h) / (10 + np.sqrt(4 - 3 * h)))
+
+
+# Distance and other geometric calculations
+def distance_2d(x1, y1, x2, y2):
+    """Calculate distances between points in 2D space."""
+    return np.sqrt((x2 - x1) ** 2 + (y2 - y1) ** 2)
+
+
+def distance_3d(x1, y1, z1, x2, y2, z2):
+    """Calculate distances between points in 3D space."""
+    return np.sqrt((x2 - x1) ** 2 + (y2 - y1) ** 2 + (z2 - z1) ** 2)
+
+
+def midpoint_2d(x1, y1, x2, y2):
+    """Calculate midpoints between points in 2D space, one (x, y) row per pair."""
+    return np.column_stack(np.broadcast_arrays((x1 + x2) / 2, (y1 + y2) / 2))
+
+
+def slope_line(x1, y1, x2, y2):
+    """Calculate the slopes of lines between pairs of points."""
+    reject(x2 == x1, "Slope is undefined for vertical lines")
+    return (y2 - y1) / (x2 - x1)
+
+
+def angle_between_vectors(x1, y1, x2, y2):
+    """Calculate angles between pairs of vectors in degrees."""
+    dot_product = x1 * x2 + y1 * y2
+    magnitude1 = np.sqrt(x1 ** 2 + y1 ** 2)
+    magnitude2 = np.sqrt(x2 ** 2 + y2 ** 2)
+    
+    reject((magnitude1 == 0) | (magnitude2 == 0), "Cannot calculate angle with zero vector")
+    
+    cos_angle = dot_product / (magnitude1 * magnitude2)
+    # Clamp to [-1, 1] to handle floating point errors
+    cos_angle = np.clip(cos_angle, -1, 1)
+    
+    return np.degrees(np.arccos(cos_angle))
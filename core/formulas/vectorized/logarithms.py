@@ -0,0 +1,91 @@
+"""
+Vectorized logarithmic and exponential functions.
+NumPy counterparts of core.formulas.logarithms, applied element-wise to arrays.
+"""
+
+import numpy as np
+
+from .domain import reject
+
+
+def natural_log(x):
+    """Calculate natural logarithm (base e)."""
+    reject(x <= 0, "Logarithm undefined for non-positive numbers")
+    return np.log(x)
+
+
+def log_base_10(x):
+    """Calculate logarithm base 10."""
+    reject(x <= 0, "Logarithm undefined for non-positive numbers")
+    return np.log10(x)
+
+
+def log_base_2(x):
+    """Calculate logarithm base 2."""
+    reject(x <= 0, "Logarithm undefined for non-positive numbers")
+    return np.log2(x)
+
+
+def log_custom_base(x, base):
+    """Calculate logarithm with custom base."""
+    reject(x <= 0, "Logarithm undefined for non-positive numbers")
+    reject((base <= 0) | (base == 1), "Base must be positive and not equal to 1")
+    return np.log(x) / np.log(base)
+
+
+def exponential_e(x):
+    """Calculate e raised to the power x."""
+    return np.exp(x)
+
+
+def exponential_base_10(x):
+    """Calculate 10 raised to the power x."""
+    return np.power(10.0, x)
+
+
+def exponential_base_2(x):
+    """Calculate 2 raised to the power x."""
+    return np.power(2.0, x)
+
+
+def exponential_custom_base(base, exponent):
+    """
+    Calculate base raised to the given exponent.
+    
+    Negative bases with fractional exponents have complex results in Python;
+    they are nan here.
+    """
+    reject((base == 0) & (exponent <= 0), "0 raised to non-positive power is undefined")
+    return np.power(base, exponent)
+
+
+def sinh(x):
+    """Calculate hyperbolic sine."""
+    return np.sinh(x)
+
+
+def cosh(x):
+    """Calculate hyperbolic cosine."""
+    return np.cosh(x)
+
+
+def tanh(x):
+    """Calculate hyperbolic tangent."""
+    return np.tanh(x)
+
+
+def asinh(x):
+    """Calculate inverse hyperbolic sine."""
+    return np.arcsinh(x)
+
+
+def acosh(x):
+    """Calculate inverse hyperbolic cosine."""
+    reject(x < 1, "Inverse hyperbolic cosine undefined for x < 1")
+    return np.arccosh(x)
+
+
+def atanh(x):
+    """Calculate inverse hyperbolic tangent."""
+    reject(np.abs(x) >= 1, "Inverse hyperbolic tangent undefined for |x| >= 1")
+    return np.arctanh(x)
@@ -0,0 +1,113 @@
+"""
+Vectorized trigonometric functions and calculations.
+NumPy counterparts of core.formulas.trigonometry, applied element-wise to arrays.
+"""
+
+import numpy as np
+
+from .domain import reject
+
+
+def sin_degrees(angle_degrees):
+    """Calculate sine of angles in degrees."""
+    return np.sin(np.radians(angle_degrees))
+
+
+def cos_degrees(angle_degrees):
+    """Calculate cosine of angles in degrees."""
+    return np.cos(np.radians(angle_degrees))
+
+
+def tan_degrees(angle_degrees):
+    """Calculate tangent of angles in degrees."""
+    return np.tan(np.radians(angle_degrees))
+
+
+def sin_radians(angle_radians):
+    """Calculate sine of angles in radians."""
+    return np.sin(angle_radians)
+
+
+def cos_radians(angle_radians):
+    """Calculate cosine of angles in radians."""
+    return np.cos(angle_radians)
+
+
+def tan_radians(angle_radians):
+    """Calculate tangent of angles in radians."""
+    return np.tan(angle_radians)
+
+
+def asin_degrees(value):
+    """Calculate arcsine in degrees."""
+    reject((value < -1) | (value > 1), "Value must be between -1 and 1")
+    return np.degrees(np.arcsin(value))
+
+
+def acos_degrees(value):
+    """Calculate arccosine in degrees."""
+    reject((value < -1) | (value > 1), "Value must be between -1 and 1")
+    return np.degrees(np.arccos(value))
+
+
+def atan_degrees(value):
+    """Calculate arctangent in degrees."""
+    return np.degrees(np.arctan(value))
+
+
+def asin_radians(value):
+    """Calculate arcsine in radians."""
+    reject((value < -1) | (value > 1), "Value must be between -1 and 1")
+    return np.arcsin(value)
+
+
+def acos_radians(value):
+    """Calculate arccosine in radians."""
+    reject((value < -1) | (value > 1), "Value must be between -1 and 1")
+    return np.arccos(value)
+
+
+def atan_radians(value):
+    """Calculate arctangent in radians."""
+    return np.arctan(value)
+
+
+def atan2_degrees(y, x):
+    """Calculate two-argument arctangent in degrees."""
+    return np.degrees(np.arctan2(y, x))
+
+
+def atan2_radians(y, x):
+    """Calculate two-argument arctangent in radians."""
+    return np.arctan2(y, x)
+
+
+def sec_degrees(angle_degrees):
+    """Calculate secant of angles in degrees."""
+    cos_val = np.cos(np.radians(angle_degrees))
+    reject(np.abs(cos_val) < 1e-10, "Secant undefined (cosine is zero)")
+    return 1 / cos_val
+
+
+def csc_degrees(angle_degrees):
+    """Calculate cosecant of angles in degrees."""
+    sin_val = np.sin(np.radians(angle_degrees))
+    reject(np.abs(sin_val) < 1e-10, "Cosecant undefined (sine is zero)")
+    return 1 / sin_val
+
+
+def cot_degrees(angle_degrees):
+    """Calculate cotangent of angles in degrees."""
+    tan_val = np.tan(np.radians(angle_degrees))
+    reject(np.abs(tan_val) < 1e-10, "Cotangent undefined (tangent is zero)")
+    return 1 / tan_val
+
+
+def degrees_to_radians(degrees):
+    """Convert degrees to radians."""
+    return np.radians(degrees)
+
+
+def radians_to_degrees(radians):
+    """Convert radians to degrees."""
+    return np.degrees(radians)
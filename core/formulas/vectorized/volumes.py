@@ -0,0 +1,68 @@
+"""
+Vectorized volume calculations for 3D geometric shapes.
+NumPy counterparts of core.formulas.volumes, applied element-wise to arrays.
+"""
+
+import numpy as np
+
+from .domain import reject
+
+
+def volume_cube(side):
+    """Calculate the volume of cubes."""
+    reject(side < 0, "Side length cannot be negative")
+    return side ** 3
+
+
+def volume_rectangular_prism(length, width, height):
+    """Calculate the volume of rectangular prisms (boxes)."""
+    reject((length < 0) | (width < 0) | (height < 0), "Dimensions cannot be negative")
+    return length * width * height
+
+
+def volume_sphere(radius):
+    """Calculate the volume of spheres."""
+    reject(radius < 0, "Radius cannot be negative")
+    return (4/3) * np.pi * radius ** 3
+
+
+def volume_cylinder(radius, height):
+    """Calculate the volume of cylinders."""
+    reject((radius < 0) | (height < 0), "Dimensions cannot be negative")
+    return np.pi * radius ** 2 * height
+
+
+def volume_cone(radius, height):
+    """Calculate the volume of cones."""
+    reject((radius < 0) | (height < 0), "Dimensions cannot be negative")
+    return (1/3) * np.pi * radius ** 2 * height
+
+
+def volume_pyramid(base_area, height):
+    """Calculate the volume of pyramids."""
+    reject((base_area < 0) | (height < 0), "Dimensions cannot be negative")
+    return (1/3) * base_area * height
+
+
+def volume_ellipsoid(a, b, c):
+    """Calculate the volume of ellipsoids."""
+    reject((a < 0) | (b < 0) | (c < 0), "Semi-axes cannot be negative")
+    return (4/3) * np.pi * a * b * c
+
+
+def surface_area_sphere(radius):
+    """Calculate the surface area of spheres."""
+    reject(radius < 0, "Radius cannot be negative")
+    return 4 * np.pi * radius ** 2
+
+
+def surface_area_cylinder(radius, height):
+    """Calculate the surface area of cylinders."""
+    reject((radius < 0) | (height < 0), "Dimensions cannot be negative")
+    return 2 * np.pi * radius * (radius + height)
+
+
+def surface_area_cone(radius, slant_height):
+    """Calculate the surface area of cones."""
+    reject((radius < 0) | (slant_height < 0), "Dimensions cannot be negative")
+    return np.pi * radius * (radius + slant_height)
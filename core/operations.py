@@ -6,10 +6,26 @@ Defines all supported operations and their required parameters.
 from enum import Enum, auto
 from .formulas.arithmetic import (
     add, subtract, multiply, divide, modulo, floor_divide, power, square_root, cube_root, nth_root,
+    power_mod, isqrt, integer_nth_root,
     square, cube, absolute_value, sign, ceiling, floor, round_to_decimals, factorial, combination,
-    permutation, greatest_common_divisor, least_common_multiple, is_prime, fibonacci,
+    permutation, pascal_row, combination_mod, permutation_mod, greatest_common_divisor,
+    least_common_multiple, gcd_many, lcm_many, extended_gcd, batch_gcd, is_prime, is_prime_many,
+    fibonacci, fibonacci_mod, fibonacci_sequence,
     arithmetic_mean, geometric_mean, harmonic_mean, percentage, percentage_change
 )
+from .formulas.primes import primes_in_range, prime_count, nth_prime
+from .formulas.factorization import factorize, factorize_many, divisor_count, euler_phi, radical
+from .formulas.frequency import top_k
+from .formulas.grouped import (
+    grouped_count, grouped_sum, grouped_mean, grouped_variance_sample, grouped_standard_deviation_sample,
+    grouped_min, grouped_max, grouped_median, grouped_percentile, grouped_weighted_mean
+)
+from .formulas.histogram import histogram, weighted_histogram
+from .formulas.scaling import standardize, min_max_scale, robust_scale, rescale
+from .formulas.rolling import (
+    rolling_mean, rolling_variance_sample, rolling_standard_deviation_sample, rolling_median,
+    rolling_percentile, rolling_min, rolling_max
+)
 from .formulas.geometry import (
     area_circle, area_rectangle, area_square, area_triangle, area_triangle_heron, area_rhombus,
     area_trapezoid, area_regular_polygon, area_ellipse, area_sector, area_annulus,
@@ -34,7 +50,9 @@ from .formulas.logarithms import (
 from .formulas.statistics import (
     mean, median, mode, variance_population, variance_sample, standard_deviation_population,
     standard_deviation_sample, range_values, quartile_1, quartile_3, interquartile_range,
-    correlation_coefficient, z_score, percentile
+    correlation_coefficient, z_score, percentile, percentiles, describe, covariance_matrix,
+    correlation_matrix, weighted_mean, weighted_variance_population, weighted_variance_sample,
+    weighted_percentile
 )
 
 
@@ -53,6 +71,9 @@ class Operation(Enum):
     SQUARE_ROOT = auto()
     CUBE_ROOT = auto()
     NTH_ROOT = auto()
+    POWER_MOD = auto()
+    ISQRT = auto()
+    INTEGER_NTH_ROOT = auto()
     SQUARE = auto()
     CUBE = auto()
     
@@ -65,10 +86,28 @@ class Operation(Enum):
     FACTORIAL = auto()
     COMBINATION = auto()
     PERMUTATION = auto()
+    COMBINATION_MOD = auto()
+    PERMUTATION_MOD = auto()
+    PASCAL_ROW = auto()
     GCD = auto()
     LCM = auto()
+    GCD_MANY = auto()
+    LCM_MANY = auto()
+    EXTENDED_GCD = auto()
+    BATCH_GCD = auto()
     IS_PRIME = auto()
+    IS_PRIME_MANY = auto()
+    PRIMES_IN_RANGE = auto()
+    PRIME_COUNT = auto()
+    NTH_PRIME = auto()
+    FACTORIZE = auto()
+    FACTORIZE_MANY = auto()
+    DIVISOR_COUNT = auto()
+    EULER_PHI = auto()
+    RADICAL = auto()
     FIBONACCI = auto()
+    FIBONACCI_MOD = auto()
+    FIBONACCI_SEQUENCE = auto()
     ARITHMETIC_MEAN = auto()
     GEOMETRIC_MEAN = auto()
     HARMONIC_MEAN = auto()
@@ -167,6 +206,38 @@ class Operation(Enum):
     CORRELATION_COEFFICIENT = auto()
     Z_SCORE = auto()
     PERCENTILE = auto()
+    PERCENTILES = auto()
+    DESCRIBE = auto()
+    TOP_K = auto()
+    COVARIANCE_MATRIX = auto()
+    CORRELATION_MATRIX = auto()
+    WEIGHTED_MEAN = auto()
+    WEIGHTED_VARIANCE_POPULATION = auto()
+    WEIGHTED_VARIANCE_SAMPLE = auto()
+    WEIGHTED_PERCENTILE = auto()
+    GROUPED_COUNT = auto()
+    GROUPED_SUM = auto()
+    GROUPED_MEAN = auto()
+    GROUPED_VARIANCE_SAMPLE = auto()
+    GROUPED_STANDARD_DEVIATION_SAMPLE = auto()
+    GROUPED_MIN = auto()
+    GROUPED_MAX = auto()
+    GROUPED_MEDIAN = auto()
+    GROUPED_PERCENTILE = auto()
+    GROUPED_WEIGHTED_MEAN = auto()
+    HISTOGRAM = auto()
+    WEIGHTED_HISTOGRAM = auto()
+    STANDARDIZE = auto()
+    MIN_MAX_SCALE = auto()
+    ROBUST_SCALE = auto()
+    RESCALE = auto()
+    ROLLING_MEAN = auto()
+    ROLLING_VARIANCE_SAMPLE = auto()
+    ROLLING_STANDARD_DEVIATION_SAMPLE = auto()
+    ROLLING_MEDIAN = auto()
+    ROLLING_PERCENTILE = auto()
+    ROLLING_MIN = auto()
+    ROLLING_MAX = auto()
 
 
 # Operation mapping with function references and required parameters
@@ -214,6 +285,18 @@ OPERATION_MAP = {
         "func": nth_root,
         "required": ["num", "n"]
     },
+    Operation.POWER_MOD: {
+        "func": power_mod,
+        "required": ["base", "exponent", "modulus"]
+    },
+    Operation.ISQRT: {
+        "func": isqrt,
+        "required": ["n"]
+    },
+    Operation.INTEGER_NTH_ROOT: {
+        "func": integer_nth_root,
+        "required": ["num", "n"]
+    },
     Operation.SQUARE: {
         "func": square,
         "required": ["num"]
@@ -256,6 +339,18 @@ OPERATION_MAP = {
         "func": permutation,
         "required": ["n", "r"]
     },
+    Operation.COMBINATION_MOD: {
+        "func": combination_mod,
+        "required": ["n", "r", "p"]
+    },
+    Operation.PERMUTATION_MOD: {
+        "func": permutation_mod,
+        "required": ["n", "r", "p"]
+    },
+    Operation.PASCAL_ROW: {
+        "func": pascal_row,
+        "required": ["n"]
+    },
     Operation.GCD: {
         "func": greatest_common_divisor,
         "required": ["a", "b"]
@@ -264,14 +359,74 @@ OPERATION_MAP = {
         "func": least_common_multiple,
         "required": ["a", "b"]
     },
+    Operation.GCD_MANY: {
+        "func": gcd_many,
+        "required": ["values"]
+    },
+    Operation.LCM_MANY: {
+        "func": lcm_many,
+        "required": ["values"]
+    },
+    Operation.EXTENDED_GCD: {
+        "func": extended_gcd,
+        "required": ["a", "b"]
+    },
+    Operation.BATCH_GCD: {
+        "func": batch_gcd,
+        "required": ["values"]
+    },
     Operation.IS_PRIME: {
         "func": is_prime,
         "required": ["n"]
     },
+    Operation.IS_PRIME_MANY: {
+        "func": is_prime_many,
+        "required": ["values"]
+    },
+    Operation.PRIMES_IN_RANGE: {
+        "func": primes_in_range,
+        "required": ["start", "stop"]
+    },
+    Operation.PRIME_COUNT: {
+        "func": prime_count,
+        "required": ["n"]
+    },
+    Operation.NTH_PRIME: {
+        "func": nth_prime,
+        "required": ["n"]
+    },
+    Operation.FACTORIZE: {
+        "func": factorize,
+        "required": ["n"]
+    },
+    Operation.FACTORIZE_MANY: {
+        "func": factorize_many,
+        "required": ["values"]
+    },
+    Operation.DIVISOR_COUNT: {
+        "func": divisor_count,
+        "required": ["n"]
+    },
+    Operation.EULER_PHI: {
+        "func": euler_phi,
+        "required": ["n"]
+    },
+    Operation.RADICAL: {
+        "func": radical,
+        "required": ["n"]
+    },
     Operation.FIBONACCI: {
         "func": fibonacci,
         "required": ["n"]
     },
+    Operation.FIBONACCI_MOD: {
+        "func": fibonacci_mod,
+        "required": ["n", "m"]
+    },
+    Operation.FIBONACCI_SEQUENCE: {
+        "func": fibonacci_sequence,
+        "required": ["start", "stop"]
+    },
     Operation.ARITHMETIC_MEAN: {
         "func": arithmetic_mean,
         "required": ["a", "b"]
@@ -621,5 +776,133 @@ OPERATION_MAP = {
     Operation.PERCENTILE: {
         "func": percentile,
         "required": ["values", "percentile_rank"]
+    },
+    Operation.PERCENTILES: {
+        "func": percentiles,
+        "required": ["values", "ranks"]
+    },
+    Operation.DESCRIBE: {
+        "func": describe,
+        "required": ["values"]
+    },
+    Operation.TOP_K: {
+        "func": top_k,
+        "required": ["values", "k"]
+    },
+    Operation.COVARIANCE_MATRIX: {
+        "func": covariance_matrix,
+        "required": ["series"]
+    },
+    Operation.CORRELATION_MATRIX: {
+        "func": correlation_matrix,
+        "required": ["series"]
+    },
+    Operation.WEIGHTED_MEAN: {
+        "func": weighted_mean,
+        "required": ["values", "weights"]
+    },
+    Operation.WEIGHTED_VARIANCE_POPULATION: {
+        "func": weighted_variance_population,
+        "required": ["values", "weights"]
+    },
+    Operation.WEIGHTED_VARIANCE_SAMPLE: {
+        "func": weighted_variance_sample,
+        "required": ["values", "weights"]
+    },
+    Operation.WEIGHTED_PERCENTILE: {
+        "func": weighted_percentile,
+        "required": ["values", "weights", "percentile_rank"]
+    },
+    Operation.GROUPED_COUNT: {
+        "func": grouped_count,
+        "required": ["keys", "values"]
+    },
+    Operation.GROUPED_SUM: {
+        "func": grouped_sum,
+        "required": ["keys", "values"]
+    },
+    Operation.GROUPED_MEAN: {
+        "func": grouped_mean,
+        "required": ["keys", "values"]
+    },
+    Operation.GROUPED_VARIANCE_SAMPLE: {
+        "func": grouped_variance_sample,
+        "required": ["keys", "values"]
+    },
+    Operation.GROUPED_STANDARD_DEVIATION_SAMPLE: {
+        "func": grouped_standard_deviation_sample,
+        "required": ["keys", "values"]
+    },
+    Operation.GROUPED_MIN: {
+        "func": grouped_min,
+        "required": ["keys", "values"]
+    },
+    Operation.GROUPED_MAX: {
+        "func": grouped_max,
+        "required": ["keys", "values"]
+    },
+    Operation.GROUPED_MEDIAN: {
+        "func": grouped_median,
+        "required": ["keys", "values"]
+    },
+    Operation.GROUPED_PERCENTILE: {
+        "func": grouped_percentile,
+        "required": ["keys", "values", "percentile_rank"]
+    },
+    Operation.GROUPED_WEIGHTED_MEAN: {
+        "func": grouped_weighted_mean,
+        "required": ["keys", "values", "weights"]
+    },
+    Operation.HISTOGRAM: {
+        "func": histogram,
+        "required": ["values", "bins"]
+    },
+    Operation.WEIGHTED_HISTOGRAM: {
+        "func": weighted_histogram,
+        "required": ["values", "weights", "bins"]
+    },
+    Operation.STANDARDIZE: {
+        "func": standardize,
+        "required": ["values"]
+    },
+    Operation.MIN_MAX_SCALE: {
+        "func": min_max_scale,
+        "required": ["values"]
+    },
+    Operation.ROBUST_SCALE: {
+        "func": robust_scale,
+        "required": ["values"]
+    },
+    Operation.RESCALE: {
+        "func": rescale,
+        "required": ["values", "center", "scale"]
+    },
+    Operation.ROLLING_MEAN: {
+        "func": rolling_mean,
+        "required": ["values", "window"]
+    },
+    Operation.ROLLING_VARIANCE_SAMPLE: {
+        "func": rolling_variance_sample,
+        "required": ["values", "window"]
+    },
+    Operation.ROLLING_STANDARD_DEVIATION_SAMPLE: {
+        "func": rolling_standard_deviation_sample,
+        "required": ["values", "window"]
+    },
+    Operation.ROLLING_MEDIAN: {
+        "func": rolling_median,
+        "required": ["values", "window"]
+    },
+    Operation.ROLLING_PERCENTILE: {
+        "func": rolling_percentile,
+        "required": ["values", "window", "percentile_rank"]
+    },
+    Operation.ROLLING_MIN: {
+        "func": rolling_min,
+        "required": ["values", "window"]
+    },
+    Operation.ROLLING_MAX: {
+        "func": rolling_max,
+        "required": ["values", "window"]
     }
 }
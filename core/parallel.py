@@ -0,0 +1,206 @@
+"""
+Parallel execution for the Math Calculation Engine.
+Provides map-reduce evaluation of the mergeable statistics over a process pool.
+"""
+
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+from .operations import Operation
+from .formulas.running import RunningStats, RunningCovariance
+from .formulas.sources import Float64Source
+from .formulas.statistics import correlation_matrix
+from .formulas.vectorized import np
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:  # Python < 3.8: the input is pickled to the workers instead
+    shared_memory = None
+
+
+# Inputs shorter than this are reduced in the calling process, where they are
+# faster than the cost of copying them into shared memory and waking the pool
+PARALLEL_THRESHOLD = 1 << 20
+
+# Operations whose list arguments are reduced to mergeable partial aggregates
+PARALLEL_OPERATIONS = frozenset({
+    Operation.MEAN, Operation.VARIANCE_POPULATION, Operation.VARIANCE_SAMPLE,
+    Operation.STANDARD_DEVIATION_POPULATION, Operation.STANDARD_DEVIATION_SAMPLE,
+    Operation.RANGE_VALUES, Operation.CORRELATION_COEFFICIENT, Operation.COVARIANCE_MATRIX,
+    Operation.CORRELATION_MATRIX,
+})
+
+_SEQUENCE_TYPES = (list, tuple, array) if np is None else (list, tuple, array, np.ndarray)
+
+
+class ParallelExecutor:
+    """
+    Process pool that evaluates statistics by map-reduce.
+    
+    The input is copied once into a shared float64 block; each worker attaches to
+    it, reduces its slice to a RunningStats or RunningCovariance, and the partial
+    aggregates are merged exactly (Chan et al.'s pairwise update) in the caller.
+    No input values are pickled per task.
+    """
+
+    def __init__(self, workers=None, min_size=PARALLEL_THRESHOLD):
+        """
+        Start the pool.
+        
+        Args:
+            workers: Number of worker processes, by default one per CPU
+            min_size: Smallest number of values worth sending to the pool
+        """
+        if workers is not None and workers < 1:
+            raise ValueError("Parallel workers must be at least 1")
+        self.workers = workers or os.cpu_count() or 1
+        self.min_size = min_size
+        self._pool = ProcessPoolExecutor(max_workers=self.workers)
+
+    def handles(self, operation):
+        """Return True if operation is evaluated by map-reduce for large inputs."""
+        return operation in PARALLEL_OPERATIONS
+
+    def run(self, operation, func, kwargs):
+        """Evaluate an operation, reducing its large list arguments in the pool first."""
+        if operation is Operation.CORRELATION_COEFFICIENT:
+            x_values, y_values = kwargs["x_values"], kwargs["y_values"]
+            if self._is_large(x_values) and self._is_large(y_values) and len(x_values) == len(y_values):
+                return correlation_matrix(self.running_covariance([x_values, y_values]))[0][1]
+        elif operation in (Operation.COVARIANCE_MATRIX, Operation.CORRELATION_MATRIX):
+            series = kwargs["series"]
+            if (isinstance(series, _SEQUENCE_TYPES) and len(series) and all(map(self._is_large, series))
+                    and len(set(map(len, series))) == 1):
+                return func(series=self.running_covariance(series))
+        elif self._is_large(kwargs["values"]):
+            return func(values=self.running_stats(kwargs["values"]))
+        return func(**kwargs)
+
+    def running_stats(self, values):
+        """Reduce a sequence of numbers to a RunningStats, one slice per worker."""
+        with _SharedBlock(values) as block:
+            tasks = [self._pool.submit(_stats_task, *block.slice(start, stop))
+                     for start, stop in _split(len(block), self.workers)]
+            return RunningStats.merged(task.result() for task in tasks)
+
+    def running_covariance(self, series):
+        """Reduce a list of equal-length series to a RunningCovariance, one slice of rows per worker."""
+        length = len(series[0])
+        if np is not None:
+            values = np.asarray(series, dtype=float).ravel()
+        else:
+            values = array("d")
+            for column in series:
+                values.extend(column)
+        with _SharedBlock(values) as block:
+            tasks = [self._pool.submit(_covariance_task, *block.slice(0, len(block)), len(series), length,
+                                       first, last)
+                     for first, last in _split(length, self.workers)]
+            result = RunningCovariance()
+            for task in tasks:
+                result.merge(task.result())
+            return result
+
+    def shutdown(self):
+        """Stop the worker processes."""
+        self._pool.shutdown()
+
+    def _is_large(self, values):
+        """
+        Return True if values is a sequence of floats long enough to split across the pool.
+        
+        Other input, such as ints, is left to the formula, which keeps integer results
+        exact and reports non-numeric values instead of rounding them through float64.
+        """
+        if not isinstance(values, _SEQUENCE_TYPES) or len(values) < self.min_size:
+            return False
+        if isinstance(values, array):
+            return values.typecode in "fd"
+        if np is not None and isinstance(values, np.ndarray):
+            return values.dtype.kind == "f"
+        return set(map(type, values)) == {float}
+
+
+class _SharedBlock:
+    """
+    Float64 copy of the input that workers can read by name.
+    
+    slice() describes part of the block for one task as (block, start, stop): the
+    block is the shared memory name, or where shared_memory is unavailable, the
+    bytes of that part alone.
+    """
+
+    def __init__(self, values):
+        if np is not None:
+            values = np.ascontiguousarray(values, dtype=float).ravel()
+        elif not (isinstance(values, array) and values.typecode == "d"):
+            values = array("d", values)
+        self._values = values
+        self._memory = None
+        if shared_memory is not None:
+            self._memory = shared_memory.SharedMemory(create=True, size=max(8 * len(values), 8))
+            view = self._memory.buf[:8 * len(values)]
+            view[:] = memoryview(values).cast("B")
+            view.release()
+
+    def __len__(self):
+        return len(self._values)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        if self._memory is not None:
+            self._memory.close()
+            self._memory.unlink()
+
+    def slice(self, start, stop):
+        """Describe values[start:stop] for a worker."""
+        if self._memory is not None:
+            return self._memory.name, start, stop
+        return self._values[start:stop].tobytes(), 0, stop - start
+
+
+def _split(count, parts):
+    """Divide range(count) into at most parts contiguous (start, stop) slices of near-equal size."""
+    parts = max(1, min(parts, count))
+    return [(count * i // parts, count * (i + 1) // parts) for i in range(parts)]
+
+
+def _read_block(block, start, stop, function):
+    """Call function with a memoryview of the doubles [start, stop) of a block, then release it."""
+    if isinstance(block, str):
+        memory = shared_memory.SharedMemory(name=block)
+        part = memory.buf[8 * start:8 * stop]
+    else:
+        memory, part = None, memoryview(block)
+    try:
+        return function(part)
+    finally:
+        part.release()
+        if memory is not None:
+            memory.close()
+
+
+def _stats_task(block, start, stop):
+    """Worker: reduce one slice of a shared block to a RunningStats."""
+    def reduce(part):
+        with Float64Source(part) as source:
+            return RunningStats(source)
+    return _read_block(block, start, stop, reduce)
+
+
+def _covariance_task(block, start, stop, count, length, first, last):
+    """Worker: reduce rows [first, last) of count series of length values stored one after another."""
+    def reduce(part):
+        if np is not None:
+            table = np.frombuffer(part, dtype=float).reshape(count, length)
+            return RunningCovariance.from_series(table[:, first:last])
+        values = part.cast("d")
+        try:
+            return RunningCovariance.from_series(
+                [values[i * length + first:i * length + last] for i in range(count)])
+        finally:
+            values.release()
+    return _read_block(block, start, stop, reduce)
@@ -4,10 +4,20 @@ Comprehensive test script for the Math Calculation Engine.
 Tests operations from all categories to demonstrate the full capabilities.
 """
 
+import math
+import os
 import sys
+import tempfile
+from array import array
+from collections import Counter
 sys.path.append('.')
 
-from core import calculate, Operation, list_operations
+from core import (
+    calculate, calculate_many, bind, bind_positional, Operation, list_operations,
+    enable_cache, disable_cache, set_cacheable, cache_info, enable_parallel, disable_parallel,
+    RunningStats, RunningCovariance, TDigest, MisraGries, CountMinSketch, Float64Source, Histogram
+)
+from core.formulas import arithmetic, scaling
 
 def test_all_categories():
     """Test operations from every category."""
@@ -104,6 +114,737 @@ def test_all_categories():
     
     return passed == len(tests)
 
+
+def expect_error(func, message, *args, **kwargs):
+    """Assert that func raises ValueError with the given message."""
+    try:
+        func(*args, **kwargs)
+    except ValueError as e:
+        assert str(e) == message, f"{str(e)!r} != {message!r}"
+    else:
+        raise AssertionError(f"Expected ValueError: {message}")
+
+
+def test_bound_dispatch():
+    """Bound callables match calculate() results and error messages."""
+    area = bind(Operation.AREA_CIRCLE)
+    assert area(radius=3) == calculate(operation=Operation.AREA_CIRCLE, radius=3)
+    assert area.__name__ == "area_circle"
+
+    add = bind_positional(Operation.ADD)
+    assert add(2, 3) == 5
+
+    divide = bind(Operation.DIVIDE)
+    expect_error(divide, "Missing required arguments: b", a=1)
+    expect_error(divide, "Unexpected arguments: c", a=1, b=2, c=3)
+    expect_error(divide, "Calculation error: Division by zero is not allowed", a=1, b=0)
+
+    divide = bind_positional(Operation.DIVIDE)
+    expect_error(divide, "Missing required arguments: b", 1)
+    expect_error(divide, "Calculation error: Division by zero is not allowed", 1, 0)
+
+    # Optional formula parameters are not operation arguments, exactly as in calculate()
+    buffer = array("d", bytes(24))
+    expect_error(bind_positional(Operation.STANDARDIZE), "Unexpected arguments: expected 1 (values), got 2",
+                 [1, 2, 3], buffer)
+    expect_error(bind(Operation.STANDARDIZE), "Unexpected arguments: out", values=[1, 2, 3], out=buffer)
+    assert bind(Operation.STANDARDIZE)(values=[1, 2, 3])["mean"] == 2
+
+    expect_error(bind, "Unsupported operation: nope", "nope")
+
+
+def test_calculate_many():
+    """Batch results match calculate() row by row and report the failing row."""
+    radii = [0, 1.5, 2, 10]
+    areas = calculate_many(operation=Operation.AREA_CIRCLE, radius=radii)
+    assert list(areas) == [calculate(operation=Operation.AREA_CIRCLE, radius=r) for r in radii]
+
+    assert list(calculate_many(operation=Operation.ADD, a=[1, 2, 3], b=10)) == [11, 12, 13]
+    assert list(calculate_many(operation=Operation.FACTORIAL, n=[0, 5, 25])) == [1, 120, 15511210043330985984000000]
+    assert list(calculate_many(operation=Operation.MEAN, values=[[1, 2], [3, 5]])) == [1.5, 4.0]
+    # Integer batches give the exact int results of the scalar formulas, with or without NumPy
+    assert list(calculate_many(operation=Operation.ADD, a=[2 ** 60 + 1, 3], b=0)) == [2 ** 60 + 1, 3]
+    # (with NumPy: in int64, or row by row on overflow or a float result)
+    for operation, columns in ((Operation.FLOOR_DIVIDE, {"a": [7, -7], "b": [2, 2]}),
+                               (Operation.MODULO, {"a": [7, -7], "b": [3, 3]}),
+                               (Operation.SIGN, {"num": [-5, 0, 4]}),
+                               (Operation.MULTIPLY, {"a": [3 * 10 ** 15, 7], "b": [4000, 4000]}),
+                               (Operation.EXPONENTIAL_BASE_2, {"x": [3, -1]})):
+        results = calculate_many(operation=operation, **columns)
+        expected = [calculate(operation=operation, **dict(zip(columns, row))) for row in zip(*columns.values())]
+        assert [type(result) is float for result in results] == [type(value) is float for value in expected]
+        assert list(results) == expected
+    assert calculate_many(operation=Operation.SQUARE_ROOT, num=[2 ** 60])[0] == 2.0 ** 30
+
+    expect_error(calculate_many, "Calculation error at index 2: Division by zero is not allowed",
+                 operation=Operation.DIVIDE, a=[1, 2, 3], b=[1, 2, 0])
+    expect_error(calculate_many, "Columns must have the same length: a=2, b=3",
+                 operation=Operation.DIVIDE, a=[1, 2], b=[1, 2, 3])
+    expect_error(calculate_many, "Missing required arguments: b",
+                 operation=Operation.DIVIDE, a=[1, 2])
+
+
+def test_calculate_many_error_policies():
+    """Failing rows become nan, a validity bitmap or collected messages instead of raising."""
+    columns = {"num": [4, 1, -4, 9], "n": [2, 0, 2, 2]}
+    expected_failures = [(1, "Cannot calculate 0th root"),
+                         (2, "Even root of negative number is not supported")]
+
+    result = calculate_many(operation=Operation.NTH_ROOT, errors="nan", **columns)
+    assert result[0] == 2 and result[3] == 3
+    assert result[1] != result[1] and result[2] != result[2]
+
+    result, valid = calculate_many(operation=Operation.NTH_ROOT, errors="mask", **columns)
+    assert [bool(flag) for flag in valid] == [True, False, False, True]
+
+    result, failures = calculate_many(operation=Operation.NTH_ROOT, errors="collect", **columns)
+    assert failures == expected_failures
+
+    result, failures = calculate_many(operation=Operation.FACTORIAL, n=[3, -1, 4], errors="collect")
+    assert result[0] == 6 and result[2] == 24
+    assert failures == [(1, "Factorial of negative number is undefined")]
+
+    expect_error(calculate_many, "Unsupported error policy: skip (expected one of: raise, nan, mask, collect)",
+                 operation=Operation.FACTORIAL, n=[1], errors="skip")
+
+
+def test_result_cache():
+    """Cached results are reused, type-safe, bounded and counted."""
+    enable_cache(capacity=2)
+    set_cacheable(Operation.MEDIAN)
+    try:
+        assert calculate(operation=Operation.FACTORIAL, n=10) == 3628800
+        assert calculate(operation=Operation.FACTORIAL, n=10) == 3628800
+        expect_error(calculate, "Calculation error: Factorial is only defined for integers",
+                     operation=Operation.FACTORIAL, n=10.0)
+
+        values = [1, 2, 3]
+        assert calculate(operation=Operation.MEDIAN, values=values) == 2
+        values.append(10)
+        assert calculate(operation=Operation.MEDIAN, values=values) == 2.5
+
+        info = cache_info()
+        assert (info["hits"], info["misses"], info["evictions"], info["entries"]) == (1, 4, 1, 2)
+
+        calculate(operation=Operation.ADD, a=1, b=2)
+        assert cache_info()["misses"] == 4
+        set_cacheable(Operation.ADD)
+        calculate(operation=Operation.ADD, a=1, b=2)
+        assert cache_info()["misses"] == 5
+
+        # Nested lists are copied too, so changing a result cannot corrupt the cached entry
+        factors = calculate(operation=Operation.FACTORIZE_MANY, values=[12, 18])
+        factors[0].append((5, 1))
+        assert calculate(operation=Operation.FACTORIZE_MANY, values=[12, 18]) == [[(2, 2), (3, 1)], [(2, 1), (3, 2)]]
+
+        enable_cache(capacity=10, max_size=1000)
+        calculate(operation=Operation.FACTORIAL, n=2000)
+        assert cache_info()["entries"] == 0
+    finally:
+        disable_cache()
+
+
+def test_factorial_engine():
+    """The table, math.factorial and prime-swing paths all give exact factorials."""
+    for n in (0, 1, 20, 255, 256, 5000, 19999, 20000, 30011):
+        assert calculate(operation=Operation.FACTORIAL, n=n) == math.factorial(n), n
+    expect_error(calculate, "Calculation error: Factorial is only defined for integers",
+                 operation=Operation.FACTORIAL, n=5.0)
+    expect_error(calculate, "Calculation error: Factorial of negative number is undefined",
+                 operation=Operation.FACTORIAL, n=-1)
+
+
+def test_fibonacci_operations():
+    """Fast doubling, the modular variant and the sequence generator agree with iteration."""
+    expected = [0, 1]
+    for _ in range(2, 1500):
+        expected.append(expected[-1] + expected[-2])
+
+    assert [calculate(operation=Operation.FIBONACCI, n=n) for n in range(1500)] == expected
+    assert list(calculate(operation=Operation.FIBONACCI_SEQUENCE, start=0, stop=1500)) == expected
+    assert list(calculate(operation=Operation.FIBONACCI_SEQUENCE, start=700, stop=705)) == expected[700:705]
+    for m in (1, 2, 10, 97, 1000, 10 ** 9 + 7):
+        assert calculate(operation=Operation.FIBONACCI_MOD, n=1499, m=m) == expected[1499] % m
+
+    # Pisano period reduction for huge indices: pi(10) = 60
+    assert calculate(operation=Operation.FIBONACCI_MOD, n=60 * 10 ** 30 + 7, m=10) == 13 % 10
+    expect_error(calculate, "Calculation error: Modulus must be positive",
+                 operation=Operation.FIBONACCI_MOD, n=5, m=0)
+    expect_error(calculate, "Calculation error: Fibonacci index must be non-negative",
+                 operation=Operation.FIBONACCI_SEQUENCE, start=-1, stop=3)
+
+
+def test_primality():
+    """IS_PRIME agrees with a sieve and handles pseudoprimes and huge inputs."""
+    limit = 20000
+    sieve = bytearray([1]) * limit
+    sieve[0] = sieve[1] = 0
+    for p in range(2, int(limit ** 0.5) + 1):
+        if sieve[p]:
+            sieve[p * p::p] = bytes(len(range(p * p, limit, p)))
+    assert calculate(operation=Operation.IS_PRIME_MANY, values=list(range(limit))) == [bool(x) for x in sieve]
+
+    # Mersenne primes across the 32-bit, 64-bit and BPSW ranges
+    for n in (2 ** 31 - 1, 2 ** 61 - 1, 2 ** 89 - 1, 2 ** 127 - 1):
+        assert calculate(operation=Operation.IS_PRIME, n=n), n
+    # Carmichael numbers, strong pseudoprimes to many bases, a square and a semiprime
+    for n in (561, 41041, 3215031751, 3825123056546413051, 318665857834031151167461,
+              (2 ** 64 + 13) ** 2, (2 ** 61 - 1) * (2 ** 89 - 1)):
+        assert not calculate(operation=Operation.IS_PRIME, n=n), n
+
+    expect_error(calculate, "Calculation error: Prime check is only defined for integers",
+                 operation=Operation.IS_PRIME_MANY, values=[3, 5.0])
+
+
+def test_prime_sieve_operations():
+    """Sieve-based generation, counting and indexing agree with each other and with IS_PRIME."""
+    primes = calculate(operation=Operation.PRIMES_IN_RANGE, start=0, stop=100000)
+    assert len(primes) == calculate(operation=Operation.PRIME_COUNT, n=99999) == 9592
+    assert primes[:6] == [2, 3, 5, 7, 11, 13]
+    assert calculate(operation=Operation.NTH_PRIME, n=9592) == primes[-1] == 99991
+    # A window wide enough to sieve, then narrow ones tested value by value
+    assert calculate(operation=Operation.PRIMES_IN_RANGE, start=10 ** 10, stop=10 ** 10 + 3000) == \
+        [n for n in range(10 ** 10, 10 ** 10 + 3000) if calculate(operation=Operation.IS_PRIME, n=n)]
+    assert calculate(operation=Operation.PRIMES_IN_RANGE, start=10 ** 12, stop=10 ** 12 + 100) == \
+        [n for n in range(10 ** 12, 10 ** 12 + 100) if calculate(operation=Operation.IS_PRIME, n=n)]
+    assert calculate(operation=Operation.PRIMES_IN_RANGE, start=2 ** 61 - 30, stop=2 ** 61 + 2) == [2 ** 61 - 1]
+    assert calculate(operation=Operation.PRIME_COUNT, n=10 ** 6) == 78498
+    expect_error(calculate, "Calculation error: Prime index must be at least 1",
+                 operation=Operation.NTH_PRIME, n=0)
+
+
+def test_combinatorics():
+    """Modular, row and large-argument combinatorics agree with direct computation."""
+    for n, r in [(10 ** 4, 5000), (10 ** 5, 2000), (3000, 1000), (200, 100)]:
+        assert calculate(operation=Operation.COMBINATION, n=n, r=r) == math.factorial(n) // (
+            math.factorial(r) * math.factorial(n - r))
+        assert calculate(operation=Operation.PERMUTATION, n=n, r=r) == \
+            math.factorial(n) // math.factorial(n - r)
+    row = calculate(operation=Operation.PASCAL_ROW, n=30)
+    assert row == [calculate(operation=Operation.COMBINATION, n=30, r=k) for k in range(31)]
+    for p in (2, 7, 1009, 1000000007):
+        for n, r in [(0, 0), (10, 3), (2021, 1000), (5000, 4999)]:
+            assert calculate(operation=Operation.COMBINATION_MOD, n=n, r=r, p=p) == \
+                calculate(operation=Operation.COMBINATION, n=n, r=r) % p
+            assert calculate(operation=Operation.PERMUTATION_MOD, n=n, r=r, p=p) == \
+                calculate(operation=Operation.PERMUTATION, n=n, r=r) % p
+    # A full-size table for one prime evicts the smaller tables of the others
+    n = 2 ** 20 - 1
+    assert calculate(operation=Operation.COMBINATION_MOD, n=n, r=7, p=1048609) == \
+        n * (n - 1) * (n - 2) * (n - 3) * (n - 4) * (n - 5) * (n - 6) // 5040 % 1048609
+    assert list(arithmetic._modular_tables) == [1048609]
+    # Lucas' theorem: only the nonzero base-13 digits contribute, C(3, 1) * C(5, 2) = 30
+    assert calculate(operation=Operation.COMBINATION_MOD, n=3 * 13 ** 20 + 5, r=13 ** 20 + 2, p=13) == 30 % 13
+    expect_error(calculate, "Calculation error: Modulus must be a prime number",
+                 operation=Operation.COMBINATION_MOD, n=10, r=3, p=12)
+
+
+def test_gcd_operations():
+    """Multi-argument, extended and batch GCD agree with the two-argument operations."""
+    values = [2 * 3 * 5 * 7 * 11, 3 * 5 * 13, 5 * 7 * 17, 5 * 19 * 3]
+    assert calculate(operation=Operation.GCD_MANY, values=values) == 5
+    assert calculate(operation=Operation.LCM_MANY, values=[4, -6, 10]) == 60
+    assert calculate(operation=Operation.LCM_MANY, values=[4, 0, 10]) == 0
+    g, x, y = calculate(operation=Operation.EXTENDED_GCD, a=240, b=-46)
+    assert g == calculate(operation=Operation.GCD, a=240, b=-46) == 2 and 240 * x - 46 * y == g
+    
+    # Moduli sharing a prime are exposed by batch GCD, the others come back as 1
+    p, q, r, s = 1000003, 1000033, 1000037, 1000039
+    moduli = [p * q, r * s, p * r, 999983 * 1000081]
+    shared = calculate(operation=Operation.BATCH_GCD, values=moduli)
+    assert shared == [p, r, p * r, 1]
+    for i, n in enumerate(moduli):
+        pairwise = 1
+        for j, m in enumerate(moduli):
+            if i != j:
+                pairwise = calculate(operation=Operation.LCM, a=pairwise,
+                                     b=calculate(operation=Operation.GCD, a=n, b=m))
+        assert shared[i] == pairwise
+    expect_error(calculate, "Calculation error: Cannot calculate GCD of empty list",
+                 operation=Operation.GCD_MANY, values=[])
+    expect_error(calculate, "Calculation error: Batch GCD is not defined for zero",
+                 operation=Operation.BATCH_GCD, values=[6, 0])
+
+
+def test_modular_power_and_integer_roots():
+    """POWER_MOD and the exact integer roots agree with full-precision arithmetic."""
+    assert calculate(operation=Operation.POWER_MOD, base=2, exponent=10 ** 18, modulus=10 ** 9 + 7) == \
+        pow(2, 10 ** 18, 10 ** 9 + 7)
+    inverse = calculate(operation=Operation.POWER_MOD, base=3, exponent=-1, modulus=7)
+    assert inverse == 5 and 3 * inverse % 7 == 1
+    assert calculate(operation=Operation.POWER_MOD, base=4, exponent=-2, modulus=9) == 4
+    expect_error(calculate, "Calculation error: Base is not invertible for this modulus",
+                 operation=Operation.POWER_MOD, base=6, exponent=-1, modulus=9)
+    
+    for exponent in (10, 60, 1000, 20000):
+        n = 3 ** exponent + 12345
+        root = calculate(operation=Operation.ISQRT, n=n)
+        assert root * root <= n < (root + 1) ** 2
+        for degree in (3, 7):
+            root = calculate(operation=Operation.INTEGER_NTH_ROOT, num=n, n=degree)
+            assert root ** degree <= n < (root + 1) ** degree
+    # Exact where float roots round: (10**20 + 1)**3 is far beyond float precision
+    assert calculate(operation=Operation.INTEGER_NTH_ROOT, num=(10 ** 20 + 1) ** 3, n=3) == 10 ** 20 + 1
+    assert calculate(operation=Operation.INTEGER_NTH_ROOT, num=(10 ** 20 + 1) ** 3 - 1, n=3) == 10 ** 20
+    assert calculate(operation=Operation.INTEGER_NTH_ROOT, num=-125, n=3) == -5
+    expect_error(calculate, "Calculation error: Even root of negative number is not supported",
+                 operation=Operation.INTEGER_NTH_ROOT, num=-16, n=4)
+
+
+def test_factorization():
+    """FACTORIZE and the operations built on it agree with trial division and known values."""
+    for n in list(range(1, 2000)) + [2 ** 61 - 1, 600851475143, 1000003 ** 2 * 999983]:
+        factors = calculate(operation=Operation.FACTORIZE, n=n)
+        product = 1
+        for p, exponent in factors:
+            assert calculate(operation=Operation.IS_PRIME, n=p)
+            product *= p ** exponent
+        assert product == n and factors == sorted(factors)
+    # Two 31-bit primes: out of reach of trial division, a few thousand rho steps
+    assert calculate(operation=Operation.FACTORIZE, n=2147483647 * 2147483629) == \
+        [(2147483629, 1), (2147483647, 1)]
+    # Prime powers are split on their root; rho alone makes no progress on them
+    assert calculate(operation=Operation.FACTORIZE, n=(2 ** 61 - 1) ** 2) == [(2 ** 61 - 1, 2)]
+    assert calculate(operation=Operation.FACTORIZE, n=(2 ** 61 - 1) ** 3 * 1000003 ** 2) == \
+        [(1000003, 2), (2 ** 61 - 1, 3)]
+    
+    shared = 1000000007
+    values = [shared * 1000000009, shared * 998244353, 360, 360, 1]
+    assert calculate(operation=Operation.FACTORIZE_MANY, values=values) == \
+        [calculate(operation=Operation.FACTORIZE, n=n) for n in values]
+    assert calculate(operation=Operation.DIVISOR_COUNT, n=360) == 24
+    assert calculate(operation=Operation.EULER_PHI, n=360) == 96
+    assert calculate(operation=Operation.EULER_PHI, n=1) == 1
+    assert calculate(operation=Operation.RADICAL, n=360) == 30
+    expect_error(calculate, "Calculation error: Factorization is only defined for positive integers",
+                 operation=Operation.FACTORIZE, n=0)
+
+
+def test_running_stats():
+    """RunningStats matches the list statistics, whether fed by value, by chunk or merged."""
+    values = [((i * 7919) % 1000) / 7 - 50 for i in range(10000)]
+    whole = RunningStats(values)
+    streamed = RunningStats(value for value in values)
+    one_by_one = RunningStats()
+    for value in values:
+        one_by_one.update(value)
+    shards = [RunningStats(values[start:start + 1234]) for start in range(0, len(values), 1234)]
+    merged = RunningStats.merged(shards)
+    
+    for operation in (Operation.MEAN, Operation.VARIANCE_POPULATION, Operation.VARIANCE_SAMPLE,
+                      Operation.STANDARD_DEVIATION_POPULATION, Operation.STANDARD_DEVIATION_SAMPLE,
+                      Operation.RANGE_VALUES):
+        expected = calculate(operation=operation, values=values)
+        for stats in (whole, streamed, one_by_one, merged):
+            assert math.isclose(calculate(operation=operation, values=stats), expected, rel_tol=1e-12)
+    assert len(merged) == len(values) and shards[0].count == 1234
+    
+    # Accumulators are mutable, so enabling the cache must not freeze their results
+    enable_cache(exclude=())
+    try:
+        growing = RunningStats([1, 2, 3])
+        assert calculate(operation=Operation.MEAN, values=growing) == 2
+        growing.update(6)
+        assert calculate(operation=Operation.MEAN, values=growing) == 3
+    finally:
+        disable_cache()
+    expect_error(calculate, "Calculation error: Cannot calculate mean of empty list",
+                 operation=Operation.MEAN, values=RunningStats())
+    expect_error(calculate, "Calculation error: Sample variance requires at least 2 values",
+                 operation=Operation.VARIANCE_SAMPLE, values=RunningStats([1.0]))
+
+
+def test_describe_and_percentiles():
+    """DESCRIBE and PERCENTILES reproduce the single-statistic operations exactly."""
+    for n in (1, 2, 3, 4, 5, 10, 101, 1000):
+        values = [((i * 37) % 101) / 3 for i in range(n)]
+        summary = calculate(operation=Operation.DESCRIBE, values=values)
+        assert summary["count"] == n
+        assert summary["min"] == min(values) and summary["max"] == max(values)
+        for key, operation in (("mean", Operation.MEAN), ("median", Operation.MEDIAN),
+                               ("quartile_1", Operation.QUARTILE_1), ("quartile_3", Operation.QUARTILE_3),
+                               ("interquartile_range", Operation.INTERQUARTILE_RANGE),
+                               ("standard_deviation_population", Operation.STANDARD_DEVIATION_POPULATION)):
+            assert summary[key] == calculate(operation=operation, values=values), (n, key)
+        
+        ranks = [0, 1, 12.5, 50, 90, 99, 100]
+        expected = [calculate(operation=Operation.PERCENTILE, values=values, percentile_rank=rank)
+                    for rank in ranks]
+        assert calculate(operation=Operation.PERCENTILES, values=values, ranks=ranks) == expected
+        assert [summary["percentile_90"], summary["percentile_99"]] == expected[4:6]
+    expect_error(calculate, "Calculation error: Percentile rank must be between 0 and 100",
+                 operation=Operation.PERCENTILES, values=[1, 2], ranks=[50, 101])
+    expect_error(calculate, "Calculation error: Cannot describe empty list",
+                 operation=Operation.DESCRIBE, values=[])
+
+
+def test_selection_matches_sorting():
+    """Above the selection threshold, order statistics equal the full-sort results exactly."""
+    from core.formulas import statistics
+    
+    count = statistics.SELECTION_THRESHOLD + 1001
+    samples = {
+        "distinct": [((i * 7919) % count) / 13 for i in range(count)],
+        "ties": [(i * 31) % 17 for i in range(count)],
+        "even length": [((i * 7919) % count) * 0.5 for i in range(count + 1)],
+    }
+    for values in samples.values():
+        ordered = sorted(values)
+        expected = {
+            Operation.MEDIAN: statistics._median_sorted(ordered),
+            Operation.QUARTILE_1: statistics._quartile_1_sorted(ordered),
+            Operation.QUARTILE_3: statistics._quartile_3_sorted(ordered),
+            Operation.INTERQUARTILE_RANGE:
+                statistics._quartile_3_sorted(ordered) - statistics._quartile_1_sorted(ordered),
+        }
+        for operation, value in expected.items():
+            assert calculate(operation=operation, values=values) == value
+        for rank in (0, 0.1, 37.5, 50, 99.9, 100):
+            assert calculate(operation=Operation.PERCENTILE, values=values, percentile_rank=rank) == \
+                statistics._percentile_sorted(ordered, rank)
+        assert values != ordered  # selection never reorders the caller's list
+
+
+def test_quantile_sketch():
+    """TDigest is exact on small inputs, accurate on large ones and survives merging and serialization."""
+    small = [((i * 37) % 101) / 3 for i in range(40)]
+    sketch = TDigest(values=small)
+    for rank in (0, 10, 25, 50, 75, 90, 100):
+        assert calculate(operation=Operation.PERCENTILE, values=sketch, percentile_rank=rank) == \
+            calculate(operation=Operation.PERCENTILE, values=small, percentile_rank=rank)
+    for operation in (Operation.QUARTILE_1, Operation.QUARTILE_3, Operation.MEDIAN):
+        assert math.isclose(calculate(operation=operation, values=sketch),
+                            calculate(operation=operation, values=small))
+    
+    # 200000 values in 4 shards, merged after a round trip through bytes
+    values = [((i * 7919) % 200003) / 200003 for i in range(200000)]
+    shards = [TDigest(values=values[start::4]) for start in range(4)]
+    merged = TDigest()
+    for shard in shards:
+        merged.merge(TDigest.from_bytes(shard.to_bytes()))
+    assert len(merged) == len(values) and merged.min == min(values) and merged.max == max(values)
+    assert len(merged.centroids()) < 200
+    for rank in (1, 25, 50, 95, 99, 99.9):
+        estimate = calculate(operation=Operation.PERCENTILE, values=merged, percentile_rank=rank)
+        exact = calculate(operation=Operation.PERCENTILE, values=values, percentile_rank=rank)
+        assert abs(estimate - exact) < 0.005, (rank, estimate, exact)
+    
+    expect_error(calculate, "Calculation error: Cannot calculate percentile of empty list",
+                 operation=Operation.PERCENTILE, values=TDigest(), percentile_rank=50)
+    expect_error(TDigest.from_bytes, "Invalid t-digest data", b"not a sketch")
+
+
+def test_frequency_sketches():
+    """MODE and TOP_K agree across exact counts and sketches, which merge across shards."""
+    values = [(i * i) % 17 for i in range(5000)] + [3] * 1000
+    exact = Counter(values)
+    assert calculate(operation=Operation.MODE, values=values) == 3
+    assert calculate(operation=Operation.MODE, values=exact) == 3
+    assert calculate(operation=Operation.TOP_K, values=values, k=3) == exact.most_common(3)
+    assert calculate(operation=Operation.MODE, values=["b", "a", "c", "b", "a"]) == ["b", "a"]
+    
+    halves = [values[::2], values[1::2]]
+    summary = MisraGries(8, halves[0]).merge(MisraGries(8, halves[1]))
+    assert len(summary) == len(values) and summary.error <= len(values) / 9
+    for value, count in summary.top(3):
+        assert count <= exact[value] <= count + summary.error
+    assert calculate(operation=Operation.MODE, values=summary) == 3
+    
+    words = [str(v) for v in values]
+    sketch = CountMinSketch(256, 4, 10, words[:3000]).merge(CountMinSketch(256, 4, 10, words[3000:]))
+    for value, count in calculate(operation=Operation.TOP_K, values=sketch, k=3):
+        assert Counter(words)[value] <= count <= Counter(words)[value] + sketch.error_bound()
+    assert calculate(operation=Operation.MODE, values=sketch) == "3"
+    
+    expect_error(calculate, "Calculation error: No mode found - all values appear equally",
+                 operation=Operation.MODE, values=Counter([1, 2, 3]))
+    expect_error(calculate, "Calculation error: No mode found - no value occurs often enough to be kept",
+                 operation=Operation.MODE, values=MisraGries(2, [1, 2, 3]))
+    expect_error(calculate, "Calculation error: k must be a positive integer",
+                 operation=Operation.TOP_K, values=values, k=0)
+    expect_error(CountMinSketch, "Sketch width, depth and tracked must be positive integers", tracked=0)
+    expect_error(CountMinSketch(64).merge, "Only sketches with the same width and depth can be merged",
+                 CountMinSketch(128))
+
+
+def test_rolling_windows():
+    """Rolling operations match recomputing each window and accept iterators."""
+    values = [((i * 7919) % 101) / 4 for i in range(300)]
+    window = 12
+    windows = [values[i:i + window] for i in range(len(values) - window + 1)]
+    expected = {
+        Operation.ROLLING_MEAN: Operation.MEAN,
+        Operation.ROLLING_VARIANCE_SAMPLE: Operation.VARIANCE_SAMPLE,
+        Operation.ROLLING_STANDARD_DEVIATION_SAMPLE: Operation.STANDARD_DEVIATION_SAMPLE,
+        Operation.ROLLING_MEDIAN: Operation.MEDIAN,
+    }
+    for rolling, single in expected.items():
+        column = calculate(operation=rolling, values=iter(values), window=window)
+        assert len(column) == len(windows)
+        for result, chunk in zip(column, windows):
+            assert math.isclose(result, calculate(operation=single, values=chunk), abs_tol=1e-9)
+    
+    column = calculate(operation=Operation.ROLLING_PERCENTILE, values=values, window=window, percentile_rank=90)
+    assert list(column) == [calculate(operation=Operation.PERCENTILE, values=chunk, percentile_rank=90)
+                            for chunk in windows]
+    assert list(calculate(operation=Operation.ROLLING_MIN, values=values, window=window)) == list(map(min, windows))
+    assert list(calculate(operation=Operation.ROLLING_MAX, values=values, window=window)) == list(map(max, windows))
+    assert len(calculate(operation=Operation.ROLLING_MEAN, values=[1, 2], window=3)) == 0
+    
+    expect_error(calculate, "Calculation error: Window must be a positive integer",
+                 operation=Operation.ROLLING_MEAN, values=values, window=0)
+    expect_error(calculate, "Calculation error: Sample variance requires a window of at least 2 values",
+                 operation=Operation.ROLLING_VARIANCE_SAMPLE, values=values, window=1)
+
+
+def test_covariance_matrices():
+    """Matrix operations match the pairwise results and the streaming accumulator."""
+    series = [[((i * p) % 37) / 5 for i in range(80)] for p in (3, 5, 11, 13)]
+    series.append([2 * x + 1 for x in series[0]])
+    matrix = calculate(operation=Operation.CORRELATION_MATRIX, series=series)
+    for i, x_values in enumerate(series):
+        for j, y_values in enumerate(series):
+            expected = calculate(operation=Operation.CORRELATION_COEFFICIENT, x_values=x_values, y_values=y_values)
+            assert math.isclose(matrix[i][j], expected, abs_tol=1e-12)
+    assert math.isclose(matrix[0][4], 1.0)
+    
+    covariance = calculate(operation=Operation.COVARIANCE_MATRIX, series=series)
+    for i, values in enumerate(series):
+        assert math.isclose(covariance[i][i], calculate(operation=Operation.VARIANCE_SAMPLE, values=values))
+    
+    # Rows streamed through two shards, one of them row by row
+    rows = list(zip(*series))
+    stream = RunningCovariance(iter(rows[:30]))
+    shard = RunningCovariance()
+    for row in rows[30:]:
+        shard.update(row)
+    streamed = calculate(operation=Operation.COVARIANCE_MATRIX, series=stream.merge(shard))
+    assert len(stream) == 80
+    for row, expected_row in zip(streamed, covariance):
+        for value, expected in zip(row, expected_row):
+            assert math.isclose(value, expected, rel_tol=1e-9, abs_tol=1e-12)
+    
+    expect_error(calculate, "Calculation error: All series must have the same length",
+                 operation=Operation.COVARIANCE_MATRIX, series=[[1, 2, 3], [1, 2]])
+    expect_error(calculate, "Calculation error: Need at least 2 data points for covariance",
+                 operation=Operation.COVARIANCE_MATRIX, series=RunningCovariance([(1, 2)]))
+    expect_error(calculate, "Calculation error: Correlation undefined - one variable has no variation",
+                 operation=Operation.CORRELATION_MATRIX, series=[[1, 2, 3], [4, 4, 4]])
+
+
+def test_float64_sources():
+    """Statistics over a memory-mapped file or a buffer match the same values in a list."""
+    values = array("d", (((i * 7919) % 1009) / 7 for i in range(20000)))
+    handle, path = tempfile.mkstemp()
+    try:
+        with os.fdopen(handle, "wb") as output:
+            output.write(b"HEADER!!")
+            values.tofile(output)
+        with Float64Source(path, offset=8) as source:
+            assert len(source) == len(values) and len(list(source.chunks(4096))) == 5
+            for operation in (Operation.MEAN, Operation.VARIANCE_SAMPLE, Operation.STANDARD_DEVIATION_POPULATION,
+                              Operation.RANGE_VALUES):
+                assert math.isclose(calculate(operation=operation, values=source),
+                                    calculate(operation=operation, values=list(values)))
+            assert TDigest(values=source).count == len(values)
+            chunk = next(source.chunks())
+        # Chunks that outlive the source stay readable, and closing again does nothing
+        source.close()
+        assert chunk[1] == values[1]
+        del chunk
+        
+        assert math.isclose(calculate(operation=Operation.MEAN, values=Float64Source(values)),
+                            calculate(operation=Operation.MEAN, values=RunningStats(values)))
+        open(path, "wb").close()
+        expect_error(calculate, "Calculation error: Cannot calculate mean of empty list",
+                     operation=Operation.MEAN, values=Float64Source(path))
+        expect_error(Float64Source, "Data size is not a multiple of 8 bytes", b"12345")
+        
+        # A source is never cached, so changes to its buffer show up in the next result
+        buffer = bytearray(array("d", [1.0, 2.0, 3.0]).tobytes())
+        enable_cache()
+        set_cacheable(Operation.MEAN)
+        try:
+            source = Float64Source(buffer)
+            assert calculate(operation=Operation.MEAN, values=source) == 2.0
+            buffer[:8] = array("d", [4.0]).tobytes()
+            assert calculate(operation=Operation.MEAN, values=source) == 3.0
+            source.close()
+        finally:
+            disable_cache()
+    finally:
+        os.remove(path)
+
+
+def test_parallel_statistics():
+    """Parallel map-reduce gives the single-process results and the same errors."""
+    values = [((i * 7919) % 10007) / 13 for i in range(30000)]
+    other = [x * 0.5 + (i % 7) for i, x in enumerate(values)]
+    operations = (Operation.MEAN, Operation.VARIANCE_POPULATION, Operation.STANDARD_DEVIATION_SAMPLE,
+                  Operation.RANGE_VALUES)
+    expected = [calculate(operation=operation, values=values) for operation in operations]
+    expected_correlation = calculate(operation=Operation.CORRELATION_COEFFICIENT, x_values=values, y_values=other)
+    expected_matrix = calculate(operation=Operation.COVARIANCE_MATRIX, series=[values, other])
+    
+    enable_parallel(workers=3, min_size=1000)
+    try:
+        for operation, result in zip(operations, expected):
+            assert math.isclose(calculate(operation=operation, values=values), result)
+        assert math.isclose(calculate(operation=Operation.CORRELATION_COEFFICIENT, x_values=values, y_values=other),
+                            expected_correlation)
+        matrix = calculate(operation=Operation.COVARIANCE_MATRIX, series=[values, other])
+        for row, expected_row in zip(matrix, expected_matrix):
+            assert all(math.isclose(a, b) for a, b in zip(row, expected_row))
+        assert calculate(operation=Operation.MEAN, values=[1, 2, 6]) == 3
+        # Other input is left to the formula, so integers stay exact and errors match
+        integers = [2 ** 60 + i for i in range(3000)]
+        assert calculate(operation=Operation.RANGE_VALUES, values=integers) == 2999
+        assert calculate(operation=Operation.MEAN, values=integers) == sum(integers) / len(integers)
+        expect_error(calculate, "Calculation error: unsupported operand type(s) for +: 'int' and 'str'",
+                     operation=Operation.MEAN, values=["a"] * 3000)
+        expect_error(calculate, "Calculation error: x and y lists must have the same length",
+                     operation=Operation.CORRELATION_COEFFICIENT, x_values=values, y_values=other[1:])
+    finally:
+        disable_parallel()
+    expect_error(enable_parallel, "Parallel workers must be at least 1", workers=0)
+
+
+def test_grouped_and_weighted():
+    """GROUPED_* match per-group calls; integer weights match repeating each value."""
+    keys = ["a", "b", "a", "c", "b", "a", "c", "b"]
+    values = [4, 1, 6, 10, 3, 8, 12, 2]
+    groups = {"a": [4, 6, 8], "b": [1, 3, 2], "c": [10, 12]}
+    single = {
+        Operation.GROUPED_MEAN: Operation.MEAN,
+        Operation.GROUPED_VARIANCE_SAMPLE: Operation.VARIANCE_SAMPLE,
+        Operation.GROUPED_STANDARD_DEVIATION_SAMPLE: Operation.STANDARD_DEVIATION_SAMPLE,
+        Operation.GROUPED_MEDIAN: Operation.MEDIAN,
+    }
+    for grouped, operation in single.items():
+        # Variances come from running (Welford) moments, so they match to rounding
+        result = calculate(operation=grouped, keys=keys, values=values)
+        expected = {key: calculate(operation=operation, values=group) for key, group in groups.items()}
+        assert list(result) == list(expected)
+        assert all(math.isclose(result[key], expected[key]) for key in expected)
+    assert list(calculate(operation=Operation.GROUPED_COUNT, keys=keys, values=values).items()) == \
+        [("a", 3), ("b", 3), ("c", 2)]
+    assert calculate(operation=Operation.GROUPED_SUM, keys=keys, values=values) == {"a": 18, "b": 6, "c": 22}
+    assert calculate(operation=Operation.GROUPED_MIN, keys=keys, values=values) == {"a": 4, "b": 1, "c": 10}
+    assert calculate(operation=Operation.GROUPED_MAX, keys=keys, values=values) == {"a": 8, "b": 3, "c": 12}
+    assert calculate(operation=Operation.GROUPED_PERCENTILE, keys=keys, values=values, percentile_rank=75) == \
+        {key: calculate(operation=Operation.PERCENTILE, values=group, percentile_rank=75)
+         for key, group in groups.items()}
+    
+    weights = [1, 2, 0, 3, 1, 2, 1, 1]
+    repeated = [value for value, weight in zip(values, weights) for _ in range(weight)]
+    for weighted, operation in ((Operation.WEIGHTED_MEAN, Operation.MEAN),
+                                (Operation.WEIGHTED_VARIANCE_POPULATION, Operation.VARIANCE_POPULATION),
+                                (Operation.WEIGHTED_VARIANCE_SAMPLE, Operation.VARIANCE_SAMPLE)):
+        assert math.isclose(calculate(operation=weighted, values=values, weights=weights),
+                            calculate(operation=operation, values=repeated))
+    for rank in (0, 10, 25, 50, 63, 90, 100):
+        assert math.isclose(
+            calculate(operation=Operation.WEIGHTED_PERCENTILE, values=values, weights=weights, percentile_rank=rank),
+            calculate(operation=Operation.PERCENTILE, values=repeated, percentile_rank=rank))
+    assert calculate(operation=Operation.GROUPED_WEIGHTED_MEAN, keys=keys, values=values, weights=weights) == \
+        {"a": 20 / 3, "b": 1.75, "c": 10.5}
+    
+    expect_error(calculate, "Calculation error: keys and values must have the same length",
+                 operation=Operation.GROUPED_MEAN, keys=keys[1:], values=values)
+    expect_error(calculate, "Calculation error: Sample variance requires at least 2 values",
+                 operation=Operation.GROUPED_VARIANCE_SAMPLE, keys=["a", "b", "a"], values=[1, 2, 3])
+    expect_error(calculate, "Calculation error: Sum of weights must be positive",
+                 operation=Operation.GROUPED_WEIGHTED_MEAN, keys=keys, values=values, weights=[0] * 8)
+    expect_error(calculate, "Calculation error: Weights must not be negative",
+                 operation=Operation.WEIGHTED_MEAN, values=[1, 2], weights=[1, -1])
+    expect_error(calculate, "Calculation error: Sum of weights must be positive",
+                 operation=Operation.WEIGHTED_MEAN, values=[1, 2], weights=[0, 0])
+
+
+def test_histograms():
+    """HISTOGRAM bins match counting by hand; merged chunks match one pass; histograms feed PERCENTILE."""
+    values = [0.5, 1, 1.5, 2, 2.5, 3, 3.5, 4, 9, -1, 4.5]
+    fixed = calculate(operation=Operation.HISTOGRAM, values=values, bins=4)
+    assert fixed.edges == [-1.0, 1.5, 4.0, 6.5, 9.0]
+    assert list(fixed.counts) == [3, 5, 2, 1] and fixed.counts.typecode == "q"
+    edges = [0, 1, 2, 4]
+    custom = calculate(operation=Operation.HISTOGRAM, values=values, bins=edges)
+    assert list(custom.counts) == [1, 2, 5]
+    assert (custom.underflow, custom.overflow, len(custom)) == (1, 2, 11)
+    assert list(Histogram(edges, array("d", values)).counts) == list(custom.counts)
+    
+    weights = [1, 2, 0, 3, 1, 2, 1, 1, 5, 1, 0.5]
+    weighted = calculate(operation=Operation.WEIGHTED_HISTOGRAM, values=values, weights=weights, bins=edges)
+    assert list(weighted.counts) == [1, 2, 8] and weighted.counts.typecode == "d"
+    assert (weighted.underflow, weighted.overflow) == (1, 5.5)
+    
+    stream = [(i * 7919) % 1000 / 10 for i in range(5000)] + [float("-inf"), float("inf"), 100.0]
+    whole = Histogram.fixed(0, 100, 20, stream)
+    merged = Histogram.fixed(0, 100, 20)
+    for start in range(0, len(stream), 1200):
+        merged.merge(Histogram.fixed(0, 100, 20, stream[start:start + 1200]))
+    single = Histogram.fixed(0, 100, 20)
+    for value in stream:
+        single.update(value)
+    assert list(merged.counts) == list(whole.counts) == list(single.counts) == [250] * 19 + [251]
+    assert (whole.underflow, whole.overflow, len(whole)) == (1, 1, len(stream))
+    for partial in (Histogram.fixed(0, 100, 20), Histogram(edges)):
+        expect_error(partial.extend, "Cannot bin NaN values", [0.5, 1.5, float("nan"), 500])
+        assert (partial.total, partial.overflow, len(partial)) == (2, 0, 2)
+        expect_error(partial.update, "Cannot bin NaN values", float("nan"))
+        assert len(partial) == 2
+    
+    uniform = Histogram.fixed(0, 1000, 100, range(1000))
+    assert calculate(operation=Operation.MEDIAN, values=uniform) == 500.0
+    assert math.isclose(calculate(operation=Operation.PERCENTILE, values=uniform, percentile_rank=90), 899.6)
+    assert Histogram([0, 10], [1, 2, 3, 4]).quantile(0.5) == 5.0
+    
+    expect_error(calculate, "Calculation error: Bin edges must be strictly increasing",
+                 operation=Operation.HISTOGRAM, values=values, bins=[0, 2, 2])
+    expect_error(calculate, "Calculation error: Histogram needs at least one bin",
+                 operation=Operation.HISTOGRAM, values=values, bins=0)
+    expect_error(Histogram([0, 1]).merge, "Only histograms with the same bins can be merged", Histogram([0, 2]))
+    expect_error(Histogram([0, 1], [5]).quantile, "Cannot calculate quantile of empty histogram", 0.5)
+
+
+def test_scaling():
+    """STANDARDIZE matches Z_SCORE per value; fitted parameters rescale later batches identically."""
+    values = [2, 4, 4, 4, 5, 5, 7, 9, 30]
+    fit = calculate(operation=Operation.STANDARDIZE, values=values)
+    mean = calculate(operation=Operation.MEAN, values=values)
+    deviation = calculate(operation=Operation.STANDARD_DEVIATION_POPULATION, values=values)
+    assert math.isclose(fit["mean"], mean) and math.isclose(fit["standard_deviation"], deviation)
+    assert fit["values"].typecode == "d" and len(fit["values"]) == len(values)
+    for scaled, value in zip(fit["values"], values):
+        assert math.isclose(scaled, calculate(operation=Operation.Z_SCORE, value=value, population_mean=mean,
+                                              population_std=deviation))
+    assert list(calculate(operation=Operation.RESCALE, values=values, center=fit["mean"],
+                          scale=fit["standard_deviation"])) == list(fit["values"])
+    
+    fit = calculate(operation=Operation.MIN_MAX_SCALE, values=values)
+    assert (fit["min"], fit["max"]) == (2, 30)
+    assert list(fit["values"]) == [(value - 2) / 28 for value in values]
+    fit = calculate(operation=Operation.ROBUST_SCALE, values=values)
+    assert fit["median"] == 5 and fit["interquartile_range"] == 4
+    assert list(fit["values"]) == [(value - 5) / 4 for value in values]
+    
+    # A preallocated buffer is filled in place and returned; long inputs are written in chunks
+    batch = [(i * 37) % 101 for i in range(40000)]
+    out = array("d", bytes(8 * len(batch)))
+    assert scaling.min_max_scale(batch, out)["values"] is out
+    assert min(out) == 0 and max(out) == 1 and out[1] == 37 / 100
+    fit = scaling.standardize(batch, out)
+    assert fit["values"] is out and out[1] == (37 - fit["mean"]) / fit["standard_deviation"]
+    
+    expect_error(calculate, "Calculation error: Standard deviation must be positive",
+                 operation=Operation.STANDARDIZE, values=[3, 3, 3])
+    expect_error(calculate, "Calculation error: Interquartile range must be positive",
+                 operation=Operation.ROBUST_SCALE, values=[1, 5, 5, 5, 5, 5, 9])
+    expect_error(calculate, "Calculation error: Cannot scale empty list", operation=Operation.MIN_MAX_SCALE, values=[])
+    expect_error(scaling.rescale, "out must be a float64 buffer with one slot per value",
+                 values, 0, 1, array("d", [0.0]))
+
+
 if __name__ == "__main__":
     success = test_all_categories()
     if success:
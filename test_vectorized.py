@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Differential test for the vectorized formula backend.
+Checks that every NumPy kernel agrees with its scalar formula, including domain errors.
+"""
+
+import inspect
+import random
+import sys
+sys.path.append('.')
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from core import OPERATION_MAP, Operation, calculate_many
+from core.formulas import arithmetic, geometry, volumes, trigonometry, logarithms, vectorized
+
+ROWS = 500
+
+# Boundary values that trigger the formulas' domain checks
+SPECIAL_VALUES = [0.0, 1.0, -1.0, 0.5, -0.5, 2.0, 3.0, 90.0, 180.0, 360.0, 1e-12]
+
+# Arguments whose scalar formula only accepts a narrow type or range
+ARGUMENT_SAMPLERS = {
+    "decimals": lambda rng: rng.randint(-1, 6),
+}
+
+# Scalar formulas with arbitrary-precision integer results and no vectorized form
+INTEGER_ONLY = {
+    "power_mod", "isqrt", "integer_nth_root", "factorial", "combination", "permutation", "pascal_row",
+    "combination_mod", "permutation_mod", "greatest_common_divisor", "least_common_multiple",
+    "gcd_many", "lcm_many", "extended_gcd", "batch_gcd", "is_prime", "is_prime_many", "fibonacci",
+    "fibonacci_mod", "fibonacci_sequence",
+}
+
+
+def sample_column(rng, name, size):
+    """Draw a column mixing boundary values and uniformly random values."""
+    sampler = ARGUMENT_SAMPLERS.get(name)
+    if sampler:
+        return [sampler(rng) for _ in range(size)]
+    return [rng.choice(SPECIAL_VALUES) if rng.random() < 0.3 else rng.uniform(-20, 20)
+            for _ in range(size)]
+
+
+def scalar_outcome(func, row):
+    """Run the scalar formula on one row; None marks rows the backends may legitimately disagree on."""
+    try:
+        value = func(*row)
+    except (ValueError, ArithmeticError) as e:
+        # Domain checks, and ZeroDivisionError/OverflowError from the float operations themselves
+        return ("error", str(e))
+    except TypeError:
+        return None
+    return ("ok", value)
+
+
+def test_every_formula_has_kernel():
+    """Every float formula in the vectorized modules has a NumPy counterpart."""
+    for module in (arithmetic, geometry, volumes, trigonometry, logarithms):
+        for name, func in inspect.getmembers(module, inspect.isfunction):
+            if func.__module__ != module.__name__ or name.startswith("_") or name in INTEGER_ONLY:
+                continue
+            assert vectorized.get_kernel(func) is not None, f"{module.__name__}.{name}"
+
+
+def test_kernels_match_scalar_formulas():
+    """Batches agree with the scalar formulas on values and on which rows fail, and why."""
+    rng = random.Random(1234)
+    for operation, config in OPERATION_MAP.items():
+        func = config["func"]
+        kernel = vectorized.get_kernel(func)
+        if kernel is None:
+            continue
+
+        columns = [sample_column(rng, name, ROWS) for name in config["required"]]
+        result, failures = calculate_many(operation=operation, errors="collect",
+                                          **dict(zip(config["required"], columns)))
+        failed = dict(failures)
+
+        compared = 0
+        for index, row in enumerate(zip(*columns)):
+            outcome = scalar_outcome(func, row)
+            if outcome is None:
+                continue
+            status, expected = outcome
+            if status == "error":
+                assert failed.get(index) == expected, (operation, row, failed.get(index), expected)
+            else:
+                assert index not in failed, (operation, row, failed[index])
+                assert np.allclose(result[index], expected, rtol=1e-9, atol=1e-12, equal_nan=True), \
+                    (operation, row, result[index], expected)
+            compared += 1
+        assert compared > ROWS // 2, (operation, compared)
+
+
+def test_non_finite_results_match_scalar_formulas():
+    """Overflow, division by zero and complex results are reported as the scalar formulas report them."""
+    cases = [
+        (Operation.EXPONENTIAL_E, {"x": [1.0, 1000.0]}, [(1, "math range error")]),
+        (Operation.HARMONIC_MEAN, {"a": [1.0, 1.0], "b": [2.0, -1.0]}, [(1, "float division by zero")]),
+    ]
+    for operation, columns, expected in cases:
+        result, failures = calculate_many(operation=operation, errors="collect", **columns)
+        assert failures == expected
+        result, valid = calculate_many(operation=operation, errors="mask", **columns)
+        assert valid == bytearray([1, 0])
+    for operation, columns in ((Operation.POWER, {"num": [2.0, -8.0], "power": [2.0, 0.5]}),
+                               (Operation.EXPONENTIAL_CUSTOM_BASE, {"base": [2.0, -8.0], "exponent": [2.0, 0.5]})):
+        result = calculate_many(operation=operation, **columns)
+        assert isinstance(result[1], complex) and result[0] == 4.0
+
+
+if __name__ == "__main__":
+    test_every_formula_has_kernel()
+    test_kernels_match_scalar_formulas()
+    print("✅ Vectorized backend matches the scalar formulas")